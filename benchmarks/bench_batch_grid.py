@@ -0,0 +1,89 @@
+"""
+Description: Batch Forge grid construction benchmark.
+Builds a template grid the old way (one dict reference per row, inferred by pandas) and with the
+column-wise broadcast builder, reporting build time, peak allocation and the grid's own footprint.
+Usage: uv run python benchmarks/bench_batch_grid.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from constants import MASTER_CONFIG_PATH  # noqa: E402
+from logic.blueprints import load_master_schema  # noqa: E402
+from logic.transformers import SECTIONS, generate_batch_dataframe, grid_categories, resize_batch_dataframe  # noqa: E402
+
+TEMPLATE = {
+    "analytical_type": "continuous",
+    "data_type": "float64",
+    "role": "feature",
+    "constraints": {"nullable": False, "min_value": 0.0, "max_value": 100.0, "regex_pattern": None},
+    "cleaning": {"missing_strategy": "median", "outlier_strategy": "clip", "outlier_threshold": 3.0},
+    "governance": {"data_steward": "finance", "sensitivity": "Internal", "pii_flag": False},
+    "database_mapping": {"table_name": "facts", "is_primary_key": False},
+    "visualization": {"preferred_plot": "histogram"},
+}
+
+
+def legacy(template_data, row_count):
+    flat_template = {"Row #": 0, "name": "", "alias": "", "description": ""}
+    flat_template.update({key: template_data.get(key) for key in ("analytical_type", "data_type", "role")})
+    for section in SECTIONS:
+        for field, val in template_data.get(section, {}).items():
+            flat_template[f"{section}_{field}"] = val
+    df = pd.DataFrame([flat_template] * row_count)
+    df["Row #"] = range(1, row_count + 1)
+    return df
+
+
+def legacy_grow(df, template_data, row_count):
+    new_rows = legacy(template_data, row_count - len(df))
+    new_rows["Row #"] = range(len(df) + 1, row_count + 1)
+    return pd.concat([df, new_rows], ignore_index=True)
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = build()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    categories = grid_categories(load_master_schema(MASTER_CONFIG_PATH))
+    half = args.rows // 2
+
+    rows = [
+        ("build, dict rows", lambda: legacy(TEMPLATE, args.rows)),
+        ("build, broadcast columns", lambda: generate_batch_dataframe(TEMPLATE, args.rows, categories)),
+        ("grow, regenerate + concat", lambda: legacy_grow(legacy(TEMPLATE, half), TEMPLATE, args.rows)),
+        (
+            "grow, resize_batch_dataframe",
+            lambda: resize_batch_dataframe(
+                generate_batch_dataframe(TEMPLATE, half, categories), TEMPLATE, args.rows, categories
+            ),
+        ),
+    ]
+    print(f"{args.rows} rows")
+    for label, build in rows:
+        df, elapsed, peak = measure(build)
+        footprint = df.memory_usage(index=False).sum()
+        print(
+            f"  {label:30} {elapsed * 1000:8.1f} ms   peak {peak / 2**20:7.1f} MiB   grid {footprint / 2**20:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
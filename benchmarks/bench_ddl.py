@@ -0,0 +1,60 @@
+"""
+Description: DDL compiler benchmark.
+Compiles an N-column dictionary spread over many tables into every dialect and times the
+model build and each backend. Usage: uv run python benchmarks/bench_ddl.py --columns 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.ddl import DIALECTS, build_schema, compile_ddl  # noqa: E402
+
+DATA_TYPES = ["int64", "float64", "bool", "datetime64", "string", "category", "object"]
+
+
+def synthetic_variables(columns, tables, seed=0):
+    rng = random.Random(seed)
+    for i in range(columns):
+        table = i % tables
+        dtype = rng.choice(DATA_TYPES)
+        constraints = {"nullable": rng.random() < 0.7, "unique": rng.random() < 0.05}
+        if dtype in ("int64", "float64"):
+            constraints.update(min_value=0, max_value=rng.randint(10, 10_000))
+        elif dtype == "category":
+            constraints["allowed_values"] = [f"level_{k}" for k in range(rng.randint(2, 6))]
+        db_mapping = {"target_table": f"schema_{table % 10}.table_{table}", "is_primary_key": i < tables}
+        if table and i >= tables and rng.random() < 0.01:
+            db_mapping["foreign_key_reference"] = f"schema_{table % 10}.table_{table - 1}(column_{table - 1})"
+        yield {"name": f"column_{i}", "data_type": dtype, "constraints": constraints, "database_mapping": db_mapping}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=50_000)
+    parser.add_argument("--tables", type=int, default=500)
+    args = parser.parse_args()
+
+    variables = list(synthetic_variables(args.columns, args.tables))
+
+    t0 = time.perf_counter()
+    schema = build_schema(variables)
+    print(f"columns={args.columns:,} tables={len(schema.tables):,} model build: {time.perf_counter() - t0:.3f}s")
+
+    for name in sorted(DIALECTS):
+        t0 = time.perf_counter()
+        script = compile_ddl(schema, name)
+        render = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        assert compile_ddl(variables, name) == script
+        end_to_end = time.perf_counter() - t0
+        print(f"{name:>10}: render {render:.3f}s | build+render {end_to_end:.3f}s | {len(script) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Description: Export memory benchmark.
+Measures peak traced memory and time per format for the legacy whole-document serializers and the
+streaming writers. Usage: uv run python benchmarks/bench_exports.py --size 100000 --formats json csv excel
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from components import export_utils  # noqa: E402
+from logic.exporters import flatten_json  # noqa: E402
+
+
+def legacy(fmt, export_obj):
+    """The eager serializers the export dialog used before streaming."""
+    variables = export_obj["variables"]
+    if fmt == "yaml":
+        return yaml.dump(export_obj, sort_keys=False)
+    if fmt == "json":
+        return json.dumps(export_obj, indent=4)
+    df_preview = pd.DataFrame([flatten_json(v) for v in variables])
+    if fmt == "csv":
+        buffer = io.StringIO()
+        df_preview.to_csv(buffer, index=False)
+        return buffer.getvalue()
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        df_preview.to_excel(writer, sheet_name="Variables", index=False)
+        pd.DataFrame([export_obj["project_metadata"]]).to_excel(writer, sheet_name="Project Info", index=False)
+    return buffer.getvalue()
+
+
+def streaming(fmt, export_obj):
+    variables = export_obj["variables"]
+    if fmt == "yaml":
+        return export_utils.generate_yaml(export_obj)
+    if fmt == "json":
+        return export_utils.generate_json(export_obj)
+    if fmt == "csv":
+        return export_utils.generate_csv(variables)
+    return export_utils.generate_excel(variables, export_obj["project_metadata"])
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--formats", nargs="+", default=["yaml", "json", "csv", "excel"])
+    args = parser.parse_args()
+
+    variables = [
+        {
+            "name": f"variable_{i}",
+            "alias": f"Variable {i}",
+            "description": "Synthetic benchmark variable",
+            "data_type": "float64",
+            "constraints": {"min_value": 0, "max_value": i, "allowed_values": ["a", "b", "c"]},
+            "governance": {"data_steward": "Data Office", "compliance_scope": ["GDPR"]},
+        }
+        for i in range(args.size)
+    ]
+    export_obj = {"project_metadata": {"project_name": "bench"}, "generated_at": "now", "variables": variables}
+
+    print(f"variables={args.size:,} (peak = traced allocations beyond the dictionary itself)")
+    for fmt in args.formats:
+        old_t, old_peak, size = measure(legacy, fmt, export_obj)
+        new_t, new_peak, _ = measure(streaming, fmt, export_obj)
+        print(
+            f"{fmt:>5}: output {size / 1e6:6.1f} MB | legacy {old_peak / 1e6:7.1f} MB {old_t:6.2f}s"
+            f" | streaming {new_peak / 1e6:7.1f} MB {new_t:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
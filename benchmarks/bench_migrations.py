@@ -0,0 +1,64 @@
+"""
+Description: Schema diff benchmark for the migration generator.
+Diffs two N-variable dictionary snapshots (1% edited, 0.5% dropped, 0.5% added) and renders the
+migration. Usage: uv run python benchmarks/bench_migrations.py --size 100000
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.migrations import diff_dictionaries, generate_migration  # noqa: E402
+from logic.store import new_variable_id  # noqa: E402
+
+DATA_TYPES = ["int64", "float64", "bool", "datetime64", "string", "category"]
+
+
+def synthetic_variables(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "variable_id": new_variable_id(),
+            "name": f"column_{i}",
+            "data_type": rng.choice(DATA_TYPES),
+            "constraints": {"nullable": rng.random() < 0.7, "unique": rng.random() < 0.05},
+            "database_mapping": {"target_table": f"schema_{i % 10}.table_{i % 500}"},
+        }
+        for i in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    old = synthetic_variables(args.size)
+    new = copy.deepcopy(old)
+    for var in rng.sample(new, args.size // 100):
+        var["data_type"] = rng.choice(DATA_TYPES)
+        var["constraints"]["nullable"] = not var["constraints"]["nullable"]
+    for index in sorted(rng.sample(range(len(new)), args.size // 200), reverse=True):
+        del new[index]
+    new.extend(synthetic_variables(args.size // 200, seed=2))
+
+    t0 = time.perf_counter()
+    changes = diff_dictionaries(old, new)
+    diff_elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    script = generate_migration(old, new, "postgresql")
+    script_elapsed = time.perf_counter() - t0
+
+    print(f"variables={args.size:,} changes={len(changes):,}")
+    print(f"diff: {diff_elapsed:.3f}s | diff+render: {script_elapsed:.3f}s | {script.count(chr(10)):,} lines")
+
+
+if __name__ == "__main__":
+    main()
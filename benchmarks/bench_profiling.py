@@ -0,0 +1,83 @@
+"""
+Description: Wall-clock benchmark for column profiling on wide tables.
+Builds a synthetic sample with mixed numeric/categorical/text columns and profiles it with the
+former per-column string pass (pandas str.len and str.contains per column and pattern) and with
+the batched pass of profile_dataframe. Usage: uv run python benchmarks/bench_profiling.py --columns 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from constants import REGEX_LIBRARY  # noqa: E402
+from logic.profiling import DEFAULT_SAMPLE_SIZE, PROBE_SIZE, _profile_column, profile_dataframe  # noqa: E402
+
+
+def build_frame(rows, columns):
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(columns):
+        if i % 4 == 0:
+            data[f"measure_{i}"] = rng.normal(size=rows)
+        elif i % 4 == 1:
+            data[f"count_{i}"] = rng.integers(0, 500, rows)
+        elif i % 4 == 2:
+            data[f"segment_{i}"] = rng.choice(["north", "south", "east", "west"], rows)
+        else:
+            data[f"code_{i}"] = np.char.add("C", rng.integers(0, 10**6, rows).astype(str))
+    return pd.DataFrame(data)
+
+
+def legacy_profile(df):
+    positions = df.index.to_numpy()
+    profiles = {}
+    for col in df.columns:
+        profile, probe = _profile_column(df[col], positions)
+        if probe is not None:
+            labels, counts = pd.Series(probe[0]), probe[1]
+            lengths = labels.str.len().to_numpy()
+            profile["min_length"], profile["max_length"] = int(lengths.min()), int(lengths.max())
+            labels, counts = labels.iloc[:PROBE_SIZE], counts[:PROBE_SIZE]
+            profile["regex_matches"] = {}
+            for family, pattern in REGEX_LIBRARY.items():
+                if not pattern:
+                    continue
+                matched = labels.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+                rate = float(counts[matched].sum() / counts.sum())
+                if rate > 0:
+                    profile["regex_matches"][family] = rate
+        profiles[str(col)] = profile
+    return profiles
+
+
+def timed(fn, df):
+    start = time.perf_counter()
+    result = fn(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_SAMPLE_SIZE)
+    parser.add_argument("--columns", type=int, default=2_000)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows, args.columns)
+    print(f"rows={args.rows:,} columns={args.columns:,}")
+
+    profiles, batched_s = timed(profile_dataframe, df)
+    expected, legacy_s = timed(legacy_profile, df)
+    assert profiles == expected
+    for label, elapsed in (("per-column pass", legacy_s), ("batched pass", batched_s)):
+        print(f"  {label:<16} {elapsed:6.2f}s ({len(profiles) / elapsed:,.0f} columns/s)")
+    print(f"  speedup: {legacy_s / batched_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Description: Ingestion dedupe benchmark for the variable registry.
+Queues N extracted names against an N-variable dictionary using the legacy list scans
+and the hash-indexed PendingQueue/VariableRegistry. Usage: uv run python benchmarks/bench_registry.py --size 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.registry import PendingQueue, VariableRegistry  # noqa: E402
+
+
+def legacy_queue(extracted_names, variables):
+    """The list-based dedupe the ingestion panel used before the registry."""
+    pending = []
+    existing_defined = [v["name"] for v in variables]
+    for name in extracted_names:
+        clean_name = str(name).strip()
+        if clean_name and clean_name not in pending and clean_name not in existing_defined:
+            pending.append(clean_name)
+    return pending
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    variables = [{"name": f"defined_{i}"} for i in range(args.size)]
+    # Half the extracted names are already defined, half are new
+    extracted = [f"defined_{i}" for i in range(0, args.size, 2)] + [f"new_{i}" for i in range(args.size // 2)]
+
+    t0 = time.perf_counter()
+    legacy = legacy_queue(extracted, variables)
+    legacy_elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    registry = VariableRegistry(variables)
+    queue = PendingQueue()
+    queue.add_unique(extracted, exclude=registry)
+    indexed_elapsed = time.perf_counter() - t0
+
+    assert list(queue) == legacy
+    print(f"names={len(extracted):,} dictionary={args.size:,}")
+    print(f"legacy list scans: {legacy_elapsed:.2f}s")
+    print(f"registry (incl. build): {indexed_elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Description: Full-text search benchmark for the shared SearchIndex.
+Builds an index over N synthetic variables and times representative lookups against the legacy
+substring scan. Usage: uv run python benchmarks/bench_search.py --size 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.search import SearchIndex, variable_document  # noqa: E402
+
+WORDS = ["customer", "income", "signup", "date", "region", "score", "amount", "flag", "code", "status"]
+STEWARDS = ["Finance Team", "Data Office", "Marketing Ops", "Risk Desk"]
+SCOPES = ["GDPR", "CCPA", "HIPAA", "SOX", "PCI"]
+
+
+def synthetic_variables(size, seed=0):
+    rng = random.Random(seed)
+    for i in range(size):
+        words = rng.sample(WORDS, 3)
+        yield {
+            "name": f"{words[0]}_{words[1]}_{i}",
+            "alias": f"{words[0].title()} {words[1].title()} {i}",
+            "description": f"The {words[2]} of the {words[0]} record {i}",
+            "governance": {"data_steward": rng.choice(STEWARDS), "compliance_scope": rng.sample(SCOPES, 2)},
+        }
+
+
+def legacy_scan(variables, query):
+    query = query.lower()
+    return [
+        v["name"]
+        for v in variables
+        if query in f"{v.get('name', '')} {v.get('description', '')} {v.get('alias', '')}".lower()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    variables = list(synthetic_variables(args.size))
+
+    t0 = time.perf_counter()
+    index = SearchIndex()
+    for i, var in enumerate(variables):
+        index.update(i, variable_document(var))
+    build_elapsed = time.perf_counter() - t0
+    print(f"variables={args.size:,} build={build_elapsed:.2f}s")
+
+    # Selective lookups (a specific variable) and broad ones (a shared word, top-50)
+    for query, limit in ((f"{args.size - 7}", None), ("income_region_4242", None), ("hipaa", 50), ("inc", 50)):
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            hits = index.search(query, limit)
+        indexed_ms = (time.perf_counter() - t0) / args.repeat * 1000
+
+        t0 = time.perf_counter()
+        legacy = legacy_scan(variables, query)
+        legacy_ms = (time.perf_counter() - t0) * 1000
+        print(
+            f"{query!r:>22} limit={limit}: index {indexed_ms:8.3f}ms ({len(hits)} hits) | scan {legacy_ms:8.1f}ms ({len(legacy)} hits)"
+        )
+
+    # Incremental update of a single document
+    t0 = time.perf_counter()
+    for i in range(args.repeat):
+        index.update(i, variable_document(dict(variables[i], description="edited")))
+    print(f"single update: {(time.perf_counter() - t0) / args.repeat * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Description: Serialization backend benchmark.
+Times loading and dumping a large template library (YAML) and dictionary (YAML + JSON) with the
+pure-Python implementations against the backends selected by logic.serialization.
+Usage: uv run python benchmarks/bench_serialization.py --templates 2000 --variables 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic import serialization  # noqa: E402
+
+
+def make_variable(i):
+    return {
+        "name": f"variable_{i}",
+        "description": f"Synthetic variable number {i} used to exercise the serializers",
+        "data_type": ("int64", "float64", "string", "boolean")[i % 4],
+        "analytical_type": "continuous",
+        "constraints": {"required": bool(i % 2), "min_value": 0, "max_value": i, "allowed_values": ["a", "b"]},
+        "governance": {"data_steward": f"steward_{i % 50}", "compliance_scope": ["GDPR", "IDD"]},
+        "database_mapping": {"table_name": f"table_{i % 20}", "column_name": f"col_{i}"},
+    }
+
+
+def timed(label, legacy, fast):
+    start = time.perf_counter()
+    expected = legacy()
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = fast()
+    fast_time = time.perf_counter() - start
+    print(
+        f"  {label:<28} legacy {legacy_time * 1000:9.1f} ms   fast {fast_time * 1000:9.1f} ms   x{legacy_time / fast_time:5.1f}"
+    )
+    return expected, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=2_000)
+    parser.add_argument("--variables", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"backends: {serialization.backends()}")
+    library = {"templates": {f"template_{i}": make_variable(i) for i in range(args.templates)}}
+    dictionary = {
+        "project_metadata": {"project_name": "Bench"},
+        "variables": [make_variable(i) for i in range(args.variables)],
+    }
+
+    print(f"template library ({args.templates} templates)")
+    text, _ = timed("dump yaml", lambda: yaml.dump(library, sort_keys=False), lambda: serialization.dump_yaml(library))
+    loaded, fast_loaded = timed("load yaml", lambda: yaml.safe_load(text), lambda: serialization.load_yaml(text))
+    assert loaded == fast_loaded == library
+
+    print(f"dictionary ({args.variables} variables)")
+    timed("dump yaml", lambda: yaml.dump(dictionary, sort_keys=False), lambda: serialization.dump_yaml(dictionary))
+    text = json.dumps(dictionary, indent=4)
+    loaded, fast_loaded = timed("load json", lambda: json.loads(text), lambda: serialization.loads_json(text))
+    assert loaded == fast_loaded == dictionary
+    timed("dump json (compact)", lambda: json.dumps(dictionary), lambda: serialization.dumps_json(dictionary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Description: Template library benchmark.
+Times listing and searching a large template library through the manifest index (cold build, warm
+refresh, reopen from the persisted manifest) against parsing every YAML file.
+Usage: uv run python benchmarks/bench_templates.py --size 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.serialization import dump_yaml, load_yaml  # noqa: E402
+from logic.template_manifest import TemplateManifest  # noqa: E402
+
+
+def make_template(i):
+    return {
+        "name": f"template_{i}",
+        "alias": f"Template {i}",
+        "description": f"Organization-wide blueprint number {i} for {('revenue', 'claims', 'churn')[i % 3]} data",
+        "analytical_type": ("continuous", "categorical", "discrete")[i % 3],
+        "data_type": ("float64", "string", "int64", "boolean")[i % 4],
+        "role": "feature",
+        "constraints": {"required": bool(i % 2), "allowed_values": ["a", "b", "c"]},
+        "governance": {"data_steward": f"steward_{i % 40}", "compliance_scope": ["GDPR"]},
+    }
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(args.size):
+            with open(os.path.join(directory, f"template_{i}.yaml"), "w") as f:
+                dump_yaml(make_template(i), f)
+
+        print(f"{args.size} templates")
+
+        def parse_all():
+            payloads = {}
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".yaml"):
+                    with open(os.path.join(directory, name)) as f:
+                        payloads[name] = load_yaml(f)
+            return [n for n, p in payloads.items() if "claims" in p["description"] and p["data_type"] == "string"]
+
+        legacy = timed("legacy: parse every file + filter", parse_all)
+        manifest = TemplateManifest(directory)
+        timed("manifest: cold build", manifest.refresh)
+        timed("manifest: warm refresh (stat only)", manifest.refresh)
+        reopened = TemplateManifest(directory)
+        timed("manifest: reopen from persisted index", reopened.refresh)
+        found = timed("manifest: search + filter", lambda: reopened.search("claims", data_type="string"))
+        assert sorted(found) == sorted(n[: -len(".yaml")] for n in legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Description: Throughput benchmark for the dataset validation engine.
+Generates a synthetic dataset, streams it through logic.validation in chunks and
+reports rows/second. Usage: uv run python benchmarks/bench_validation.py --rows 10000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from logic.validation import DEFAULT_CHUNK_SIZE, validate_file  # noqa: E402
+
+VARIABLES = [
+    {
+        "name": "customer_id",
+        "analytical_type": "discrete",
+        "data_type": "int64",
+        "constraints": {"unique": True, "nullable": False, "min_value": 1},
+    },
+    {
+        "name": "amount",
+        "analytical_type": "continuous",
+        "data_type": "float64",
+        "constraints": {"min_value": 0, "max_value": 10_000},
+    },
+    {
+        "name": "status",
+        "analytical_type": "nominal",
+        "data_type": "category",
+        "constraints": {"allowed_values": ["active", "churned", "paused"]},
+    },
+    {
+        "name": "event_at",
+        "analytical_type": "time_index",
+        "data_type": "datetime64",
+        "constraints": {"monotonicity": "strictly_increasing", "frequency": "s"},
+    },
+]
+
+
+def iter_slices(rows, step=1_000_000):
+    """Yields the synthetic dataset in slices so generation itself stays memory-bounded."""
+    rng = np.random.default_rng(42)
+    start = pd.Timestamp("2024-01-01")
+
+    for offset in range(0, rows, step):
+        n = min(step, rows - offset)
+        yield pd.DataFrame(
+            {
+                "customer_id": np.arange(offset + 1, offset + n + 1),
+                "amount": rng.uniform(-10, 12_000, n).round(2),
+                "status": rng.choice(["active", "churned", "paused", "lost"], n),
+                "event_at": pd.date_range(start + pd.Timedelta(seconds=offset), periods=n, freq="s"),
+            }
+        )
+
+
+def build_dataset(path, rows, fmt):
+    if fmt == "csv":
+        for i, frame in enumerate(iter_slices(rows)):
+            frame.to_csv(path, mode="a", header=i == 0, index=False)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    for frame in iter_slices(rows):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table)
+    if writer is not None:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"bench.{args.format}")
+        build_dataset(path, args.rows, args.format)
+        size_mb = os.path.getsize(path) / 1e6
+
+        t0 = time.perf_counter()
+        report = validate_file(path, VARIABLES, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - t0
+
+    print(f"rows={report['rows']:,} file={size_mb:,.1f} MB chunk={args.chunk_size:,} format={args.format}")
+    print(f"elapsed={elapsed:.2f}s throughput={report['rows'] / elapsed:,.0f} rows/s")
+    for name, col in report["columns"].items():
+        print(f"  {name}: {col['violations']}")
+
+    try:
+        import resource
+
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"peak RSS={peak_mb:,.0f} MB")
+    except ImportError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
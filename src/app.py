@@ -2,13 +2,13 @@
 Description: Main entry point for Dictionary Forge.
 """
 
-import pandas as pd
 import streamlit as st
 
 from components.edition_modal import render_edition_modal
 from components.export_modal import render_export_modal
 from components.governance_manager import render_governance_manager
 from components.project_form import render_project_form
+from components.project_store import autosave_project_info, restore_project
 
 # Modular UI Sections
 from components.sidebar import render_sidebar
@@ -16,7 +16,9 @@ from components.variable_form import render_variable_form
 
 # Import constants and unified logic package
 from constants import MASTER_CONFIG_PATH
-from logic import flatten_json, load_master_schema
+from logic import load_master_schema
+from logic.ledger import LedgerCache
+from logic.quality import QualityEngine
 
 # ==============================================================================
 # 1. INITIALIZATION & LAYOUT STATE
@@ -26,6 +28,9 @@ st.set_page_config(page_title="Dictionary Forge", page_icon="🏗️", layout="w
 if "split_ratio" not in st.session_state:
     st.session_state["split_ratio"] = 45
 
+# Resume the persisted project (dictionary + project metadata) when a session starts
+restore_project()
+
 if "project_info" not in st.session_state:
     st.session_state["project_info"] = {
         "project_name": "New Project",
@@ -33,12 +38,14 @@ if "project_info" not in st.session_state:
         "description": "",
         "stakeholders": [],
     }
-if "variables" not in st.session_state:
-    st.session_state["variables"] = []
 if "active_v_inputs" not in st.session_state:
     st.session_state["active_v_inputs"] = {}
 if "form_id" not in st.session_state:
     st.session_state["form_id"] = 0
+if "ledger_cache" not in st.session_state:
+    st.session_state["ledger_cache"] = LedgerCache()
+if "quality_engine" not in st.session_state:
+    st.session_state["quality_engine"] = QualityEngine()
 
 # ==============================================================================
 # 2. THE VIEWPORT ENGINE (STRICT CSS)
@@ -127,6 +134,7 @@ st.markdown(
 top_vh = st.session_state["split_ratio"]
 with st.container(height=int(top_vh * 8.5), border=True):
     render_project_form()
+    autosave_project_info()
     st.divider()
     render_variable_form(variable_fields)
 
@@ -171,15 +179,10 @@ with st.container(height=int(bottom_vh * 10), border=True):
         if st.button("🚀 Export", key="btn_x", type="primary", use_container_width=True):
             render_export_modal()
 
-    # Framed Table
+    # Framed Table (cached per variable version; only changed variables are re-flattened)
     if st.session_state["variables"]:
-        filtered = [
-            v
-            for v in st.session_state["variables"]
-            if q in f"{v.get('name', '')} {v.get('description', '')} {v.get('alias', '')}".lower()
-        ]
-        if filtered:
-            df_preview = pd.DataFrame([flatten_json(v) for v in filtered])
+        df_preview = st.session_state["ledger_cache"].filter(st.session_state["variables"], q)
+        if not df_preview.empty:
             with st.container(border=True):
                 st.dataframe(
                     df_preview,
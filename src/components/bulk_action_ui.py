@@ -1,13 +1,19 @@
 """
 Description: Mass governance and batch edition UI for Dictionary Forge.
+The 3-phase Batch Editor is shared by the standalone dialog and the Dictionary Editor's batch tab;
+patching, the coherence cascade and the commit run in logic.batch.
 """
 
-import copy
+import sqlite3
 
 import pandas as pd
 import streamlit as st
 
-from logic import is_field_visible
+from components.project_store import autosave
+from logic.batch import BatchPatchEngine, empty_patch, patch_size
+
+# Pruning details listed in the review phase (the count always covers the whole batch)
+MAX_PRUNING_DETAILS = 500
 
 
 @st.dialog("⚙️ Batch Editor", width="large")
@@ -18,233 +24,223 @@ def render_bulk_action_ui():
         st.warning("No variables in the dictionary to edit.")
         return
 
+    render_batch_editor()
+
+
+def render_batch_editor():
+    """Renders the three phases: selection matrix, opt-in patch and review & commit."""
     # Initialize batch editor state
     if "batch_patch" not in st.session_state:
-        st.session_state["batch_patch"] = {"root": {}, "nested": {}}
-    if "batch_selected_indices" not in st.session_state:
-        st.session_state["batch_selected_indices"] = []
+        st.session_state["batch_patch"] = empty_patch()
+    if "batch_selected_ids" not in st.session_state:
+        st.session_state["batch_selected_ids"] = []
+    if "batch_engine" not in st.session_state:
+        st.session_state["batch_engine"] = BatchPatchEngine()
 
     tab1, tab2, tab3 = st.tabs(["1️⃣ Select Variables", "2️⃣ Define Patch", "3️⃣ Review & Apply"])
-
-    # --- PHASE 1: SELECTION MATRIX ---
     with tab1:
-        st.markdown("### Filter & Select Variables")
-
-        # Build DataFrame for Selection
-        vars_data = []
-        for i, v in enumerate(st.session_state["variables"]):
-            vars_data.append(
-                {
-                    "var_idx": i,
-                    "Select": i in st.session_state["batch_selected_indices"],
-                    "Name": v.get("name", ""),
-                    "Analytical Type": v.get("analytical_type", ""),
-                    "Data Type": v.get("data_type", ""),
-                    "Sensitivity": v.get("governance", {}).get("sensitivity", ""),
-                }
+        _render_selection()
+    with tab2:
+        _render_patch()
+    with tab3:
+        _render_review()
+
+
+# --- PHASE 1: SELECTION MATRIX ---
+def _render_selection():
+    st.markdown("### Filter & Select Variables")
+
+    # Build the selection frame column-wise; rows are keyed by stable variable_id
+    variables = st.session_state["variables"]
+    selected = set(st.session_state["batch_selected_ids"])
+    ids = [v["variable_id"] for v in variables]
+    df = pd.DataFrame(
+        {
+            "variable_id": ids,
+            "Select": [variable_id in selected for variable_id in ids],
+            "Name": [v.get("name", "") for v in variables],
+            "Analytical Type": [v.get("analytical_type", "") for v in variables],
+            "Data Type": [v.get("data_type", "") for v in variables],
+            "Sensitivity": [(v.get("governance") or {}).get("sensitivity", "") for v in variables],
+        }
+    )
+
+    # Filter controls
+    col_f1, col_f2 = st.columns(2)
+    with col_f1:
+        search_n = st.text_input("Search by Name", key="batch_search_n").lower()
+    with col_f2:
+        at_opts = ["All"] + sorted(df["Analytical Type"].unique())
+        search_at = st.selectbox("Filter by Analytical Type", options=at_opts, key="batch_search_at")
+
+    # Apply filters
+    if search_n:
+        df = df[df["Name"].str.lower().str.contains(search_n, regex=False)]
+    if search_at != "All":
+        df = df[df["Analytical Type"] == search_at]
+
+    st.caption(f"Showing {len(df)} matching variables.")
+
+    # Data Editor for Selection
+    edited_df = st.data_editor(
+        df,
+        column_config={
+            "variable_id": None,  # Hide internal identity safely
+            "Select": st.column_config.CheckboxColumn("Select", default=False),
+        },
+        disabled=["Name", "Analytical Type", "Data Type", "Sensitivity"],
+        hide_index=True,
+        use_container_width=True,
+        key="batch_data_editor",
+    )
+
+    # Update selection state
+    st.session_state["batch_selected_ids"] = edited_df.loc[edited_df["Select"], "variable_id"].tolist()
+
+
+# --- PHASE 2: OPT-IN PATCH UI ---
+def _render_patch():
+    st.markdown("### Define Metadata Updates")
+    st.caption("Only fields explicitly toggled ON will be applied to the selected variables.")
+
+    patch_root = {}
+    patch_nested = {"governance": {}, "cleaning": {}}
+
+    # Root Fields
+    with st.expander("Technical Baseline", expanded=True):
+        c1, c2 = st.columns([1, 3])
+        update_at = c1.toggle("Update Analytical Type", key="tgl_at")
+        if update_at:
+            patch_root["analytical_type"] = c2.selectbox(
+                "New Analytical Type",
+                options=[
+                    "continuous",
+                    "discrete",
+                    "nominal",
+                    "ordinal",
+                    "binary",
+                    "text",
+                    "time_index",
+                    "spatial",
+                ],
+                label_visibility="collapsed",
             )
 
-        df = pd.DataFrame(vars_data)
-
-        # Filter controls
-        col_f1, col_f2 = st.columns(2)
-        with col_f1:
-            search_n = st.text_input("Search by Name", key="batch_search_n").lower()
-        with col_f2:
-            at_opts = ["All"] + sorted(list(df["Analytical Type"].unique()))
-            search_at = st.selectbox("Filter by Analytical Type", options=at_opts)
-
-        # Apply filters
-        if search_n:
-            df = df[df["Name"].str.lower().str.contains(search_n)]
-        if search_at != "All":
-            df = df[df["Analytical Type"] == search_at]
-
-        st.caption(f"Showing {len(df)} matching variables.")
-
-        # Data Editor for Selection
-        edited_df = st.data_editor(
-            df,
-            column_config={
-                "var_idx": None,  # Hide internal index safely
-                "Select": st.column_config.CheckboxColumn("Select", default=False),
-            },
-            disabled=["Name", "Analytical Type", "Data Type", "Sensitivity"],
-            hide_index=True,
-            use_container_width=True,
-            key="batch_data_editor",
-        )
+        c3, c4 = st.columns([1, 3])
+        update_dt = c3.toggle("Update Data Type", key="tgl_dt")
+        if update_dt:
+            patch_root["data_type"] = c4.selectbox(
+                "New Data Type",
+                options=[
+                    "float64",
+                    "int64",
+                    "string",
+                    "bool",
+                    "category",
+                    "datetime64",
+                    "object",
+                ],
+                label_visibility="collapsed",
+            )
 
-        # Update selection state
-        selected_indices = edited_df[edited_df["Select"]]["var_idx"].tolist()
-        st.session_state["batch_selected_indices"] = selected_indices
+    # Governance Fields
+    with st.expander("Governance & Privacy", expanded=False):
+        c1, c2 = st.columns([1, 3])
+        update_sens = c1.toggle("Update Sensitivity", key="tgl_sens")
+        if update_sens:
+            patch_nested["governance"]["sensitivity"] = c2.selectbox(
+                "New Sensitivity",
+                options=[
+                    "Public",
+                    "Internal",
+                    "Confidential",
+                    "Highly Confidential",
+                    "PII",
+                    "Restricted",
+                ],
+                label_visibility="collapsed",
+            )
 
-    # --- PHASE 2: OPT-IN PATCH UI ---
-    with tab2:
-        st.markdown("### Define Metadata Updates")
-        st.caption("Only fields explicitly toggled ON will be applied to the selected variables.")
-
-        patch_root = {}
-        patch_nested = {"governance": {}, "cleaning": {}}
-
-        # Root Fields
-        with st.expander("Technical Baseline", expanded=True):
-            c1, c2 = st.columns([1, 3])
-            update_at = c1.toggle("Update Analytical Type", key="tgl_at")
-            if update_at:
-                patch_root["analytical_type"] = c2.selectbox(
-                    "New Analytical Type",
-                    options=[
-                        "continuous",
-                        "discrete",
-                        "nominal",
-                        "ordinal",
-                        "binary",
-                        "text",
-                        "time_index",
-                        "spatial",
-                    ],
-                    label_visibility="collapsed",
-                )
-
-            c3, c4 = st.columns([1, 3])
-            update_dt = c3.toggle("Update Data Type", key="tgl_dt")
-            if update_dt:
-                patch_root["data_type"] = c4.selectbox(
-                    "New Data Type",
-                    options=[
-                        "float64",
-                        "int64",
-                        "string",
-                        "bool",
-                        "category",
-                        "datetime64",
-                        "object",
-                    ],
-                    label_visibility="collapsed",
-                )
-
-        # Governance Fields
-        with st.expander("Governance & Privacy", expanded=False):
-            c1, c2 = st.columns([1, 3])
-            update_sens = c1.toggle("Update Sensitivity", key="tgl_sens")
-            if update_sens:
-                patch_nested["governance"]["sensitivity"] = c2.selectbox(
-                    "New Sensitivity",
-                    options=[
-                        "Public",
-                        "Internal",
-                        "Confidential",
-                        "Highly Confidential",
-                        "PII",
-                        "Restricted",
-                    ],
-                    label_visibility="collapsed",
-                )
-
-            c3, c4 = st.columns([1, 3])
-            update_pii = c3.toggle("Update PII Flag", key="tgl_pii")
-            if update_pii:
-                patch_nested["governance"]["pii_flag"] = c4.toggle("Contains PII", value=True)
-
-        # Cleaning Fields
-        with st.expander("Cleaning Strategies", expanded=False):
-            c1, c2 = st.columns([1, 3])
-            update_miss = c1.toggle("Update Missing Strategy", key="tgl_miss")
-            if update_miss:
-                patch_nested["cleaning"]["missing_strategy"] = c2.selectbox(
-                    "New Missing Strategy",
-                    options=["keep", "drop", "mean", "median", "mode"],
-                    label_visibility="collapsed",
-                )
-
-        st.session_state["batch_patch"] = {"root": patch_root, "nested": patch_nested}
-
-    # --- PHASE 3: COHERENCE CASCADE & COMMIT ---
-    with tab3:
-        st.markdown("### Preview & Commit Changes")
+        c3, c4 = st.columns([1, 3])
+        update_pii = c3.toggle("Update PII Flag", key="tgl_pii")
+        if update_pii:
+            patch_nested["governance"]["pii_flag"] = c4.toggle("Contains PII", value=True)
+
+    # Cleaning Fields
+    with st.expander("Cleaning Strategies", expanded=False):
+        c1, c2 = st.columns([1, 3])
+        update_miss = c1.toggle("Update Missing Strategy", key="tgl_miss")
+        if update_miss:
+            patch_nested["cleaning"]["missing_strategy"] = c2.selectbox(
+                "New Missing Strategy",
+                options=["keep", "drop", "mean", "median", "mode"],
+                label_visibility="collapsed",
+            )
 
-        selected_count = len(st.session_state["batch_selected_indices"])
-        patch = st.session_state["batch_patch"]
+    st.session_state["batch_patch"] = {"root": patch_root, "nested": patch_nested}
 
-        if selected_count == 0:
-            st.warning("No variables selected. Go to Phase 1.")
-            return
 
-        active_updates = len(patch["root"]) + sum(len(v) for v in patch["nested"].values())
-        if active_updates == 0:
-            st.warning("No updates defined. Go to Phase 2 and toggle fields to update.")
-            return
+# --- PHASE 3: COHERENCE CASCADE & COMMIT ---
+def _render_review():
+    st.markdown("### Preview & Commit Changes")
 
-        st.info(
-            f"Targeting **{selected_count}** variables with **{active_updates}** explicitly defined metadata changes."
-        )
+    selected_ids = st.session_state["batch_selected_ids"]
+    patch = st.session_state["batch_patch"]
+
+    if not selected_ids:
+        st.warning("No variables selected. Go to Phase 1.")
+        return
+
+    active_updates = patch_size(patch)
+    if active_updates == 0:
+        st.warning("No updates defined. Go to Phase 2 and toggle fields to update.")
+        return
+
+    st.info(
+        f"Targeting **{len(selected_ids)}** variables with **{active_updates}** explicitly defined metadata changes."
+    )
 
-        # Generate Diff / Coherence Engine execution
-        st.markdown("#### Coherence Pruning Summary")
-
-        updated_variables = []
-        total_pruned_keys = 0
-
-        for idx in st.session_state["batch_selected_indices"]:
-            var = copy.deepcopy(st.session_state["variables"][idx])
-
-            # Apply Root Patch
-            for k, v in patch["root"].items():
-                var[k] = v
-
-            # Apply Nested Patch
-            for section, fields in patch["nested"].items():
-                if fields:
-                    if section not in var:
-                        var[section] = {}
-                    for k, v in fields.items():
-                        var[section][k] = v
-
-            # COHERENCE CASCADE: Prune invalid metadata keys based on new AT/DT
-            new_at = var.get("analytical_type", "continuous")
-            new_dt = var.get("data_type", "float64")
-
-            pruned_for_this_var = []
-            for section in [
-                "constraints",
-                "cleaning",
-                "governance",
-                "database_mapping",
-            ]:
-                if section in var:
-                    keys_to_remove = []
-                    for k in var[section].keys():
-                        if not is_field_visible(k, new_at, new_dt):
-                            keys_to_remove.append(k)
-                    for k in keys_to_remove:
-                        del var[section][k]
-                        pruned_for_this_var.append(k)
-
-            total_pruned_keys += len(pruned_for_this_var)
-            updated_variables.append((idx, var, pruned_for_this_var))
-
-        # Display Diff
-        if total_pruned_keys > 0:
-            st.warning(
-                f"⚠️ **Coherence Action:** {total_pruned_keys} incompatible metadata keys will be automatically pruned across the selected variables to maintain dictionary integrity."
+    # Copy-on-write preview, cached until the dictionary, selection or patch changes
+    st.markdown("#### Coherence Pruning Summary")
+    engine = st.session_state["batch_engine"]
+    preview = engine.preview(st.session_state["variables"], selected_ids, patch)
+
+    # Display Diff
+    total_pruned_keys = preview.total_pruned
+    if total_pruned_keys > 0:
+        st.warning(
+            f"⚠️ **Coherence Action:** {total_pruned_keys} incompatible metadata keys will be automatically pruned across the selected variables to maintain dictionary integrity."
+        )
+        with st.expander("View Pruning Details"):
+            details = preview.pruning_details()
+            st.dataframe(
+                pd.DataFrame(
+                    [(name, ", ".join(keys)) for name, keys in details[:MAX_PRUNING_DETAILS]],
+                    columns=["Variable", "Pruned Keys"],
+                ),
+                hide_index=True,
+                use_container_width=True,
             )
-            with st.expander("View Pruning Details"):
-                for idx, var, pruned in updated_variables:
-                    if pruned:
-                        st.write(f"- **{var.get('name')}**: Pruned `{', '.join(pruned)}`")
-        else:
-            st.success("✅ No coherence conflicts detected. All patches are safe to apply.")
-
-        # Commit Button
-        if st.button("🚀 Confirm & Apply Batch Update", type="primary", use_container_width=True):
-            # Commit to ledger
-            for idx, new_var, _ in updated_variables:
-                st.session_state["variables"][idx] = new_var
-
-            # Clear state
-            st.session_state["batch_selected_indices"] = []
-            st.session_state["batch_patch"] = {"root": {}, "nested": {}}
-
-            st.success("Batch update applied successfully!")
-            st.rerun()
+            if len(details) > MAX_PRUNING_DETAILS:
+                st.caption(f"…and {len(details) - MAX_PRUNING_DETAILS} more variables.")
+    else:
+        st.success("✅ No coherence conflicts detected. All patches are safe to apply.")
+
+    # Commit Button
+    if st.button("🚀 Confirm & Apply Batch Update", type="primary", use_container_width=True):
+        try:
+            engine.commit(st.session_state["variables"], preview, save=autosave)
+        except ValueError as e:
+            st.error(str(e))
+            return
+        except (sqlite3.Error, OSError) as e:
+            # The engine only swaps records in once the save succeeded: the dictionary and this preview are intact
+            st.error(f"The batch could not be saved to the project store ({e}). Nothing was changed; try again.")
+            return
+
+        # Clear state
+        st.session_state["batch_selected_ids"] = []
+        st.session_state["batch_patch"] = empty_patch()
+
+        st.success("Batch update applied successfully!")
+        st.rerun()
@@ -6,6 +6,8 @@ import copy
 
 import streamlit as st
 
+from components.project_store import autosave
+
 
 @st.dialog("📑 Variable Cloning", width="large")
 def render_cloning_modal():
@@ -26,7 +28,9 @@ def render_cloning_modal():
                 label_visibility="collapsed",
                 key="cl_search",
             )
-            filtered = [v for v in st.session_state["variables"] if search_query.lower() in v["name"].lower()]
+            registry = st.session_state["variables"]
+            matches = st.session_state["ledger_cache"].search(registry, search_query)
+            filtered = [registry[registry.index_of_id(variable_id)] for variable_id in matches]
 
             if filtered:
                 selected_source_name = st.radio(
@@ -35,7 +39,7 @@ def render_cloning_modal():
                     label_visibility="collapsed",
                     key="cl_radio",
                 )
-                source_var = next(v for v in st.session_state["variables"] if v["name"] == selected_source_name)
+                source_var = st.session_state["variables"].get(selected_source_name)
             else:
                 st.caption("No matches.")
                 source_var = None
@@ -114,10 +118,9 @@ def render_cloning_modal():
 
                 if st.button("🚀 Create & Commit", type="primary", use_container_width=True):
                     # Validation
-                    existing_names = [v["name"] for v in st.session_state["variables"]]
                     if not new_name.strip():
                         st.error("Name is required.")
-                    elif new_name in existing_names:
+                    elif st.session_state["variables"].has_name(new_name):
                         st.error(f"'{new_name}' already exists in dictionary.")
                     else:
                         # Build new entry
@@ -138,6 +141,7 @@ def render_cloning_modal():
                             new_entry["governance"] = copy.deepcopy(source_var.get("governance", {}))
 
                         st.session_state["variables"].append(new_entry)
+                        autosave(new_entry)
                         st.success(f"Variable '{new_name}' committed to dictionary!")
                         st.rerun()
 
@@ -149,13 +153,18 @@ def render_cloning_modal():
                 count = st.number_input("Count", min_value=1, max_value=20, value=1, key="cl_count")
 
                 if st.button("👯 Generate Clones", type="primary", use_container_width=True):
+                    clones = []
                     for i in range(count):
                         new_entry = copy.deepcopy(source_var)
+                        # A clone is a new variable: it must not inherit the source's stable ID
+                        new_entry.pop("variable_id", None)
                         final_name = f"{prefix}{source_var['name']}{suffix}"
                         if count > 1:
                             final_name += f"_{i + 1}"
                         new_entry["name"] = final_name
                         st.session_state["variables"].append(new_entry)
+                        clones.append(new_entry)
+                    autosave(*clones)
                     st.success(f"Added {count} variants to dictionary.")
                     st.rerun()
 
@@ -8,19 +8,33 @@ import pandas as pd
 import streamlit as st
 
 from components.export_utils import (
+    GENERATED_AT_PLACEHOLDER,
     generate_csv,
     generate_excel,
     generate_json,
     generate_yaml,
+    read_export_snapshot,
+    stamp_generated_at,
 )
-from logic import flatten_json, generate_sql_script
+from logic import DIALECTS, change_log, generate_migration, generate_sql_script
+from logic.export_cache import ContentHasher, ExportCache
+
+
+@st.cache_resource
+def get_export_cache():
+    """Process-wide on-disk export cache (None if the cache directory cannot be created)."""
+    try:
+        return ExportCache()
+    except OSError:
+        return None
 
 
 @st.dialog("📤 Export Data Dictionary", width="large")
 def render_export_modal():
     """
     Renders the centralized export menu.
-    Calculates binary buffers only when the modal is active.
+    Each artifact is generated (streamed to a spooled file) only when its download button is clicked,
+    and reused from the on-disk export cache while the dictionary content is unchanged.
     """
     vars_list = st.session_state.get("variables", [])
     project_info = st.session_state.get("project_info", {})
@@ -34,15 +48,32 @@ def render_export_modal():
     st.divider()
 
     # --- Data Preparation ---
-    # Prepare the comprehensive export object
+    # Snapshots for the download callables, which run outside the script thread
+    variables = list(vars_list)
+    metadata = dict(project_info)
+    # Artifacts are cached by content; generated_at is stamped in at download time
     export_obj = {
-        "project_metadata": project_info,
-        "generated_at": datetime.now().isoformat(),
-        "variables": vars_list,
+        "project_metadata": metadata,
+        "generated_at": GENERATED_AT_PLACEHOLDER,
+        "variables": variables,
     }
+    hasher = st.session_state.setdefault("export_hasher", ContentHasher())
+    content_key = hasher.digest(vars_list, project_info)
+    cache = get_export_cache()
+
+    def cached(artifact, factory):
+        """Download callable serving `artifact` from the export cache, generating it on a miss."""
+
+        def load():
+            if cache is None:
+                return factory()
+            return cache.get_or_create(f"{content_key}.{artifact}", factory)
 
-    # Prepare flattened DataFrame for tabular formats
-    df_preview = pd.DataFrame([flatten_json(v) for v in vars_list])
+        return load
+
+    def timestamped(fmt, factory):
+        load = cached(fmt, factory)
+        return lambda: stamp_generated_at(fmt, load(), datetime.now().isoformat())
 
     # --- UI Grid for Downloads ---
     col1, col2 = st.columns(2)
@@ -51,10 +82,9 @@ def render_export_modal():
         st.markdown("### 🛠️ Developer Formats")
 
         # 1. YAML
-        yaml_data = generate_yaml(export_obj)
         st.download_button(
             label="Download YAML",
-            data=yaml_data,
+            data=timestamped("yaml", lambda: generate_yaml(export_obj)),
             file_name="data_dictionary.yaml",
             mime="text/yaml",
             use_container_width=True,
@@ -62,10 +92,9 @@ def render_export_modal():
         st.caption("Best for human-readable configuration and version control.")
 
         # 2. JSON
-        json_data = generate_json(export_obj)
         st.download_button(
             label="Download JSON",
-            data=json_data,
+            data=timestamped("json", lambda: generate_json(export_obj)),
             file_name="data_dictionary.json",
             mime="application/json",
             use_container_width=True,
@@ -73,39 +102,73 @@ def render_export_modal():
         st.caption("Standard format for API integration and programmatic ingestion.")
 
         # 3. SQL
-        sql_data = generate_sql_script(vars_list)
+        dialect = st.selectbox(
+            "SQL Dialect",
+            options=list(DIALECTS),
+            format_func=lambda name: DIALECTS[name].label,
+            key="export_sql_dialect",
+        )
         st.download_button(
             label="Download SQL",
-            data=sql_data,
-            file_name="schema.sql",
+            data=cached(f"{dialect}.sql", lambda: generate_sql_script(variables, dialect).encode("utf-8")),
+            file_name=f"schema_{dialect}.sql",
             mime="text/plain",
             use_container_width=True,
         )
-        st.caption("PostgreSQL DDL script for database schema initialization.")
+        st.caption(f"{DIALECTS[dialect].label} DDL script for database schema initialization.")
 
     with col2:
         st.markdown("### 📊 Tabular Formats")
 
         # 4. Excel
-        excel_data = generate_excel(df_preview, project_info)
         st.download_button(
             label="Download Excel",
-            data=excel_data,
+            data=cached("xlsx", lambda: generate_excel(variables, metadata)),
             file_name="data_dictionary.xlsx",
             use_container_width=True,
         )
         st.caption("Formatted workbook for business stakeholders and documentation.")
 
         # 5. CSV
-        csv_data = generate_csv(df_preview)
         st.download_button(
             label="Download CSV",
-            data=csv_data,
+            data=cached("csv", lambda: generate_csv(variables)),
             file_name="data_dictionary.csv",
             mime="text/csv",
             use_container_width=True,
         )
         st.caption("Raw tabular data for PowerBI, Tableau, or Python/R analysis.")
 
+    # --- Incremental Migration ---
+    with st.expander("🔁 Migration from a previous export"):
+        baseline_file = st.file_uploader(
+            "Previous JSON/YAML export",
+            type=["json", "yaml", "yml"],
+            key="export_migration_baseline",
+        )
+        if baseline_file is not None:
+            baseline_info, baseline_vars = read_export_snapshot(baseline_file)
+            if baseline_vars is None:
+                st.error("This file is not a Dictionary Forge JSON/YAML export.")
+            else:
+                log = change_log(baseline_vars, vars_list)
+                st.caption(f"{len(log)} schema change(s) since version {baseline_info.get('version', '?')}.")
+                if log:
+                    st.dataframe(pd.DataFrame(log), hide_index=True, use_container_width=True)
+                migration = generate_migration(
+                    baseline_vars,
+                    vars_list,
+                    dialect,
+                    from_version=baseline_info.get("version"),
+                    to_version=project_info.get("version"),
+                )
+                st.download_button(
+                    label="Download Migration SQL",
+                    data=migration,
+                    file_name=f"migration_{dialect}.sql",
+                    mime="text/plain",
+                    use_container_width=True,
+                )
+
     st.divider()
     st.info("💡 Tip: All exports include governance metadata and compliance scopes.")
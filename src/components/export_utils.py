@@ -1,37 +1,214 @@
 """
 Description: Export utility functions for Dictionary Forge
+Streaming writers: every format is produced as a sequence of text chunks (or, for Excel, written
+row by row in xlsxwriter's constant_memory mode) and spooled to a temporary file, so the only full
+copy of an artifact is the final bytes handed to the download.
 """
 
+import csv
 import io
-import json
+import tempfile
 
-import pandas as pd
-import yaml
+import xlsxwriter
+
+from logic import flatten_json
+from logic.ledger import HIDDEN_COLUMNS
+from logic.serialization import YAMLError, dump_yaml, dumps_json, load_yaml, loads_json
+
+# Target size of each emitted text chunk
+CHUNK_SIZE = 64 * 1024
+
+# Spooled exports stay in memory up to this size, then roll over to disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Placeholder for 'generated_at' in cached artifacts; the real time is stamped in at download
+GENERATED_AT_PLACEHOLDER = "__dictionary_forge_generated_at__"
+
+
+# =============================================================================
+# 1. CHUNK WRITERS
+# =============================================================================
+def iter_yaml(export_obj):
+    """Yields the YAML document chunk by chunk, one variable at a time."""
+    header = {k: v for k, v in export_obj.items() if k != "variables"}
+    variables = export_obj.get("variables") or []
+
+    def pieces():
+        if header:
+            yield dump_yaml(header)
+        if not variables:
+            yield "variables: []\n"
+            return
+        yield "variables:\n"
+        for var in variables:
+            yield dump_yaml([export_record(var)])
+
+    return _batched(pieces())
+
+
+def iter_json(export_obj):
+    """
+    Yields the JSON document (identical to a single indent=4 dump) in chunks. Each variable is encoded
+    on its own by the C encoder and re-indented; JSON strings never contain raw newlines.
+    """
+
+    def nested(value, depth):
+        return dumps_json(value, indent=4).replace("\n", "\n" + "    " * depth)
+
+    def pieces():
+        yield "{"
+        for i, (key, value) in enumerate(export_obj.items()):
+            yield f"{',' if i else ''}\n    {dumps_json(key)}: "
+            if key != "variables" or not value:
+                yield nested(value, 1)
+                continue
+            yield "["
+            for j, var in enumerate(value):
+                yield f"{',' if j else ''}\n        {nested(export_record(var), 2)}"
+            yield "\n    ]"
+        yield "\n}" if export_obj else "}"
+
+    return _batched(pieces())
+
+
+def iter_csv(variables):
+    """Yields the flattened dictionary as CSV. Columns follow first appearance, like a DataFrame of the rows."""
+    columns = flat_columns(variables)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+    writer.writeheader()
+    for var in variables:
+        writer.writerow(_flat_record(var))
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def write_excel(target, variables, project_info):
+    """Writes the Variables and Project Info sheets row by row (constant_memory) to a path or binary file."""
+    workbook = xlsxwriter.Workbook(target, {"constant_memory": True})
+    header_format = workbook.add_format({"bold": True, "border": 1})
+
+    sheet = workbook.add_worksheet("Variables")
+    columns = flat_columns(variables)
+    sheet.write_row(0, 0, columns, header_format)
+    for row, var in enumerate(variables, start=1):
+        flat = _flat_record(var)
+        sheet.write_row(row, 0, [_cell(flat.get(c)) for c in columns])
+
+    info_sheet = workbook.add_worksheet("Project Info")
+    info_sheet.write_row(0, 0, list(project_info), header_format)
+    info_sheet.write_row(1, 0, [_cell(v) for v in project_info.values()])
+    workbook.close()
+
+
+def flat_columns(variables):
+    """Union of flattened keys in first-seen order (one streaming pass, rows are not retained)."""
+    columns = {}
+    for var in variables:
+        columns.update(dict.fromkeys(_flat_record(var)))
+    return list(columns)
+
+
+def export_record(var):
+    """The variable as exported: internal identity fields (the ledger's hidden columns) are dropped."""
+    if not any(column in var for column in HIDDEN_COLUMNS):
+        return var
+    return {k: v for k, v in var.items() if k not in HIDDEN_COLUMNS}
+
+
+def _flat_record(var):
+    row = flatten_json(var)
+    for column in HIDDEN_COLUMNS:
+        row.pop(column, None)
+    return row
+
+
+def _cell(value):
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+def _batched(pieces, size=CHUNK_SIZE):
+    """Coalesces small string pieces into chunks of roughly `size` characters."""
+    pending, length = [], 0
+    for piece in pieces:
+        pending.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield "".join(pending)
+            pending, length = [], 0
+    if pending:
+        yield "".join(pending)
+
+
+# =============================================================================
+# 2. DOWNLOAD PAYLOADS (generated on demand)
+# =============================================================================
+def spool(chunks):
+    """Writes text chunks UTF-8 encoded to a spooled temporary file, rewound for reading."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for chunk in chunks:
+        spooled.write(chunk.encode("utf-8"))
+    spooled.seek(0)
+    return spooled
+
+
+def _read_all(spooled):
+    # The download itself needs bytes: read the spooled output exactly once
+    with spooled:
+        spooled.seek(0)
+        return spooled.read()
 
 
 def generate_yaml(export_obj):
-    """Generates a YAML string from the export object."""
-    return yaml.dump(export_obj, sort_keys=False)
+    """YAML export bytes."""
+    return _read_all(spool(iter_yaml(export_obj)))
 
 
 def generate_json(export_obj):
-    """Generates a formatted JSON string from the export object."""
-    return json.dumps(export_obj, indent=4)
-
-
-def generate_csv(df_preview):
-    """Generates a CSV string from the flattened DataFrame."""
-    csv_buffer = io.StringIO()
-    df_preview.to_csv(csv_buffer, index=False)
-    return csv_buffer.getvalue()
-
-
-def generate_excel(df_preview, project_info):
-    """Generates an Excel binary buffer with separate sheets for variables and metadata."""
-    excel_buffer = io.BytesIO()
-    with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
-        # Variables Sheet
-        df_preview.to_excel(writer, sheet_name="Variables", index=False)
-        # Project Metadata Sheet
-        pd.DataFrame([project_info]).to_excel(writer, sheet_name="Project Info", index=False)
-    return excel_buffer.getvalue()
+    """JSON export bytes."""
+    return _read_all(spool(iter_json(export_obj)))
+
+
+def generate_csv(variables):
+    """Flattened CSV export bytes."""
+    return _read_all(spool(iter_csv(variables)))
+
+
+def generate_excel(variables, project_info):
+    """Excel workbook bytes with separate sheets for variables and metadata."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    write_excel(spooled, variables, project_info)
+    return _read_all(spooled)
+
+
+def _generated_at_entry(fmt, value):
+    if fmt == "json":
+        return f'"generated_at": {dumps_json(value)}'.encode()
+    return dump_yaml({"generated_at": value}).encode("utf-8")
+
+
+def stamp_generated_at(fmt, data, generated_at):
+    """Replaces the placeholder timestamp of a cached JSON/YAML export with `generated_at`."""
+    placeholder = _generated_at_entry(fmt, GENERATED_AT_PLACEHOLDER)
+    return data.replace(placeholder, _generated_at_entry(fmt, generated_at), 1)
+
+
+def read_export_snapshot(uploaded_file):
+    """
+    Parses a previous JSON/YAML dictionary export back into (project_metadata, variables).
+    Returns (None, None) if the file is not a Dictionary Forge export.
+    """
+    content = uploaded_file.getvalue()
+    try:
+        data = loads_json(content) if uploaded_file.name.endswith(".json") else load_yaml(content)
+    except (ValueError, YAMLError):
+        return None, None
+    if not isinstance(data, dict) or not isinstance(data.get("variables"), list):
+        return None, None
+    return data.get("project_metadata") or {}, data["variables"]
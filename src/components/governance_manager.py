@@ -4,7 +4,7 @@ Description: Professional Master-Detail Regulatory Compliance Manager.
 
 import streamlit as st
 
-from logic import load_regulations, save_regulations
+from logic import delete_regulation, load_regulations, save_regulation
 
 
 @st.dialog("⚖️ Regulatory Compliance Manager", width="large")
@@ -134,16 +134,16 @@ def render_governance_manager():
 
                     if btn_save.form_submit_button("💾 Save Changes", type="primary", use_container_width=True):
                         # Key Migration logic for safe renaming
-                        if new_abbr != old_abbr:
-                            del regs[old_abbr]
-
-                        regs[new_abbr.strip()] = {
-                            "full_name": new_full.strip(),
-                            "jurisdiction": new_jur.strip(),
-                            "description": new_desc.strip(),
-                            "url": new_url.strip(),
-                        }
-                        save_regulations(regs)
+                        save_regulation(
+                            new_abbr.strip(),
+                            {
+                                "full_name": new_full.strip(),
+                                "jurisdiction": new_jur.strip(),
+                                "description": new_desc.strip(),
+                                "url": new_url.strip(),
+                            },
+                            previous_abbr=old_abbr,
+                        )
                         st.session_state["selected_reg_abbr"] = new_abbr.strip()
                         st.session_state["reg_edit_mode"] = False
                         st.rerun()
@@ -153,8 +153,7 @@ def render_governance_manager():
                         st.rerun()
 
                     if btn_del.form_submit_button("🗑️ Delete", use_container_width=True):
-                        del regs[old_abbr]
-                        save_regulations(regs)
+                        delete_regulation(old_abbr)
                         st.session_state["selected_reg_abbr"] = None
                         st.session_state["reg_manager_view"] = "LIST"
                         st.rerun()
@@ -176,13 +175,15 @@ def render_governance_manager():
                     if sub_save.form_submit_button("💾 Save Regulation", type="primary", use_container_width=True):
                         if new_abbr and new_jur and new_full and new_url:
                             abbr_clean = new_abbr.strip()
-                            regs[abbr_clean] = {
-                                "full_name": new_full.strip(),
-                                "jurisdiction": new_jur.strip(),
-                                "description": new_desc.strip(),
-                                "url": new_url.strip(),
-                            }
-                            save_regulations(regs)
+                            save_regulation(
+                                abbr_clean,
+                                {
+                                    "full_name": new_full.strip(),
+                                    "jurisdiction": new_jur.strip(),
+                                    "description": new_desc.strip(),
+                                    "url": new_url.strip(),
+                                },
+                            )
                             st.session_state["selected_reg_abbr"] = abbr_clean
                             st.session_state["reg_manager_view"] = "DETAILS"
                             st.rerun()
@@ -1,32 +1,40 @@
 """
-Description: UI component for bulk ingestion of variables via CSV or Excel.
+Description: UI component for bulk ingestion of variables via CSV, Excel or Parquet.
 """
 
-import pandas as pd
 import streamlit as st
 
+from logic.ingestion import read_column, read_header
+from logic.profiling import propose_from_source
+from logic.registry import PendingQueue
+
 
 @st.dialog("📥 Bulk Variable Ingestion", width="large")
 def render_ingestion_ui():
     """
     Renders the file uploader and extraction logic for bulk variable ingestion.
     """
+    render_ingestion_panel()
+
+
+def render_ingestion_panel():
+    """
+    Shared upload/extract/queue workflow (used by this dialog and the Batch Forge dataset tab).
+    Files are streamed: header extraction never reads data rows and column extraction
+    only parses the selected column.
+    """
     st.markdown("Upload an existing dataset or a variable list to quickly populate your dictionary queue.")
 
     if "pending_variables" not in st.session_state:
-        st.session_state["pending_variables"] = []
+        st.session_state["pending_variables"] = PendingQueue()
 
-    uploaded_file = st.file_uploader("Upload Data (.csv, .xlsx)", type=["csv", "xlsx"])
+    uploaded_file = st.file_uploader("Upload Data (.csv, .xlsx, .parquet)", type=["csv", "xlsx", "parquet"])
 
     if uploaded_file:
         try:
-            # Parse file based on extension
-            if uploaded_file.name.endswith(".csv"):
-                df = pd.read_csv(uploaded_file)
-            else:
-                df = pd.read_excel(uploaded_file)
-
-            st.success(f"Loaded: {df.shape[1]} columns, {df.shape[0]} rows.")
+            # Header-only read: constant cost regardless of the file's row count
+            columns = read_header(uploaded_file)
+            st.success(f"Detected {len(columns)} columns in '{uploaded_file.name}'.")
 
             # Extraction Strategy Selection
             ext_strategy = st.radio(
@@ -38,36 +46,40 @@ def render_ingestion_ui():
                 horizontal=True,
             )
 
-            extracted_names = []
-
-            if ext_strategy == "Extract Column Headers (Raw Dataset)":
-                extracted_names = df.columns.tolist()
+            target_col = None
+            profile_columns = False
+            if ext_strategy != "Extract Column Headers (Raw Dataset)":
+                target_col = st.selectbox("Select the column containing Variable Names:", options=columns)
             else:
-                target_col = st.selectbox("Select the column containing Variable Names:", options=df.columns)
-                if target_col:
-                    extracted_names = df[target_col].dropna().astype(str).tolist()
+                profile_columns = st.toggle(
+                    "🔬 Profile column contents",
+                    value=True,
+                    help="Samples the data to propose types, roles and constraints for each queued column.",
+                )
 
             # Submission and Deduplication Logic
             st.write("")
             if st.button("➕ Queue Extracted Variables", type="primary"):
-                existing_defined = [v["name"] for v in st.session_state.get("variables", [])]
-
-                added_count = 0
-                for name in extracted_names:
-                    clean_name = str(name).strip()
-                    if (
-                        clean_name
-                        and clean_name not in st.session_state["pending_variables"]
-                        and clean_name not in existing_defined
-                    ):
-                        st.session_state["pending_variables"].append(clean_name)
-                        added_count += 1
-
-                if added_count > 0:
-                    st.success(f"Added {added_count} variables to the queue.")
-                    st.rerun()
+                if target_col is None:
+                    extracted_names = columns
+                    if profile_columns:
+                        progress = st.progress(0.0, text="Profiling columns...")
+                        proposals = propose_from_source(
+                            uploaded_file,
+                            progress_callback=lambda fraction: progress.progress(fraction),
+                        )
+                        progress.empty()
+                        st.session_state.setdefault("column_profiles", {}).update(proposals)
                 else:
-                    st.warning("No new variables added. All extracted names are already in the queue or defined.")
+                    progress = st.progress(0.0, text=f"Reading '{target_col}'...")
+                    extracted_names = read_column(
+                        uploaded_file,
+                        target_col,
+                        progress_callback=lambda fraction: progress.progress(fraction),
+                    )
+                    progress.empty()
+
+                _queue_names(extracted_names)
 
         except Exception as e:
             st.error(f"Error parsing file: {e}")
@@ -83,7 +95,42 @@ def render_ingestion_ui():
             for i, var_name in enumerate(st.session_state["pending_variables"]):
                 cols[i % 4].code(var_name)
 
+            _render_proposals()
+
             st.write("")
             if st.button("🗑️ Clear Queue", use_container_width=True):
-                st.session_state["pending_variables"] = []
+                st.session_state["pending_variables"].clear()
+                st.session_state.pop("column_profiles", None)
                 st.rerun()
+
+
+def _render_proposals():
+    """Metadata proposed by the column profiler for the queued names (see logic.profiling)."""
+    proposals = st.session_state.get("column_profiles", {})
+    rows = [
+        {
+            "Variable": name,
+            "Analytical Type": proposals[name]["analytical_type"],
+            "Data Type": proposals[name]["data_type"],
+            "Role": proposals[name]["role"],
+            "Constraints": ", ".join(f"{k}={v}" for k, v in proposals[name]["constraints"].items()),
+        }
+        for name in st.session_state["pending_variables"]
+        if name in proposals
+    ]
+    if rows:
+        st.markdown("##### 🔬 Proposed Metadata")
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+
+def _queue_names(extracted_names):
+    """Appends unseen names to the pending queue, skipping names already queued or defined."""
+    added_count = st.session_state["pending_variables"].add_unique(
+        extracted_names, exclude=st.session_state["variables"]
+    )
+
+    if added_count > 0:
+        st.success(f"Added {added_count} variables to the queue.")
+        st.rerun()
+    else:
+        st.warning("No new variables added. All extracted names are already in the queue or defined.")
@@ -0,0 +1,105 @@
+"""
+Description: Session bridge between st.session_state and the durable project store (logic.store).
+Restores the dictionary when a session starts and autosaves every committed change. Each project
+has its own store file, named by the `?project=` key of the URL: reloading the page resumes it,
+while a new session without a key starts a new project.
+"""
+
+import logging
+import sqlite3
+
+import streamlit as st
+
+from logic.registry import VariableRegistry
+from logic.serialization import dumps_json
+from logic.store import (
+    StoreConnections,
+    clear_variables,
+    delete_variables,
+    is_project_key,
+    load_project_info,
+    load_variables,
+    new_project_key,
+    save_project_info,
+    save_variables,
+    store_path,
+)
+
+
+@st.cache_resource
+def _project_connections(path):
+    """Connections to one project's store, shared by its sessions; None keeps the app usable on a read-only disk."""
+    try:
+        return StoreConnections(path)
+    except (OSError, sqlite3.Error) as e:
+        logging.warning("Project store unavailable (%s); running session-only.", e)
+        return None
+
+
+def project_key():
+    """The session's project key: taken from the URL once, else a new one written back to it."""
+    key = st.session_state.get("project_key")
+    if key is None:
+        key = st.query_params.get("project")
+        if not is_project_key(key):
+            key = new_project_key()
+            st.query_params["project"] = key
+        st.session_state["project_key"] = key
+    return key
+
+
+def get_project_store():
+    """The project store connection of the current script thread, or None when running session-only."""
+    connections = _project_connections(store_path(project_key()))
+    return connections.get() if connections is not None else None
+
+
+def restore_project():
+    """Seeds a new session from the store (no-op once the session holds a dictionary)."""
+    if "variables" in st.session_state:
+        return
+    conn = get_project_store()
+    if conn is None:
+        st.session_state["variables"] = VariableRegistry()
+        st.warning("The project store is unavailable: changes are kept for this session only.")
+        return
+
+    # Loaded in full (through keyset-paged reads): the ledger, search, quality grades and exports
+    # all work on the in-memory VariableRegistry, so a lazily paged dictionary would only defer
+    # the same load to the first of them.
+    st.session_state["variables"] = VariableRegistry(load_variables(conn))
+    project_info = load_project_info(conn)
+    if project_info:
+        st.session_state["project_info"] = project_info
+        st.session_state["_saved_project_info"] = dumps_json(project_info)
+
+
+def autosave(*variables):
+    """Appends a revision for each committed variable (assigning stable IDs to new ones)."""
+    conn = get_project_store()
+    if conn is not None and variables:
+        save_variables(conn, variables)
+
+
+def autosave_deletion(*variables):
+    conn = get_project_store()
+    ids = [v["variable_id"] for v in variables if v.get("variable_id")]
+    if conn is not None and ids:
+        delete_variables(conn, ids)
+
+
+def autosave_clear():
+    conn = get_project_store()
+    if conn is not None:
+        clear_variables(conn)
+
+
+def autosave_project_info():
+    """Project metadata is edited inline on every rerun, so it is only written when it changed."""
+    conn = get_project_store()
+    if conn is None:
+        return
+    snapshot = dumps_json(st.session_state["project_info"])
+    if snapshot != st.session_state.get("_saved_project_info"):
+        save_project_info(conn, st.session_state["project_info"])
+        st.session_state["_saved_project_info"] = snapshot
@@ -5,6 +5,8 @@ Description: Diagnostic modal for data dictionary health and progress.
 import pandas as pd
 import streamlit as st
 
+from logic.quality import quality_profiles
+
 
 @st.dialog("🛡️ Data Quality & Progress Audit", width="large")
 def render_quality_modal():
@@ -45,20 +47,24 @@ def render_quality_modal():
     st.divider()
     st.subheader("📈 Definition Quality Audit")
 
-    audit_data = []
-    quality_counts = {"Gold": 0, "Silver": 0, "Bronze": 0}
-
-    for var in defined_list:
-        grade, score, missing = _calculate_audit_details(var)
-        quality_counts[grade] += 1
-        audit_data.append(
-            {
-                "Variable": var["name"],
-                "Grade": grade,
-                "Score": f"{score}%",
-                "Missing for Gold": ", ".join(missing) if missing else "✅ Perfect",
-            }
-        )
+    # Quality standard (profiles of config/quality_rules.yaml); the sidebar tracker follows this choice.
+    # The choice lives in a plain key: widget state is dropped once the dialog closes.
+    profiles = quality_profiles()
+    options = list(profiles)
+    active = st.session_state.get("active_quality_profile")
+    profile = st.selectbox(
+        "Quality Standard",
+        options=options,
+        index=options.index(active) if active in options else 0,
+        format_func=lambda p: profiles.get(p, p),
+        key="quality_profile",
+        on_change=_keep_quality_profile,
+    )
+
+    # Graded as one batch by the shared quality engine (same scores as the sidebar tracker)
+    engine = st.session_state["quality_engine"]
+    report = engine.report(defined_list, profile)
+    quality_counts = report.counts()
 
     # High-level Quality Summary
     q1, q2, q3 = st.columns(3)
@@ -69,7 +75,7 @@ def render_quality_modal():
     # Detailed Audit Table
     st.write("")
     st.markdown("##### 📝 Detailed Deficiency Report")
-    df_audit = pd.DataFrame(audit_data)
+    df_audit = report.frame()
 
     # Apply color highlighting to the Grade column
     def color_grade(val):
@@ -78,6 +84,14 @@ def render_quality_modal():
 
     st.table(df_audit.style.applymap(color_grade, subset=["Grade"]))
 
+    with st.expander("⏱️ Rule Timings"):
+        st.caption(f"Last evaluation: {engine.evaluated} variable(s) re-scored.")
+        st.dataframe(
+            pd.DataFrame({"Rule": list(engine.timings), "Time (ms)": [round(ms, 3) for ms in engine.timings.values()]}),
+            hide_index=True,
+            use_container_width=True,
+        )
+
     # --- Section 3: Actionable Jump-Links ---
     st.divider()
     col_edit, col_pending = st.columns(2)
@@ -90,7 +104,7 @@ def render_quality_modal():
             key="quality_edit_select",
         )
         if st.button("Open in Form", use_container_width=True):
-            idx = next(i for i, v in enumerate(defined_list) if v["name"] == var_to_edit)
+            idx = defined_list.index_of(var_to_edit)
             st.session_state["editing_index"] = idx
             st.session_state["form_id"] += 1
             st.session_state["cat_rows_hydrated"] = False
@@ -106,71 +120,9 @@ def render_quality_modal():
             st.success("All pending variables have been defined!")
 
 
-def _calculate_audit_details(var):
-    """
-    Enhanced grader that identifies specific missing metadata.
-    """
-    score = 0
-    missing = []
-
-    # Technical (40 pts)
-    if var.get("name"):
-        score += 10
-    else:
-        missing.append("Name")
-
-    if var.get("analytical_type"):
-        score += 10
-    else:
-        missing.append("Analytical Type")
-
-    if var.get("data_type"):
-        score += 10
-    else:
-        missing.append("Data Type")
-
-    if var.get("role"):
-        score += 10
-    else:
-        missing.append("Role")
-
-    # Semantic (30 pts)
-    if var.get("alias") and var.get("alias") != var.get("name"):
-        score += 10
-    else:
-        missing.append("Unique Alias")
-
-    desc = var.get("description", "")
-    if len(desc) > 20:
-        score += 20
-    elif len(desc) > 0:
-        score += 10
-        missing.append("Detailed Description (>20 chars)")
-    else:
-        missing.append("Description")
-
-    # Governance (30 pts)
-    gov = var.get("governance", {})
-    if gov.get("data_steward"):
-        score += 10
-    else:
-        missing.append("Data Steward")
-
-    if gov.get("pii_flag") is not None:
-        score += 10
-    else:
-        missing.append("PII Flag")
-
-    if gov.get("sensitivity"):
-        score += 10
-    else:
-        missing.append("Sensitivity Level")
-
-    if score >= 90:
-        return "Gold", score, []
-    if score >= 60:
-        return "Silver", score, missing
-    return "Bronze", score, missing
+def _keep_quality_profile():
+    """Copies the selected standard out of the widget state so the sidebar keeps using it."""
+    st.session_state["active_quality_profile"] = st.session_state["quality_profile"]
 
 
 def _load_variable_from_quality_modal(var_name):
@@ -5,6 +5,7 @@ Description: Modular sidebar component for Dictionary Forge.
 import streamlit as st
 
 from components.cloning_modal import render_cloning_modal
+from components.project_store import autosave_clear
 from components.quality_modal import render_quality_modal
 from components.template_modal import render_template_modal
 from sections.batch_forge import render_batch_forge
@@ -39,6 +40,7 @@ def render_sidebar():
                 use_container_width=True,
                 disabled=not confirm_clear,
             ):
-                st.session_state["variables"] = []
+                st.session_state["variables"].clear()
+                autosave_clear()
                 st.session_state["editing_index"] = None
                 st.rerun()
@@ -6,11 +6,14 @@ import copy
 
 import streamlit as st
 
+from logic.template_registry import normalize_template
 from logic.templates import (
     delete_template,
+    get_template_facets,
     get_template_list,
     load_template_data,
     save_template_data,
+    search_templates,
 )
 
 
@@ -55,7 +58,17 @@ def render_template_modal():
                         placeholder="🔍 Search...",
                         label_visibility="collapsed",
                     )
-                    filtered = [t for t in templates if search_query.lower() in t.lower()]
+                    type_filter = st.selectbox(
+                        "Data Type",
+                        options=["All types", *get_template_facets()["data_type"]],
+                        label_visibility="collapsed",
+                        key="t_hub_type_filter",
+                    )
+                    data_type = None if type_filter == "All types" else type_filter
+                    if search_query or data_type:
+                        filtered = search_templates(search_query, templates, data_type=data_type)
+                    else:
+                        filtered = templates
 
                     if filtered:
                         selected_t = st.radio(
@@ -131,47 +144,8 @@ def render_template_modal():
                         hydrate_payload.pop("description", None)
                         skipped_fields.append("Description")
 
-                    # ==========================================================
-                    # THE DATA MISMATCH SANITIZER
-                    # Forces legacy template names to match Streamlit's strict logic
-                    # ==========================================================
-                    at_map = {
-                        "categorical": "nominal",
-                        "boolean": "binary",
-                        "numeric": "continuous",
-                        "datetime": "time_index",
-                    }
-                    dt_map = {
-                        "boolean": "bool",
-                        "float": "float64",
-                        "integer": "int64",
-                        "string": "string",
-                        "category": "category",
-                    }
-                    role_map = {
-                        "dimension": "feature",
-                        "measure": "target",
-                        "identifier": "id",
-                    }
-
-                    # 1. Sanitize Analytical Type
-                    raw_at = str(hydrate_payload.get("analytical_type", "")).lower()
-                    hydrate_payload["analytical_type"] = at_map.get(raw_at, raw_at)
-
-                    # 2. Sanitize Data Type
-                    raw_dt = str(hydrate_payload.get("data_type", "")).lower()
-                    hydrate_payload["data_type"] = dt_map.get(raw_dt, raw_dt)
-
-                    # 3. Sanitize Role
-                    raw_role = str(hydrate_payload.get("role", "")).lower()
-                    hydrate_payload["role"] = role_map.get(raw_role, raw_role)
-
-                    # 4. Standardize legacy constraint keys
-                    if "constraints" in hydrate_payload:
-                        if "is_nullable" in hydrate_payload["constraints"]:
-                            hydrate_payload["constraints"]["nullable"] = hydrate_payload["constraints"].pop(
-                                "is_nullable"
-                            )
+                    # Map legacy vocabulary and keys onto the master schema (shared with the registry)
+                    hydrate_payload = normalize_template(hydrate_payload)
 
                     # Hand off to __init__.py Orchestrator
                     st.session_state["hydration_report"] = (
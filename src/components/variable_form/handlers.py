@@ -6,6 +6,8 @@ import ast
 
 import streamlit as st
 
+from components.project_store import autosave, autosave_deletion
+
 
 def process_form_submission(v_inputs, current_at, current_dt):
     """
@@ -47,7 +49,10 @@ def process_form_submission(v_inputs, current_at, current_dt):
     editing_idx = st.session_state.get("editing_index")
 
     if editing_idx is not None:
-        # Update existing variable
+        # Update existing variable (keeping its stable ID so the store appends a new revision)
+        previous_id = st.session_state["variables"][editing_idx].get("variable_id")
+        if previous_id:
+            v_inputs["variable_id"] = previous_id
         st.session_state["variables"][editing_idx] = v_inputs
         st.session_state["editing_index"] = None
         st.success(f"Variable '{v_inputs['name']}' updated.")
@@ -56,6 +61,10 @@ def process_form_submission(v_inputs, current_at, current_dt):
         st.session_state["variables"].append(v_inputs)
         st.success(f"Variable '{v_inputs['name']}' added to dictionary.")
 
+    autosave(v_inputs)
+    if "pending_variables" in st.session_state:
+        st.session_state["pending_variables"].discard(v_inputs["name"])
+
     # 4. State Cleanup
     st.session_state["cat_rows_hydrated"] = False
     return True
@@ -69,7 +78,7 @@ def delete_variable(index):
         variable_name = st.session_state["variables"][index].get("name", "Unknown")
 
         # Remove from list
-        st.session_state["variables"].pop(index)
+        autosave_deletion(st.session_state["variables"].pop(index))
 
         # Handle index synchronization for Edit Mode
         if st.session_state.get("editing_index") == index:
@@ -4,6 +4,8 @@ Description: Sidebar component for tracking variable definition progress.
 
 import streamlit as st
 
+from logic.quality import GRADES
+
 
 def render_variable_tracker():
     """
@@ -35,13 +37,9 @@ def render_variable_tracker():
         st.sidebar.divider()
         st.sidebar.subheader("📈 Definition Quality")
 
-        quality_counts = {"Gold": 0, "Silver": 0, "Bronze": 0}
-        graded_vars = []
-
-        for var in defined_list:
-            grade, score = _calculate_definition_grade(var)
-            quality_counts[grade] += 1
-            graded_vars.append((var["name"], grade, score))
+        # Graded as one batch; cached per variable version, so reruns without edits cost nothing
+        report = st.session_state["quality_engine"].report(defined_list, st.session_state.get("active_quality_profile"))
+        quality_counts = report.counts()
 
         # Show Quality Distribution
         c1, c2, c3 = st.sidebar.columns(3)
@@ -50,9 +48,12 @@ def render_variable_tracker():
         c3.metric("🥉", quality_counts["Bronze"])
 
         with st.sidebar.expander("📝 Defined Variables"):
-            for name, grade, score in graded_vars:
-                icon = "🟢" if grade == "Gold" else "🟡" if grade == "Silver" else "🟠"
-                st.write(f"{icon} **{name}** ({score}%)")
+            st.dataframe(
+                _graded_frame(report),
+                hide_index=True,
+                use_container_width=True,
+                column_config={"Score": st.column_config.NumberColumn("Score", format="%d%%")},
+            )
 
     # 3. Pending Queue
     if pending_list:
@@ -63,45 +64,14 @@ def render_variable_tracker():
                     _load_variable_from_tracker(var_name)
 
 
-def _calculate_definition_grade(var):
-    """
-    Evaluates a variable across multiple dimensions.
-    Returns: (Grade String, Score Integer)
-    """
-    score = 0
-    # Technical (40 pts)
-    if var.get("name"):
-        score += 10
-    if var.get("analytical_type"):
-        score += 10
-    if var.get("data_type"):
-        score += 10
-    if var.get("role"):
-        score += 10
-
-    # Semantic (30 pts)
-    if var.get("alias") and var.get("alias") != var.get("name"):
-        score += 10
-    desc = var.get("description", "")
-    if len(desc) > 20:
-        score += 20
-    elif len(desc) > 0:
-        score += 10
-
-    # Governance (30 pts)
-    gov = var.get("governance", {})
-    if gov.get("data_steward"):
-        score += 10
-    if gov.get("pii_flag") is not None:
-        score += 10
-    if gov.get("sensitivity"):
-        score += 10
-
-    if score >= 90:
-        return "Gold", score
-    if score >= 60:
-        return "Silver", score
-    return "Bronze", score
+def _graded_frame(report):
+    """The sidebar's graded list, rebuilt only when the engine hands out a new report."""
+    cached = st.session_state.get("_quality_sidebar_frame")
+    if cached is None or cached[0] is not report:
+        icons = {"Gold": "🟢", "Silver": "🟡", "Bronze": "🟠"}
+        cached = (report, report.grade_frame([f"{icons[grade]} {grade}" for grade in GRADES]))
+        st.session_state["_quality_sidebar_frame"] = cached
+    return cached[1]
 
 
 def _load_variable_from_tracker(var_name):
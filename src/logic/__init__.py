@@ -18,35 +18,93 @@ from .coherence import (
     get_filtered_data_types,
     get_filtered_roles,
     guess_metadata_from_name,
+    hidden_fields,
     is_field_visible,
+    prune,
     validate_categorical_entropy,
+    visible_fields,
 )
 
 # 2. Data Export & SQL Generation
+from .ddl import DIALECTS, build_schema, compile_ddl
 from .exporters import flatten_json, generate_sql_script
 
 # 5. Governance & Compliance
-from .governance import load_regulations, save_regulations
+from .governance import delete_regulation, load_regulations, save_regulation, save_regulations
+from .migrations import change_log, diff_dictionaries, generate_migration
+
+# 7. Column Profiling
+from .profiling import profile_dataframe, profile_source, propose_from_source, propose_metadata
+
+# 8. Variable Registry
+from .registry import PendingQueue, VariableRegistry
+
+# 9. Full-Text Search
+from .search import SearchIndex, variable_document
+
+# 4. Template & Blueprint Management (unified registry)
+from .template_registry import TemplateRegistry, get_template_registry, normalize_template
 
 # 3. Data Transformation & Grid Hydration
-from .transformers import generate_batch_dataframe, hydrate_row_from_flat
+from .transformers import (
+    ColumnSchema,
+    column_schema,
+    generate_batch_dataframe,
+    grid_categories,
+    hydrate_frame,
+    hydrate_row_from_flat,
+    resize_batch_dataframe,
+)
+
+# 6. Dataset Validation
+from .validation import report_to_dataframe, validate_dataframe, validate_file
 
 __all__ = [
     "get_filtered_data_types",
     "get_filtered_roles",
     "is_field_visible",
+    "visible_fields",
+    "hidden_fields",
+    "prune",
     "get_dynamic_label",
     "get_field_requirement",
     "validate_categorical_entropy",
     "guess_metadata_from_name",
     "flatten_json",
     "generate_sql_script",
+    "build_schema",
+    "compile_ddl",
+    "DIALECTS",
+    "diff_dictionaries",
+    "generate_migration",
+    "change_log",
+    "ColumnSchema",
+    "column_schema",
     "hydrate_row_from_flat",
+    "hydrate_frame",
     "generate_batch_dataframe",
+    "resize_batch_dataframe",
+    "grid_categories",
     "load_master_schema",
     "load_all_templates",
     "apply_template_to_state",
     "save_user_template",
+    "TemplateRegistry",
+    "get_template_registry",
+    "normalize_template",
     "load_regulations",
     "save_regulations",
+    "save_regulation",
+    "delete_regulation",
+    "validate_dataframe",
+    "validate_file",
+    "report_to_dataframe",
+    "profile_dataframe",
+    "profile_source",
+    "propose_metadata",
+    "propose_from_source",
+    "VariableRegistry",
+    "PendingQueue",
+    "SearchIndex",
+    "variable_document",
 ]
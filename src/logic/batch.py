@@ -0,0 +1,204 @@
+"""
+Description: Batch Patch Engine for Dictionary Forge
+Applies one opt-in patch (root fields plus nested section fields) to a selection of variables and
+runs the coherence cascade on the result. A patched variable is a PatchOverlay: a read-only view that
+lazily merges the patch over the untouched original, so a preview allocates only the changed keys.
+The preview is cached until the registry, the selection or the patch changes; a commit materializes
+new records that share every untouched section with the originals, persists them in one store
+transaction and swaps them into the registry.
+"""
+
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from .coherence import PRUNABLE_SECTIONS, hidden_fields
+
+
+def empty_patch():
+    """A patch that changes nothing: {"root": {field: value}, "nested": {section: {field: value}}}."""
+    return {"root": {}, "nested": {}}
+
+
+def patch_key(patch):
+    """Hashable, order-independent form of a patch (sections without fields are dropped)."""
+    root = tuple(sorted(patch.get("root", {}).items()))
+    nested = tuple(
+        (section, tuple(sorted(fields.items())))
+        for section, fields in sorted(patch.get("nested", {}).items())
+        if fields
+    )
+    return root, nested
+
+
+def patch_size(patch):
+    """Number of field updates a patch defines."""
+    root, nested = patch_key(patch)
+    return len(root) + sum(len(fields) for _, fields in nested)
+
+
+class PatchOverlay(Mapping):
+    """
+    Read-only view of `base` with `changes` laid over it and `removed` keys hidden. Changed sections
+    are nested overlays; materialize() turns the view into a plain dict holding the untouched values
+    of `base` (not copies of them).
+    """
+
+    __slots__ = ("base", "changes", "removed")
+
+    def __init__(self, base, changes, removed=frozenset()):
+        self.base = base
+        self.changes = changes
+        self.removed = removed
+
+    def __getitem__(self, key):
+        if key in self.removed:
+            raise KeyError(key)
+        if key in self.changes:
+            return self.changes[key]
+        return self.base[key]
+
+    def __contains__(self, key):
+        return key not in self.removed and (key in self.changes or key in self.base)
+
+    def __iter__(self):
+        for key in self.base:
+            if key not in self.removed:
+                yield key
+        for key in self.changes:
+            if key not in self.base and key not in self.removed:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"PatchOverlay({self.materialize()!r})"
+
+    def materialize(self):
+        """The patched record as a new dict; nested overlays are materialized, other values shared."""
+        removed = self.removed
+        record = {k: v for k, v in self.base.items() if k not in removed} if removed else dict(self.base)
+        for key, value in self.changes.items():
+            if key not in removed:
+                record[key] = value.materialize() if isinstance(value, PatchOverlay) else value
+        return record
+
+
+def apply_patch(variable, root, nested, hidden=None, fields_by_section=None):
+    """
+    Returns (PatchOverlay, pruned keys) for one variable without touching it: `root` and `nested`
+    are the items of a patch_key. `hidden` (cell -> hidden fields) and `fields_by_section` (section ->
+    patched fields) are memos shared across calls, so a batch reuses one mapping per section.
+    """
+    if hidden is None:
+        hidden = {}
+    if fields_by_section is None:
+        fields_by_section = {}
+    changes = dict(root)
+    for section, fields in nested:
+        patched_fields = fields_by_section.get(section)
+        if patched_fields is None:
+            patched_fields = fields_by_section[section] = dict(fields)
+        changes[section] = PatchOverlay(variable.get(section) or {}, patched_fields)
+
+    # Coherence cascade: incompatible keys are hidden by the overlay, the original section is kept
+    cell = (
+        changes.get("analytical_type", variable.get("analytical_type", "continuous")),
+        changes.get("data_type", variable.get("data_type", "float64")),
+    )
+    doomed_keys = hidden.get(cell)
+    if doomed_keys is None:
+        doomed_keys = hidden[cell] = hidden_fields(*cell)
+    pruned = []
+    for section in PRUNABLE_SECTIONS:
+        if section in changes:
+            # Freshly patched section: the overlay is clean, so only its two layers need checking
+            overlay = changes[section]
+            if doomed_keys.isdisjoint(overlay.base) and doomed_keys.isdisjoint(overlay.changes):
+                continue
+            pruned.extend(k for k in overlay if k in doomed_keys)
+            overlay.removed = doomed_keys
+        else:
+            section_data = variable.get(section)
+            if not section_data or doomed_keys.isdisjoint(section_data):
+                continue
+            pruned.extend(k for k in section_data if k in doomed_keys)
+            changes[section] = PatchOverlay(section_data, {}, doomed_keys)
+    return PatchOverlay(variable, changes), pruned
+
+
+class BatchPreview(NamedTuple):
+    """Patched records (PatchOverlay views) of a selection, valid for one registry revision."""
+
+    revision: int
+    variable_ids: tuple
+    variables: list
+    pruned: list
+
+    @property
+    def total_pruned(self):
+        return sum(len(keys) for keys in self.pruned)
+
+    def pruning_details(self):
+        """(name, pruned keys) of every variable the cascade touched."""
+        return [(v.get("name"), keys) for v, keys in zip(self.variables, self.pruned, strict=True) if keys]
+
+
+class BatchPatchEngine:
+    """
+    Per-session batch editor backend. Reruns that keep the registry revision, the selection and
+    the patch unchanged (e.g. reviewing the same preview) return the cached BatchPreview as is.
+    """
+
+    __slots__ = ("_key", "_preview")
+
+    def __init__(self):
+        self._key = None
+        self._preview = None
+
+    def preview(self, registry, variable_ids, patch):
+        """
+        Patches the selected variables (unknown ids are skipped) in selection order.
+        The registry is left untouched until commit().
+        """
+        key = (registry.revision, tuple(variable_ids), patch_key(patch))
+        if key == self._key:
+            return self._preview
+
+        root, nested = key[2]
+        hidden, fields_by_section = {}, {}
+        ids, variables, pruned = [], [], []
+        for variable_id in key[1]:
+            position = registry.index_of_id(variable_id)
+            if position is None:
+                continue
+            patched, keys = apply_patch(registry[position], root, nested, hidden, fields_by_section)
+            ids.append(variable_id)
+            variables.append(patched)
+            pruned.append(keys)
+
+        self._key = key
+        self._preview = BatchPreview(registry.revision, tuple(ids), variables, pruned)
+        return self._preview
+
+    def commit(self, registry, preview, save=None):
+        """
+        Applies a preview as one transaction: the overlays are materialized and `save(*variables)`
+        (e.g. the project autosave) runs first, so the registry is only updated once the store
+        accepted every record. Returns the number of variables replaced.
+        """
+        if preview.revision != registry.revision:
+            raise ValueError("The dictionary changed since this preview was computed; review the batch again.")
+        positions = [registry.index_of_id(variable_id) for variable_id in preview.variable_ids]
+        variables = [overlay.materialize() for overlay in preview.variables]
+        if save is not None and variables:
+            save(*variables)
+        for position, variable in zip(positions, variables, strict=True):
+            registry[position] = variable
+        self.reset()
+        return len(positions)
+
+    def reset(self):
+        """Drops the cached preview."""
+        self._key = None
+        self._preview = None
@@ -4,51 +4,47 @@ Handles storage, retrieval, and destructive state injection for metadata standar
 Part of the 'logic' module refactor.
 """
 
-import json
 import os
 
 import streamlit as st
-import yaml
+
+from constants import ROOT_DIR
+
+from .config_cache import load_config
+from .file_store import open_store
+
+STANDARD_TEMPLATES_PATH = os.path.join(ROOT_DIR, "config", "templates_standard.yaml")
+USER_TEMPLATES_PATH = os.path.join(ROOT_DIR, "config", "templates_user.json")
 
 
 def load_master_schema(config_path):
     """
-    Loads the master YAML blueprint defining the schema structure.
+    Loads the master YAML blueprint defining the schema structure (cached, read-only).
     """
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
 
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return load_config(config_path)
 
 
 def load_all_templates(
-    standard_path="config/templates_standard.yaml",
-    user_path="config/templates_user.json",
+    standard_path=STANDARD_TEMPLATES_PATH,
+    user_path=USER_TEMPLATES_PATH,
 ):
     """
     Merges project-standard templates with custom user blueprints.
+    Both sources are cached until their files change; the templates themselves are read-only.
     """
     all_templates = {}
 
     # 1. Load Standard Blueprints (Immutable YAML)
     if os.path.exists(standard_path):
-        with open(standard_path) as f:
-            std_data = yaml.safe_load(f)
-            if std_data and "templates" in std_data:
-                all_templates.update(std_data["templates"])
-
-    # 2. Load User-Defined Blueprints (Mutable JSON)
-    if os.path.exists(user_path):
-        os.makedirs(os.path.dirname(user_path), exist_ok=True)
-
-        with open(user_path) as f:
-            try:
-                user_data = json.load(f)
-                if user_data and "user_templates" in user_data:
-                    all_templates.update(user_data["user_templates"])
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        std_data = load_config(standard_path)
+        if std_data and "templates" in std_data:
+            all_templates.update(std_data["templates"])
+
+    # 2. Load User-Defined Blueprints (Mutable JSON + save journal)
+    all_templates.update(user_template_store(user_path).load())
 
     return all_templates
 
@@ -87,7 +83,12 @@ def apply_template_to_state(template_data, fid):
                     st.session_state[f"{form_prefix}{section}_{field}"] = val
 
 
-def save_user_template(template_name, v_inputs, user_path="config/templates_user.json"):
+def user_template_store(user_path=USER_TEMPLATES_PATH):
+    """The shared journaled store behind the user blueprints file."""
+    return open_store(user_path, section="user_templates")
+
+
+def save_user_template(template_name, v_inputs, user_path=USER_TEMPLATES_PATH):
     """
     Persists a generic version of the current form as a reusable blueprint.
     """
@@ -101,19 +102,6 @@ def save_user_template(template_name, v_inputs, user_path="config/templates_user
 
     new_template["label"] = template_name
 
-    # Load existing user data or initialize
-    os.makedirs(os.path.dirname(user_path), exist_ok=True)
-    data = {"user_templates": {}}
-    if os.path.exists(user_path):
-        with open(user_path) as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                pass
-
-    # Slugify the name for the key and write back
+    # Slugify the name for the key and append it to the store (no read-modify-write of the file)
     template_id = template_name.lower().replace(" ", "_")
-    data["user_templates"][template_id] = new_template
-
-    with open(user_path, "w") as f:
-        json.dump(data, f, indent=4)
+    user_template_store(user_path).put(template_id, new_template)
@@ -4,6 +4,18 @@ Handles data type filtering, role enforcement, and context-aware UI logic.
 Part of the 'logic' module refactor.
 """
 
+import os
+from functools import lru_cache
+
+from constants import ROOT_DIR
+
+from .serialization import load_yaml
+
+COHERENCE_RULES_PATH = os.path.join(ROOT_DIR, "config", "coherence_rules.yaml")
+
+# Nested sections subject to the coherence cascade
+PRUNABLE_SECTIONS = ("constraints", "cleaning", "governance", "database_mapping")
+
 
 def get_filtered_data_types(analytical_type):
     """
@@ -52,131 +64,131 @@ def get_filtered_roles(analytical_type, data_type=None):
 def is_field_visible(field_name, analytical_type, data_type=None):
     """
     Determines if a metadata field is applicable based on the technical context.
+    Resolved against the precompiled visibility matrix (see config/coherence_rules.yaml).
     """
-    if field_name in ["plot_color", "formatting"]:
-        return False
-
-    if analytical_type in ["continuous", "discrete"]:
-        if field_name in [
-            "allowed_values",
-            "regex_pattern",
-            "ordinal_mapping",
-            "text_normalization",
-            "encoding_strategy",
-        ]:
-            return False
+    matrix = _visibility_matrix()
+    bit = matrix.field_bits.get(field_name)
+    if bit is None:
+        return True
+    return not matrix.hidden_mask(analytical_type, data_type) & bit
 
-    if analytical_type == "binary":
-        forbidden = [
-            "min_value",
-            "max_value",
-            "regex_pattern",
-            "allowed_values",
-            "ordinal_mapping",
-            "unique",
-            "outlier_strategy",
-            "outlier_threshold",
-            "standardization_strategy",
-            "infinite_value_handling",
-            "text_normalization",
-        ]
-        if field_name in forbidden:
-            return False
 
-    if analytical_type == "nominal":
-        if field_name in [
-            "outlier_strategy",
-            "outlier_threshold",
-            "ordinal_mapping",
-            "standardization_strategy",
-            "infinite_value_handling",
-            "text_normalization",
-        ]:
-            return False
+def visible_fields(analytical_type, data_type=None):
+    """
+    Returns the rule-governed fields that remain visible for an (analytical_type, data_type) pair.
+    Fields not mentioned in the rules file are always visible and therefore not listed.
+    """
+    return _visibility_matrix().visible_set(analytical_type, data_type)
 
-    if analytical_type == "text":
-        if field_name in [
-            "outlier_strategy",
-            "outlier_threshold",
-            "ordinal_mapping",
-            "standardization_strategy",
-            "infinite_value_handling",
-            "encoding_strategy",
-        ]:
-            return False
-
-    if analytical_type == "time_index":
-        forbidden = [
-            "allowed_values",
-            "regex_pattern",
-            "outlier_strategy",
-            "outlier_threshold",
-            "ordinal_mapping",
-            "standardization_strategy",
-            "infinite_value_handling",
-            "text_normalization",
-            "encoding_strategy",
-        ]
-        if field_name in forbidden:
-            return False
-
-    if analytical_type == "ordinal":
-        if field_name in [
-            "regex_pattern",
-            "outlier_strategy",
-            "outlier_threshold",
-            "standardization_strategy",
-            "infinite_value_handling",
-            "text_normalization",
-        ]:
-            return False
-    elif field_name == "ordinal_mapping":
-        return False
-
-    if field_name in ["standardization_strategy", "infinite_value_handling"] and analytical_type != "continuous":
-        return False
-
-    if field_name == "text_normalization" and analytical_type != "text":
-        return False
-
-    if field_name == "encoding_strategy" and analytical_type not in [
-        "nominal",
-        "ordinal",
-        "binary",
-    ]:
-        return False
-
-    if data_type:
-        if data_type == "string" and field_name in [
-            "outlier_strategy",
-            "outlier_threshold",
-            "ordinal_mapping",
-            "standardization_strategy",
-        ]:
-            return False
-        if data_type == "category" and field_name in [
-            "min_value",
-            "max_value",
-            "regex_pattern",
-            "outlier_strategy",
-            "outlier_threshold",
-            "standardization_strategy",
-        ]:
-            return False
-        if data_type == "bool" and field_name in [
-            "min_value",
-            "max_value",
-            "regex_pattern",
-            "allowed_values",
-            "unique",
-            "outlier_strategy",
-            "outlier_threshold",
-            "ordinal_mapping",
-            "standardization_strategy",
-        ]:
-            return False
-
-    return True
+
+def hidden_fields(analytical_type, data_type=None):
+    """
+    Returns the rule-governed fields hidden for an (analytical_type, data_type) pair,
+    i.e. the keys the coherence cascade prunes from a variable of that type.
+    """
+    return _visibility_matrix().hidden_set(analytical_type, data_type)
+
+
+def prune(variables, sections=PRUNABLE_SECTIONS):
+    """
+    Bulk coherence cascade: removes, in place, every nested metadata key that is not
+    visible under each variable's own analytical/data type.
+    Returns one list of pruned keys per variable (same order as the input).
+    """
+    matrix = _visibility_matrix()
+    hidden_by_cell = {}
+    pruned_report = []
+
+    for var in variables:
+        cell = (var.get("analytical_type", "continuous"), var.get("data_type", "float64"))
+        hidden = hidden_by_cell.get(cell)
+        if hidden is None:
+            hidden = hidden_by_cell[cell] = matrix.hidden_set(*cell)
+
+        pruned = []
+        for section in sections:
+            section_data = var.get(section)
+            # Fast path: most sections hold no incompatible keys at all
+            if not section_data or hidden.isdisjoint(section_data):
+                continue
+            doomed = [k for k in section_data if k in hidden]
+            for k in doomed:
+                del section_data[k]
+            pruned.extend(doomed)
+        pruned_report.append(pruned)
+
+    return pruned_report
+
+
+class _VisibilityMatrix:
+    """
+    Frozen bitset matrix compiled from the declarative visibility rules.
+    Each governed field owns one bit; every (analytical_type, data_type) cell stores
+    the mask of hidden fields. Unknown types collapse onto a shared fallback cell.
+    """
+
+    __slots__ = ("field_bits", "_at_axis", "_dt_axis", "_masks", "_hidden_sets", "_visible_sets")
+
+    def __init__(self, rules):
+        always_hidden = rules.get("always_hidden", [])
+        by_at = rules.get("hidden_by_analytical_type", {})
+        exclusive = rules.get("exclusive_to_analytical_type", {})
+        by_dt = rules.get("hidden_by_data_type", {})
+
+        # 1. Field universe (stable order of first appearance)
+        fields = list(always_hidden)
+        for group in (*by_at.values(), exclusive.keys(), *by_dt.values()):
+            fields.extend(group)
+        self.field_bits = {f: 1 << i for i, f in enumerate(dict.fromkeys(fields))}
+
+        def mask_of(names):
+            mask = 0
+            for name in names:
+                mask |= self.field_bits[name]
+            return mask
+
+        # 2. Axes: every type named in the rules plus a None fallback bucket
+        self._at_axis = frozenset(by_at) | frozenset(at for ats in exclusive.values() for at in ats)
+        self._dt_axis = frozenset(by_dt)
+
+        # 3. Compile every cell once
+        self._masks = {}
+        self._hidden_sets = {}
+        self._visible_sets = {}
+        bits_to_field = {bit: f for f, bit in self.field_bits.items()}
+        full_mask = mask_of(self.field_bits)
+
+        for at in (*self._at_axis, None):
+            at_mask = mask_of(always_hidden) | mask_of(by_at.get(at, []))
+            at_mask |= mask_of(f for f, allowed in exclusive.items() if at not in allowed)
+            for dt in (*self._dt_axis, None):
+                mask = at_mask | mask_of(by_dt.get(dt, []))
+                self._masks[(at, dt)] = mask
+                self._hidden_sets[(at, dt)] = frozenset(f for bit, f in bits_to_field.items() if mask & bit)
+                self._visible_sets[(at, dt)] = frozenset(
+                    f for bit, f in bits_to_field.items() if (full_mask & ~mask) & bit
+                )
+
+    def _cell(self, analytical_type, data_type):
+        at = analytical_type if analytical_type in self._at_axis else None
+        dt = data_type if data_type in self._dt_axis else None
+        return at, dt
+
+    def hidden_mask(self, analytical_type, data_type):
+        return self._masks[self._cell(analytical_type, data_type)]
+
+    def hidden_set(self, analytical_type, data_type):
+        return self._hidden_sets[self._cell(analytical_type, data_type)]
+
+    def visible_set(self, analytical_type, data_type):
+        return self._visible_sets[self._cell(analytical_type, data_type)]
+
+
+@lru_cache(maxsize=1)
+def _visibility_matrix():
+    """Loads and compiles the visibility rules file exactly once per process."""
+    with open(COHERENCE_RULES_PATH) as f:
+        return _VisibilityMatrix(load_yaml(f) or {})
 
 
 def get_dynamic_label(field_name, analytical_type):
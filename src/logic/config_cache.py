@@ -0,0 +1,126 @@
+"""
+Description: Stat-Validated Configuration Cache for Dictionary Forge
+Master schema, template and regulation files are parsed once and re-parsed only when their
+modification time or size changes, so reruns cost one os.stat per file. Parsed values are frozen:
+every session shares the same objects, and accidental in-place edits raise instead of leaking.
+"""
+
+import copy
+import os
+
+import yaml
+
+from .serialization import YAML_DUMPER, load_json, load_yaml
+
+
+# =============================================================================
+# 1. IMMUTABLE CONTAINERS
+# =============================================================================
+def _read_only(self, *args, **kwargs):
+    raise TypeError("Cached configuration is read-only; work on a copy (copy.deepcopy or thaw).")
+
+
+class FrozenDict(dict):
+    """A dict that rejects mutation. Copies (copy.copy / copy.deepcopy) are ordinary mutable dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """A list that rejects mutation. Copies (copy.copy / copy.deepcopy) are ordinary mutable lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(value):
+    """Recursively converts dicts and lists to their read-only counterparts."""
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Mutable deep copy of a frozen value."""
+    return copy.deepcopy(value)
+
+
+# Frozen values dump as plain YAML mappings/sequences (JSON encoders accept the subclasses natively)
+for _dumper in {YAML_DUMPER, yaml.Dumper, yaml.SafeDumper}:
+    yaml.add_representer(FrozenDict, lambda dumper, data: dumper.represent_dict(data), Dumper=_dumper)
+    yaml.add_representer(FrozenList, lambda dumper, data: dumper.represent_list(data), Dumper=_dumper)
+
+
+# =============================================================================
+# 2. FILE CACHE
+# =============================================================================
+def read_yaml(path):
+    with open(path) as f:
+        return load_yaml(f)
+
+
+def read_json(path):
+    with open(path) as f:
+        return load_json(f)
+
+
+class ConfigCache:
+    """Parsed files keyed by path, each validated against its (mtime_ns, size) signature."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries = {}
+
+    def load(self, path, parser=read_yaml):
+        """
+        Frozen result of `parser(path)`, re-parsed only when the file changed since the last call.
+        Raises FileNotFoundError if `path` does not exist; parser errors are not cached.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size, parser)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        value = freeze(parser(path))
+        self._entries[path] = (signature, value)
+        return value
+
+    def invalidate(self, path=None):
+        """Forgets one path (or everything), forcing the next load to re-parse."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(path, None)
+
+
+# Process-wide cache shared by every session
+_config_cache = ConfigCache()
+
+
+def load_config(path, parser=read_yaml):
+    """Loads a configuration file through the shared stat-validated cache."""
+    return _config_cache.load(os.path.abspath(path), parser)
@@ -0,0 +1,540 @@
+"""
+Description: Multi-Dialect DDL Compiler for Dictionary Forge
+Lowers dictionary variables into an intermediate schema model (tables, columns, checks, foreign keys)
+and renders it through pluggable dialect backends. Output is deterministic: schemas and tables are
+emitted in name order (referenced tables first), columns in dictionary order.
+"""
+
+import hashlib
+import math
+import re
+from typing import NamedTuple
+
+DEFAULT_TABLE = "public_schema_table"
+DEFAULT_DIALECT = "postgresql"
+
+# PostgreSQL's identifier limit (MySQL allows 64); longer constraint names are hashed down
+MAX_IDENTIFIER_LENGTH = 63
+
+# Default length for string/category columns without an integer max_value
+DEFAULT_VARCHAR_LENGTH = 255
+
+# Python/Pandas data_type -> dialect-neutral logical type
+LOGICAL_TYPES = {
+    "int64": "integer",
+    "float64": "float",
+    "bool": "boolean",
+    "datetime64": "timestamp",
+    "string": "varchar",
+    "category": "varchar",
+}
+NUMERIC_TYPES = ("integer", "float")
+
+# "schema.table(column)" or "table(column)"; the column part is optional
+_REFERENCE_PATTERN = re.compile(r"^\s*([A-Za-z_][\w.]*)\s*(?:\(\s*([A-Za-z_]\w*)\s*\))?\s*$")
+_PLAIN_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Words quoted in every dialect so generated names never collide with the grammar
+RESERVED_WORDS = frozenset(
+    """all and as asc between by case check column constraint create current_date current_time
+    current_timestamp current_user date default desc distinct else end exists false for foreign from
+    grant group having in index interval is join key left like limit not null offset on or order
+    outer over partition primary range references right rows select table then time timestamp to
+    true union unique user using values when where window with""".split()
+)
+
+
+# =============================================================================
+# 1. INTERMEDIATE SCHEMA MODEL
+# =============================================================================
+class Column(NamedTuple):
+    name: str
+    logical_type: str
+    length: int | None = None
+    nullable: bool = True
+    unique: bool = False
+    primary_key: bool = False
+    allowed_values: tuple = ()
+    min_value: float | None = None
+    max_value: float | None = None
+
+
+class ForeignKey(NamedTuple):
+    column: str
+    ref_table: str
+    ref_column: str | None
+
+
+class Table(NamedTuple):
+    name: str
+    columns: tuple
+    foreign_keys: tuple
+
+    @property
+    def schema(self):
+        return _schema_of(self.name)
+
+    @property
+    def primary_key(self):
+        return tuple(c.name for c in self.columns if c.primary_key)
+
+
+class Schema(NamedTuple):
+    tables: tuple
+
+    @property
+    def schemas(self):
+        return sorted({t.schema for t in self.tables if t.schema})
+
+
+def _schema_of(table_name):
+    return table_name.rpartition(".")[0] or None
+
+
+def lower_variable(var):
+    """Lowers one dictionary variable into (table name, Column, ForeignKey or None)."""
+    db_mapping = var.get("database_mapping") or {}
+    table_name = str(db_mapping.get("target_table") or "").strip() or DEFAULT_TABLE
+    column = _build_column(var, db_mapping)
+    reference = db_mapping.get("foreign_key_reference")
+    match = _REFERENCE_PATTERN.match(str(reference)) if reference else None
+    foreign_key = ForeignKey(column.name, match.group(1), match.group(2)) if match else None
+    return table_name, column, foreign_key
+
+
+def build_schema(variables):
+    """Lowers dictionary variables into a Schema. Later duplicates of a column name in a table are skipped."""
+    grouped = {}
+    for var in variables:
+        table_name, column, foreign_key = lower_variable(var)
+        entry = grouped.get(table_name)
+        if entry is None:
+            entry = grouped[table_name] = ({}, [])
+        columns, foreign_keys = entry
+
+        if column.name in columns:
+            continue
+        columns[column.name] = column
+        if foreign_key is not None:
+            foreign_keys.append(foreign_key)
+
+    return assemble_schema(
+        Table(name, tuple(columns.values()), tuple(sorted(foreign_keys)))
+        for name, (columns, foreign_keys) in grouped.items()
+    )
+
+
+def assemble_schema(tables):
+    """Schema from Table models, in deterministic dependency/name order."""
+    return Schema(_dependency_order(list(tables)))
+
+
+def _build_column(var, db_mapping):
+    name = str(db_mapping.get("target_column") or var.get("name") or "unknown_column").strip()
+    name = name.replace(" ", "_").lower()
+    constraints = var.get("constraints") or {}
+    logical_type = LOGICAL_TYPES.get(var.get("data_type"), "text")
+    max_value = constraints.get("max_value")
+
+    length = None
+    if logical_type == "varchar":
+        valid = type(max_value) is int and max_value > 0
+        length = max_value if valid else DEFAULT_VARCHAR_LENGTH
+
+    allowed = constraints.get("allowed_values")
+    allowed = tuple(allowed) if isinstance(allowed, list) else ()
+    min_value = None
+    if logical_type in NUMERIC_TYPES and not allowed:
+        min_value, max_value = _number(constraints.get("min_value")), _number(max_value)
+    else:
+        max_value = None
+
+    return Column(
+        name,
+        logical_type,
+        length,
+        constraints.get("nullable") is not False,
+        bool(constraints.get("unique")),
+        bool(db_mapping.get("is_primary_key")),
+        allowed,
+        min_value,
+        max_value,
+    )
+
+
+def _number(value):
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _dependency_order(tables):
+    """Name-sorted tables, with each table emitted after the tables it references."""
+    by_name = {t.name: t for t in tables}
+    ordered, visiting, done = [], set(), set()
+
+    def visit(table):
+        if table.name in done or table.name in visiting:
+            return
+        visiting.add(table.name)
+        for fk in table.foreign_keys:
+            if fk.ref_table in by_name:
+                visit(by_name[fk.ref_table])
+        visiting.discard(table.name)
+        done.add(table.name)
+        ordered.append(table)
+
+    for name in sorted(by_name):
+        visit(by_name[name])
+    return tuple(ordered)
+
+
+# =============================================================================
+# 2. DIALECT BACKENDS
+# =============================================================================
+class Dialect:
+    """
+    Base backend (ANSI/PostgreSQL flavoured). Subclasses override the type map and the
+    capability flags; rendering of the model itself lives in compile_ddl.
+    """
+
+    label = "PostgreSQL"
+    quote_char = '"'
+    # How a quote character inside an identifier is written (default: doubled)
+    escaped_quote = None
+    types = {
+        "integer": "BIGINT",
+        "float": "DOUBLE PRECISION",
+        "boolean": "BOOLEAN",
+        "timestamp": "TIMESTAMP",
+        "varchar": "VARCHAR({length})",
+        "text": "TEXT",
+    }
+    supports_schemas = True
+    supports_checks = True
+    supports_unique = True
+    # Appended to PRIMARY KEY / FOREIGN KEY clauses (e.g. BigQuery's NOT ENFORCED)
+    constraint_suffix = ""
+    inline_primary_key = True
+    cross_schema_foreign_keys = True
+    # ALTER TABLE support used by migrations (logic.migrations)
+    alter_columns = True
+    alter_constraints = True
+
+    def quote(self, identifier):
+        if _PLAIN_IDENTIFIER.match(identifier) and identifier not in RESERVED_WORDS:
+            return identifier
+        q = self.quote_char
+        return f"{q}{identifier.replace(q, self.escaped_quote or q + q)}{q}"
+
+    def table_name(self, name):
+        return ".".join(self.quote(part) for part in name.split("."))
+
+    def column_type(self, column):
+        return self.types[column.logical_type].format(length=column.length)
+
+    def literal(self, value, numeric=False):
+        if numeric:
+            number = _number(value)
+            if number is not None:
+                return _format_number(number)
+        text = str(value).replace("'", "''")
+        return f"'{text}'"
+
+    def column_definition(self, column):
+        definition = f"{self.quote(column.name)} {self.column_type(column)}"
+        return definition if column.nullable else f"{definition} NOT NULL"
+
+    # --- ALTER TABLE statements (None when the engine cannot express the change) ---
+    def add_column(self, table_name, column):
+        return f"ALTER TABLE {self.table_name(table_name)} ADD COLUMN {self.column_definition(column)};"
+
+    def drop_column(self, table_name, column_name):
+        return f"ALTER TABLE {self.table_name(table_name)} DROP COLUMN {self.quote(column_name)};"
+
+    def rename_column(self, table_name, old_name, new_name):
+        table, old, new = self.table_name(table_name), self.quote(old_name), self.quote(new_name)
+        return f"ALTER TABLE {table} RENAME COLUMN {old} TO {new};"
+
+    def alter_type(self, table_name, column):
+        if not self.alter_columns:
+            return None
+        table, name = self.table_name(table_name), self.quote(column.name)
+        return f"ALTER TABLE {table} ALTER COLUMN {name} TYPE {self.column_type(column)};"
+
+    def alter_nullable(self, table_name, column):
+        if not self.alter_columns:
+            return None
+        action = "DROP NOT NULL" if column.nullable else "SET NOT NULL"
+        return f"ALTER TABLE {self.table_name(table_name)} ALTER COLUMN {self.quote(column.name)} {action};"
+
+    def add_constraint(self, table_name, constraint):
+        if not self.alter_constraints:
+            return None
+        return f"ALTER TABLE {self.table_name(table_name)} ADD {constraint.definition};"
+
+    def drop_constraint(self, table_name, constraint):
+        if not self.alter_constraints:
+            return None
+        return f"ALTER TABLE {self.table_name(table_name)} DROP CONSTRAINT {self.quote(constraint.name)};"
+
+    def drop_table(self, table_name):
+        return f"DROP TABLE {self.table_name(table_name)};"
+
+
+class PostgresDialect(Dialect):
+    pass
+
+
+class MySQLDialect(Dialect):
+    label = "MySQL"
+    quote_char = "`"
+    types = {**Dialect.types, "float": "DOUBLE", "timestamp": "DATETIME"}
+
+    def literal(self, value, numeric=False):
+        # Backslashes are escapes inside MySQL string literals
+        if not numeric or _number(value) is None:
+            value = str(value).replace("\\", "\\\\")
+        return super().literal(value, numeric)
+
+    def alter_type(self, table_name, column):
+        # MODIFY restates the whole definition, covering type and nullability at once
+        return f"ALTER TABLE {self.table_name(table_name)} MODIFY COLUMN {self.column_definition(column)};"
+
+    alter_nullable = alter_type
+
+    def drop_constraint(self, table_name, constraint):
+        kind = {"unique": "INDEX", "check": "CHECK", "foreign_key": "FOREIGN KEY"}[constraint.kind]
+        return f"ALTER TABLE {self.table_name(table_name)} DROP {kind} {self.quote(constraint.name)};"
+
+
+class SQLiteDialect(Dialect):
+    label = "SQLite"
+    types = {
+        "integer": "INTEGER",
+        "float": "REAL",
+        "boolean": "INTEGER",
+        "timestamp": "TEXT",
+        "varchar": "VARCHAR({length})",
+        "text": "TEXT",
+    }
+    supports_schemas = False
+    alter_columns = False
+    alter_constraints = False
+
+    def table_name(self, name):
+        # No schemas: a qualified name becomes a single (quoted) identifier
+        return self.quote(name)
+
+
+class DuckDBDialect(Dialect):
+    label = "DuckDB"
+    types = {**Dialect.types, "float": "DOUBLE"}
+    cross_schema_foreign_keys = False
+    alter_constraints = False
+
+
+class SnowflakeDialect(Dialect):
+    label = "Snowflake"
+    types = {**Dialect.types, "integer": "NUMBER(38,0)", "float": "FLOAT", "timestamp": "TIMESTAMP_NTZ"}
+    supports_checks = False
+
+    def alter_type(self, table_name, column):
+        table, name = self.table_name(table_name), self.quote(column.name)
+        return f"ALTER TABLE {table} ALTER COLUMN {name} SET DATA TYPE {self.column_type(column)};"
+
+
+class BigQueryDialect(Dialect):
+    label = "BigQuery"
+    quote_char = "`"
+    types = {
+        "integer": "INT64",
+        "float": "FLOAT64",
+        "boolean": "BOOL",
+        "timestamp": "DATETIME",
+        "varchar": "STRING({length})",
+        "text": "STRING",
+    }
+    supports_checks = False
+    supports_unique = False
+    constraint_suffix = " NOT ENFORCED"
+    inline_primary_key = False
+    escaped_quote = "\\`"
+
+    alter_type = SnowflakeDialect.alter_type
+
+    def alter_nullable(self, table_name, column):
+        # Columns can be relaxed to NULLABLE but never tightened in place
+        return super().alter_nullable(table_name, column) if column.nullable else None
+
+
+DIALECTS = {
+    "postgresql": PostgresDialect(),
+    "mysql": MySQLDialect(),
+    "sqlite": SQLiteDialect(),
+    "duckdb": DuckDBDialect(),
+    "snowflake": SnowflakeDialect(),
+    "bigquery": BigQueryDialect(),
+}
+
+
+def register_dialect(name, dialect):
+    """Adds (or replaces) a backend selectable by name in compile_ddl."""
+    DIALECTS[name] = dialect
+
+
+def get_dialect(dialect):
+    if isinstance(dialect, Dialect):
+        return dialect
+    try:
+        return DIALECTS[dialect]
+    except KeyError:
+        raise ValueError(f"Unknown SQL dialect '{dialect}'. Available: {', '.join(sorted(DIALECTS))}") from None
+
+
+# =============================================================================
+# 3. RENDERING
+# =============================================================================
+def compile_ddl(source, dialect=DEFAULT_DIALECT):
+    """Renders a Schema (or an iterable of dictionary variables) as a DDL script for `dialect`."""
+    schema = source if isinstance(source, Schema) else build_schema(source)
+    backend = get_dialect(dialect)
+
+    out = [f"-- Auto-generated {backend.label} Schema by Dictionary Forge\n"]
+    if backend.supports_schemas:
+        out.extend(f"CREATE SCHEMA IF NOT EXISTS {backend.quote(name)};\n" for name in schema.schemas)
+    for table in schema.tables:
+        out.append(render_table(table, backend))
+    return "\n".join(out)
+
+
+class Constraint(NamedTuple):
+    kind: str
+    name: str
+    column: str
+    definition: str
+
+
+def constraint_name(prefix, table_name, column_name):
+    """Deterministic constraint name (e.g. ck_orders_amount) that fits the 63-character identifier limit."""
+    name = f"{prefix}_{table_name.rpartition('.')[2]}_{column_name}"
+    if len(name) > MAX_IDENTIFIER_LENGTH:
+        digest = hashlib.sha1(name.encode()).hexdigest()[:8]
+        name = f"{name[: MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+    return name
+
+
+def column_constraints(table_name, column, foreign_key, backend):
+    """Named UNIQUE/CHECK/FOREIGN KEY constraints for one column, as supported by `backend`."""
+    constraints = (
+        unique_constraint(table_name, column, backend),
+        check_constraint(table_name, column, backend),
+        foreign_key_constraint(table_name, foreign_key, backend) if foreign_key is not None else None,
+    )
+    return [c for c in constraints if c is not None]
+
+
+def unique_constraint(table_name, column, backend):
+    if not column.unique or column.primary_key or not backend.supports_unique:
+        return None
+    name = constraint_name("uq", table_name, column.name)
+    quote = backend.quote
+    return Constraint("unique", name, column.name, f"CONSTRAINT {quote(name)} UNIQUE ({quote(column.name)})")
+
+
+def check_constraint(table_name, column, backend):
+    if not backend.supports_checks or not _has_check(column):
+        return None
+    name = constraint_name("ck", table_name, column.name)
+    expression = _check_expression(column, backend.quote(column.name), backend)
+    return Constraint("check", name, column.name, f"CONSTRAINT {backend.quote(name)} CHECK ({expression})")
+
+
+def foreign_key_constraint(table_name, foreign_key, backend):
+    if not _foreign_key_supported(table_name, foreign_key, backend):
+        return None
+    quote = backend.quote
+    name = constraint_name("fk", table_name, foreign_key.column)
+    target = backend.table_name(foreign_key.ref_table)
+    if foreign_key.ref_column is not None:
+        target += f" ({quote(foreign_key.ref_column)})"
+    definition = (
+        f"CONSTRAINT {quote(name)} FOREIGN KEY ({quote(foreign_key.column)}) "
+        f"REFERENCES {target}{backend.constraint_suffix}"
+    )
+    return Constraint("foreign_key", name, foreign_key.column, definition)
+
+
+def _foreign_key_supported(table_name, foreign_key, backend):
+    if foreign_key.ref_column is None and backend.constraint_suffix:
+        # Unenforced (informational) keys must name the referenced column
+        return False
+    return backend.cross_schema_foreign_keys or _schema_of(foreign_key.ref_table) == _schema_of(table_name)
+
+
+def render_table(table, backend):
+    """CREATE TABLE statement for one Table model."""
+    backend = get_dialect(backend)
+    quote = backend.quote
+    primary_key = table.primary_key
+    inline_pk = backend.inline_primary_key and len(primary_key) == 1
+    foreign_keys = {fk.column: fk for fk in table.foreign_keys}
+    type_names = {}
+
+    lines, constraints = [], []
+    for column in table.columns:
+        type_key = (column.logical_type, column.length)
+        type_name = type_names.get(type_key)
+        if type_name is None:
+            type_name = type_names[type_key] = backend.column_type(column)
+
+        line = f"    {quote(column.name)} {type_name}"
+        if column.primary_key and inline_pk:
+            line += " PRIMARY KEY"
+        elif not column.nullable:
+            line += " NOT NULL"
+        lines.append(line)
+
+        foreign_key = foreign_keys.get(column.name)
+        if column.unique or foreign_key is not None or _has_check(column):
+            constraints.extend(column_constraints(table.name, column, foreign_key, backend))
+
+    if primary_key and not inline_pk:
+        columns = ", ".join(quote(c) for c in primary_key)
+        lines.append(f"    PRIMARY KEY ({columns}){backend.constraint_suffix}")
+    # Unique and check constraints first, foreign keys last (in column order)
+    constraints.sort(key=lambda c: c.kind == "foreign_key")
+    lines.extend(f"    {c.definition}" for c in constraints)
+
+    body = ",\n".join(lines)
+    notes = "".join(
+        f"-- Foreign key not supported by {backend.label}: {fk.column} -> {fk.ref_table}({fk.ref_column or ''})\n"
+        for fk in table.foreign_keys
+        if not _foreign_key_supported(table.name, fk, backend)
+    )
+    return f"CREATE TABLE {backend.table_name(table.name)} (\n{body}\n);\n{notes}"
+
+
+def _has_check(column):
+    return bool(column.allowed_values) or column.min_value is not None or column.max_value is not None
+
+
+def _check_expression(column, name, backend):
+    if column.allowed_values:
+        numeric = column.logical_type in NUMERIC_TYPES
+        values = ", ".join(backend.literal(v, numeric) for v in column.allowed_values)
+        return f"{name} IN ({values})"
+    bounds = []
+    if column.min_value is not None:
+        bounds.append(f"{name} >= {_format_number(column.min_value)}")
+    if column.max_value is not None:
+        bounds.append(f"{name} <= {_format_number(column.max_value)}")
+    return " AND ".join(bounds)
+
+
+def _format_number(number):
+    return str(int(number)) if number.is_integer() else repr(number)
@@ -0,0 +1,143 @@
+"""
+Description: Content-Addressed Export Cache for Dictionary Forge
+Serialized exports are stored on disk under a hash of the dictionary content (variables + project
+info), so an unchanged dictionary is never re-serialized. Entries are evicted least-recently-used
+once the cache exceeds its size or entry budget. Per-variable digests are memoized by registry
+version, so re-hashing an unchanged dictionary only walks the version table.
+"""
+
+import hashlib
+import os
+import threading
+
+from constants import ROOT_DIR
+
+from .file_store import atomic_write
+from .serialization import dumps_json
+
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, "projects", "export_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 64
+
+# Bump when any export writer changes its output, so stale artifacts are never served
+CACHE_FORMAT_VERSION = "2"
+
+
+def _canonical(value):
+    return dumps_json(value, sort_keys=True, default=str).encode("utf-8")
+
+
+class ContentHasher:
+    """
+    Stable content hash of a dictionary. Variable digests are cached per (variable_id, version) when
+    given a VariableRegistry; plain lists are hashed in full.
+    """
+
+    __slots__ = ("_digests", "_revision", "_info", "_digest")
+
+    def __init__(self):
+        self._digests = {}
+        self._revision = None
+        self._info = None
+        self._digest = None
+
+    def digest(self, variables, project_info):
+        info = _canonical(project_info or {})
+        revision = getattr(variables, "revision", None)
+        if revision is not None and revision == self._revision and info == self._info:
+            return self._digest
+
+        combined = hashlib.sha256(CACHE_FORMAT_VERSION.encode())
+        combined.update(hashlib.sha256(info).digest())
+        if revision is None:
+            for var in variables:
+                combined.update(hashlib.sha256(_canonical(var)).digest())
+        else:
+            digests = {}
+            for var in variables:
+                variable_id = var["variable_id"]
+                version = variables.version_of(variable_id)
+                cached = self._digests.get(variable_id)
+                if cached is None or cached[0] != version:
+                    cached = (version, hashlib.sha256(_canonical(var)).digest())
+                digests[variable_id] = cached
+                combined.update(cached[1])
+            self._digests = digests
+
+        self._revision, self._info, self._digest = revision, info, combined.hexdigest()
+        return self._digest
+
+
+class ExportCache:
+    """On-disk LRU of export artifacts. Safe to share across threads (download callables run off-script)."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, max_entries=DEFAULT_MAX_ENTRIES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """Cached bytes for `key`, or None. A hit refreshes the entry's recency."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key, data):
+        """Stores `data` atomically (temp file + rename), then evicts down to the budget."""
+        atomic_write(self._path(key), data)
+        self._evict()
+
+    def get_or_create(self, key, factory):
+        """Returns the cached artifact, generating and storing it with `factory()` on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = factory()
+            self.put(key, data)
+        return data
+
+    def keys(self):
+        return [e.name for e in self._entries()]
+
+    def _entries(self):
+        """Cache entries, least recently used first."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith(".tmp-"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry))
+                    except FileNotFoundError:
+                        continue
+        entries.sort(key=lambda pair: (pair[0], pair[1].name))
+        return [entry for _, entry in entries]
+
+    def _evict(self):
+        with self._lock:
+            entries = self._entries()
+            sizes = {}
+            for entry in entries:
+                try:
+                    sizes[entry.name] = entry.stat().st_size
+                except FileNotFoundError:
+                    sizes[entry.name] = 0
+            total = sum(sizes.values())
+            count = len(entries)
+            for entry in entries:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                total -= sizes[entry.name]
+                count -= 1
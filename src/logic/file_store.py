@@ -0,0 +1,262 @@
+"""
+Description: Concurrent-Safe File Storage for Dictionary Forge
+Primitives for files shared by every Streamlit session on a server: atomic replacement (write to a
+temporary file, fsync, rename), advisory file locks, and a journaled JSON mapping where each save
+appends one record instead of rewriting the file. The journal is folded back into the base file
+once it grows past a threshold.
+"""
+
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from .config_cache import freeze, load_config, read_json
+from .serialization import JSONDecodeError, dumps_json, loads_json
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only serialize threads of this process
+    fcntl = None
+
+JOURNAL_SUFFIX = ".journal"
+LOCK_SUFFIX = ".lock"
+
+# Journal size that triggers compaction into the base file
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+# Process umask, read once at import: os.umask can only be queried by setting it, which races other threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+# =============================================================================
+# 1. PRIMITIVES
+# =============================================================================
+def atomic_write(path, data):
+    """Replaces `path` with `data` (bytes or str) so readers see either the old or the new file, never a mix."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        # mkstemp creates the file owner-only: keep the target's mode (or the umask default for a new file)
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _target_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _target_mode(path):
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on `path` (through a sibling .lock file), across threads and processes."""
+    lock_path = os.path.abspath(path) + LOCK_SUFFIX
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(lock_path, threading.Lock())
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, "a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+# =============================================================================
+# 2. JOURNALED JSON MAPPING
+# =============================================================================
+def read_journal(path):
+    """Parses a journal into a list of operations; a torn trailing line (crash mid-append) is skipped."""
+    operations = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                operation = loads_json(line)
+            except ValueError:
+                continue
+            if isinstance(operation, dict) and "key" in operation:
+                operations.append(operation)
+    return operations
+
+
+class JournaledStore:
+    """
+    A JSON mapping (optionally nested under `section`, e.g. 'user_templates') stored as a base file
+    plus an append-only journal of put/delete records. Writers hold the file lock; readers never
+    block and get a read-only snapshot, re-read only when either file changed.
+    """
+
+    def __init__(self, path, section=None, compact_bytes=DEFAULT_COMPACT_BYTES):
+        self.path = path
+        self.section = section
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.compact_bytes = compact_bytes
+        self._snapshot = (None, None, None)
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    def load(self):
+        """The current mapping (base file with the journal replayed), read-only."""
+        base = self._cached(self.path, read_json)
+        journal = self._cached(self.journal_path, read_journal)
+        cached_base, cached_journal, merged = self._snapshot
+        if merged is not None and base is cached_base and journal is cached_journal:
+            return merged
+        merged = freeze(_replay(self._section_of(base), journal or ()))
+        self._snapshot = (base, journal, merged)
+        return merged
+
+    def exists(self):
+        return os.path.exists(self.path) or os.path.exists(self.journal_path)
+
+    @staticmethod
+    def _cached(path, parser):
+        try:
+            return load_config(path, parser)
+        except (FileNotFoundError, JSONDecodeError):
+            return None
+
+    def _section_of(self, data):
+        if self.section is not None:
+            data = data.get(self.section) if isinstance(data, dict) else None
+        return data if isinstance(data, dict) else {}
+
+    def _read_fresh(self):
+        """Uncached state, for writers holding the lock."""
+        try:
+            with open(self.path, "rb") as f:
+                base = loads_json(f.read())
+        except (FileNotFoundError, JSONDecodeError):
+            base = None
+        try:
+            journal = read_journal(self.journal_path)
+        except FileNotFoundError:
+            journal = []
+        return _replay(self._section_of(base), journal)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+    def put(self, key, value):
+        """Stores `value` under `key` by appending one journal record."""
+        self._append([{"op": "put", "key": key, "value": value}])
+
+    def delete(self, key):
+        """Removes `key` (a no-op if it is absent)."""
+        self._append([{"op": "delete", "key": key}])
+
+    def rename(self, old_key, new_key, value):
+        """Moves `old_key` to `new_key` with `value` in a single journal write."""
+        operations = [{"op": "put", "key": new_key, "value": value}]
+        if old_key != new_key:
+            operations.insert(0, {"op": "delete", "key": old_key})
+        self._append(operations)
+
+    def replace(self, mapping):
+        """Atomically replaces the whole mapping (and empties the journal)."""
+        with file_lock(self.path):
+            self._write_base(mapping)
+
+    def seed(self, mapping):
+        """Writes `mapping` as the initial content unless the store exists; returns True if it did."""
+        with file_lock(self.path):
+            if self.exists():
+                return False
+            self._write_base(mapping)
+            return True
+
+    def compact(self):
+        """Folds the journal into the base file."""
+        with file_lock(self.path):
+            self._write_base(self._read_fresh())
+
+    def _append(self, operations):
+        payload = "".join(dumps_json(op) + "\n" for op in operations).encode("utf-8")
+        with file_lock(self.path):
+            os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+            with open(self.journal_path, "a+b") as f:
+                # A crash mid-append leaves a partial last line: drop it, or this record would be glued onto it
+                _truncate_torn_tail(f)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            if size >= self.compact_bytes:
+                self._write_base(self._read_fresh())
+
+    def _write_base(self, mapping):
+        document = {self.section: mapping} if self.section is not None else mapping
+        atomic_write(self.path, dumps_json(document, indent=4))
+        # Replaying the journal onto the new base is idempotent, so a crash before this point is harmless
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+
+_stores = {}
+_stores_guard = threading.Lock()
+
+
+def open_store(path, section=None):
+    """The process-wide JournaledStore of `path`, so every session shares one read snapshot."""
+    key = (os.path.abspath(path), section)
+    with _stores_guard:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = JournaledStore(key[0], section)
+    return store
+
+
+def _truncate_torn_tail(f, chunk_size=4096):
+    """Truncates a journal opened for appending back to its last complete (newline-terminated) line."""
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    position = end
+    while position > 0:
+        start = max(0, position - chunk_size)
+        f.seek(start)
+        newline = f.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            f.truncate(start + newline + 1)
+            return
+        position = start
+    f.truncate(0)
+
+
+def _replay(mapping, operations):
+    state = dict(mapping)
+    for operation in operations:
+        if operation.get("op") == "delete":
+            state.pop(operation["key"], None)
+        elif operation.get("op") == "put":
+            state[operation["key"]] = operation.get("value")
+    return state
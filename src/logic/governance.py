@@ -2,19 +2,23 @@
 Description: Regulatory logic for Dictionary Forge
 """
 
-import json
 import os
 
 from constants import ROOT_DIR
 
+from .file_store import open_store
+
 REGULATIONS_PATH = os.path.join(ROOT_DIR, "config", "regulations.json")
 
+# Shared journaled store: each edit appends one record under a file lock
+_regulations = open_store(REGULATIONS_PATH)
+
 
 def load_regulations():
     """
-    Loads regulatory frameworks. Seeds the master list of defaults if missing.
+    Loads regulatory frameworks (cached, read-only). Seeds the master list of defaults if missing.
     """
-    if not os.path.exists(REGULATIONS_PATH):
+    if not _regulations.exists():
         default_data = {
             "GDPR": {
                 "full_name": "General Data Protection Regulation",
@@ -143,17 +147,22 @@ def load_regulations():
                 "url": "https://www.eiopa.europa.eu/browse/regulation-and-policy/insurance-distribution-directive-idd_en",
             },
         }
-        os.makedirs(os.path.dirname(REGULATIONS_PATH), exist_ok=True)
-        with open(REGULATIONS_PATH, "w") as f:
-            json.dump(default_data, f, indent=4)
-        return default_data
+        # Checked again under the file lock: a concurrent session may have seeded (and saved) meanwhile
+        _regulations.seed(default_data)
 
-    with open(REGULATIONS_PATH) as f:
-        return json.load(f)
+    return _regulations.load()
 
 
 def save_regulations(data):
-    """Persists regulatory frameworks to storage."""
-    os.makedirs(os.path.dirname(REGULATIONS_PATH), exist_ok=True)
-    with open(REGULATIONS_PATH, "w") as f:
-        json.dump(data, f, indent=4)
+    """Replaces the whole set of regulatory frameworks (atomically)."""
+    _regulations.replace(data)
+
+
+def save_regulation(abbr, details, previous_abbr=None):
+    """Adds or updates one framework, renaming it from `previous_abbr` if given, without rewriting the file."""
+    _regulations.rename(previous_abbr or abbr, abbr, details)
+
+
+def delete_regulation(abbr):
+    """Removes one framework."""
+    _regulations.delete(abbr)
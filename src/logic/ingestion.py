@@ -0,0 +1,199 @@
+"""
+Description: Streaming Ingestion Layer for Dictionary Forge
+Reads uploaded datasets (CSV, Excel, Parquet) proportionally to what the caller needs:
+the header only, a single column, or bounded-memory chunks with progress reporting.
+"""
+
+import os
+
+import pandas as pd
+
+# Rows per chunk for streamed reads; bounds peak memory independently of file size
+DEFAULT_CHUNK_SIZE = 100_000
+
+SUPPORTED_EXTENSIONS = (".csv", ".txt", ".gz", ".xlsx", ".parquet")
+
+
+def detect_format(source, file_name=None):
+    """Resolves 'csv', 'excel' or 'parquet' from an explicit name, a path or an uploaded file's name."""
+    name = file_name or getattr(source, "name", None) or str(source)
+    ext = os.path.splitext(name)[1].lower()
+
+    if ext in (".csv", ".txt", ".gz"):
+        return "csv"
+    if ext == ".xlsx":
+        return "excel"
+    if ext == ".parquet":
+        return "parquet"
+    raise ValueError(f"Unsupported file format: '{ext}'")
+
+
+def _rewind(source):
+    """Uploaded files are re-read across Streamlit reruns, so every read starts at offset 0."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _source_size(source):
+    """Total byte size used to turn stream offsets into a progress fraction (None if unknown)."""
+    size = getattr(source, "size", None)
+    if size:
+        return size
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    try:
+        position = source.tell()
+        source.seek(0, os.SEEK_END)
+        size = source.tell()
+        source.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+# ==============================================================================
+# 1. HEADER-ONLY MODE
+# ==============================================================================
+
+
+def read_header(source, file_name=None):
+    """
+    Returns the column names without materialising any data rows.
+    CSV parses the first line, Excel stops after row zero (read-only workbook),
+    Parquet reads the footer schema.
+    """
+    fmt = detect_format(source, file_name)
+
+    if fmt == "csv":
+        handle, compression = _open_csv(source, file_name)
+        try:
+            return pd.read_csv(handle, nrows=0, compression=compression).columns.tolist()
+        finally:
+            if handle is not source:
+                handle.close()
+    if fmt == "excel":
+        return pd.read_excel(_rewind(source), nrows=0).columns.tolist()
+
+    import pyarrow.parquet as pq
+
+    return list(pq.ParquetFile(_rewind(source)).schema_arrow.names)
+
+
+# ==============================================================================
+# 2. CHUNKED MODE
+# ==============================================================================
+
+
+def iter_chunks(source, file_name=None, usecols=None, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    """
+    Yields DataFrames of at most chunk_size rows, optionally restricted to usecols
+    (a list of names or a predicate). progress_callback(fraction) receives values in [0, 1].
+    """
+    fmt = detect_format(source, file_name)
+
+    if fmt == "csv":
+        yield from _iter_csv(source, file_name, usecols, chunk_size, progress_callback)
+    elif fmt == "excel":
+        yield from _iter_excel(source, usecols, chunk_size, progress_callback)
+    else:
+        yield from _iter_parquet(source, usecols, chunk_size, progress_callback)
+
+    if progress_callback:
+        progress_callback(1.0)
+
+
+def _open_csv(source, file_name):
+    """Returns a binary handle positioned at offset 0 plus the compression pandas cannot infer from it."""
+    handle = open(source, "rb") if isinstance(source, (str, os.PathLike)) else _rewind(source)
+    name = file_name or getattr(source, "name", None) or str(source)
+    compression = "gzip" if str(name).lower().endswith(".gz") else None
+    return handle, compression
+
+
+def _iter_csv(source, file_name, usecols, chunk_size, progress_callback):
+    total = _source_size(source)
+    handle, compression = _open_csv(source, file_name)
+
+    try:
+        for chunk in pd.read_csv(handle, usecols=usecols, chunksize=chunk_size, compression=compression):
+            yield chunk
+            if progress_callback and total:
+                progress_callback(min(handle.tell() / total, 1.0))
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def _iter_excel(source, usecols, chunk_size, progress_callback):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_rewind(source), read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = [str(c) if c is not None else f"Unnamed: {i}" for i, c in enumerate(next(rows, ()))]
+        keep = _resolve_usecols(header, usecols)
+        total_rows = max((sheet.max_row or 0) - 1, 0)
+
+        buffer, seen = [], 0
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in keep])
+            if len(buffer) == chunk_size:
+                seen += len(buffer)
+                yield pd.DataFrame(buffer, columns=[header[i] for i in keep])
+                buffer = []
+                if progress_callback and total_rows:
+                    progress_callback(min(seen / total_rows, 1.0))
+        if buffer:
+            yield pd.DataFrame(buffer, columns=[header[i] for i in keep])
+    finally:
+        workbook.close()
+
+
+def _iter_parquet(source, usecols, chunk_size, progress_callback):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(_rewind(source))
+    header = parquet_file.schema_arrow.names
+    columns = [header[i] for i in _resolve_usecols(header, usecols)]
+    total_rows = parquet_file.metadata.num_rows
+
+    seen = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        seen += batch.num_rows
+        yield batch.to_pandas()
+        if progress_callback and total_rows:
+            progress_callback(min(seen / total_rows, 1.0))
+
+
+def _resolve_usecols(header, usecols):
+    """Maps a usecols list/predicate onto header positions (all columns when None)."""
+    if usecols is None:
+        return list(range(len(header)))
+    if callable(usecols):
+        return [i for i, c in enumerate(header) if usecols(c)]
+    wanted = set(usecols)
+    return [i for i, c in enumerate(header) if c in wanted]
+
+
+# ==============================================================================
+# 3. COLUMN-SAMPLED MODE
+# ==============================================================================
+
+
+def read_column(source, column, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    """
+    Streams a single column (e.g. the variable-name column of a data dictionary)
+    and returns its non-null values as strings. Other columns are never parsed.
+    """
+    values = []
+    for chunk in iter_chunks(
+        source,
+        file_name=file_name,
+        usecols=[column],
+        chunk_size=chunk_size,
+        progress_callback=progress_callback,
+    ):
+        values.extend(chunk[column].dropna().astype(str).tolist())
+    return values
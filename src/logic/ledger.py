@@ -0,0 +1,74 @@
+"""
+Description: Incremental Ledger Engine for Dictionary Forge
+Keeps the flattened ledger DataFrame in sync with a VariableRegistry. Rows are cached per
+(variable_id, version), so a rerun only re-flattens variables that changed since the last
+render, and filtering is answered by an incrementally maintained full-text SearchIndex.
+"""
+
+import pandas as pd
+
+from .exporters import flatten_json
+from .search import SearchIndex, variable_document
+
+# Internal identity column dropped from everything the ledger displays
+HIDDEN_COLUMNS = ("variable_id",)
+
+
+class LedgerCache:
+    """
+    Flattened ledger rows keyed by variable version.
+    Unchanged registries (e.g. reruns triggered by form keystrokes) return the cached frame as is.
+    """
+
+    __slots__ = ("_rows", "_revision", "_frame", "_positions", "_index")
+
+    def __init__(self):
+        self._rows = {}
+        self._revision = None
+        self._frame = pd.DataFrame()
+        self._positions = {}
+        self._index = SearchIndex()
+
+    def frame(self, registry):
+        """Full ledger frame for the registry's current revision."""
+        if registry.revision != self._revision:
+            self._refresh(registry)
+        return self._frame
+
+    def search(self, registry, query, limit=None):
+        """variable_ids matching `query`, best first (see SearchIndex.search)."""
+        self.frame(registry)
+        return self._index.search(query, limit)
+
+    def filter(self, registry, query):
+        """Ledger rows matching `query` across name, alias, description, steward and compliance scope."""
+        frame = self.frame(registry)
+        if not (query or "").strip():
+            return frame
+        return frame.iloc[[self._positions[variable_id] for variable_id in self._index.search(query)]]
+
+    def _refresh(self, registry):
+        rows = {}
+        for var in registry:
+            variable_id = var["variable_id"]
+            version = registry.version_of(variable_id)
+            cached = self._rows.get(variable_id)
+            if cached is None or cached[0] != version:
+                cached = (version, _ledger_row(var))
+                self._index.update(variable_id, variable_document(var))
+            rows[variable_id] = cached
+
+        # Deleted variables simply drop out: only ids still registered are carried over
+        for variable_id in self._rows.keys() - rows.keys():
+            self._index.remove(variable_id)
+        self._rows = rows
+        self._positions = {variable_id: i for i, variable_id in enumerate(rows)}
+        self._frame = pd.DataFrame([row for _, row in rows.values()])
+        self._revision = registry.revision
+
+
+def _ledger_row(var):
+    row = flatten_json(var)
+    for column in HIDDEN_COLUMNS:
+        row.pop(column, None)
+    return row
@@ -4,12 +4,15 @@ Implements multi-layered coherence matrices for Analytical, Technical, and Funct
 Features: Smart Heuristics, PostgreSQL DDL Compiler, and Dynamic Field Visibility.
 """
 
-import json
 import os
 
 import pandas as pd
 import streamlit as st
-import yaml
+
+from .serialization import JSONDecodeError, dump_json, load_json, load_yaml
+
+# Row hydration is shared with the transformers engine, which also routes the legacy 'database_' columns
+from .transformers import hydrate_row_from_flat  # noqa: F401
 
 
 def load_master_schema(config_path):
@@ -20,7 +23,7 @@ def load_master_schema(config_path):
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
 
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return load_yaml(f)
 
 
 # ==============================================================================
@@ -41,7 +44,7 @@ def load_all_templates(
     # 1. Load Standard (YAML)
     if os.path.exists(standard_path):
         with open(standard_path) as f:
-            std_data = yaml.safe_load(f)
+            std_data = load_yaml(f)
             if std_data and "templates" in std_data:
                 all_templates.update(std_data["templates"])
 
@@ -52,10 +55,10 @@ def load_all_templates(
 
         with open(user_path) as f:
             try:
-                user_data = json.load(f)
+                user_data = load_json(f)
                 if user_data and "user_templates" in user_data:
                     all_templates.update(user_data["user_templates"])
-            except json.JSONDecodeError:
+            except JSONDecodeError:
                 pass
 
     return all_templates
@@ -117,7 +120,7 @@ def save_user_template(template_name, v_inputs, user_path="config/templates_user
     if os.path.exists(user_path):
         with open(user_path) as f:
             try:
-                data = json.load(f)
+                data = load_json(f)
             except Exception:
                 pass
 
@@ -126,7 +129,7 @@ def save_user_template(template_name, v_inputs, user_path="config/templates_user
     data["user_templates"][template_id] = new_template
 
     with open(user_path, "w") as f:
-        json.dump(data, f, indent=4)
+        dump_json(data, f)
 
 
 # ==============================================================================
@@ -514,49 +517,6 @@ def guess_metadata_from_name(variable_name):
 # ==============================================================================
 
 
-def hydrate_row_from_flat(flat_row):
-    """
-    Takes a flat dictionary (from a dataframe row) and reconstructs
-    the nested metadata structure (constraints, cleaning, etc.).
-    """
-    nested_var = {
-        "name": flat_row.get("name"),
-        "alias": flat_row.get("alias"),
-        "description": flat_row.get("description"),
-        "analytical_type": flat_row.get("analytical_type"),
-        "data_type": flat_row.get("data_type"),
-        "role": flat_row.get("role"),
-        "constraints": {},
-        "cleaning": {},
-        "governance": {},
-        "database_mapping": {},
-        "visualization": {},
-    }
-
-    for key, value in flat_row.items():
-        # Ensure prefix matching aligns with the 'prefix' argument in your sections
-        for section in [
-            "constraints",
-            "cleaning",
-            "governance",
-            "database",
-            "visualization",
-        ]:
-            # Map 'database' prefix back to 'database_mapping' key
-            target_key = "database_mapping" if section == "database" else section
-            prefix = f"{section}_"
-
-            if key.startswith(prefix) and value is not None:
-                # Safely ignore pandas NaNs which represent empty cells in the grid
-                if isinstance(value, float) and pd.isna(value):
-                    continue
-
-                field_name = key.replace(prefix, "")
-                nested_var[target_key][field_name] = value
-
-    return nested_var
-
-
 def generate_batch_dataframe(template_data, row_count):
     """
     Creates a flat Pandas DataFrame based on a template to populate the UI grid.
@@ -0,0 +1,275 @@
+"""
+Description: Schema Migration Engine for Dictionary Forge
+Diffs two dictionary snapshots and emits a minimal ALTER TABLE migration plus a structured change log.
+Variables are matched by their stable variable_id (falling back to table + column name) through hash
+maps, so a diff is linear in the number of variables and unchanged variables cost one tuple comparison.
+"""
+
+from typing import NamedTuple
+
+from .ddl import (
+    DEFAULT_DIALECT,
+    build_schema,
+    check_constraint,
+    foreign_key_constraint,
+    get_dialect,
+    lower_variable,
+    render_table,
+    unique_constraint,
+)
+
+# Execution order of the generated statements: drops before alters before additions
+PHASES = (
+    "drop_foreign_key",
+    "drop_check",
+    "drop_unique",
+    "drop_column",
+    "drop_table",
+    "rename_column",
+    "alter_type",
+    "alter_nullable",
+    "alter_primary_key",
+    "create_table",
+    "add_column",
+    "add_unique",
+    "add_check",
+    "add_foreign_key",
+)
+_PHASE_RANK = {name: i for i, name in enumerate(PHASES)}
+
+# Named-constraint builders shared with CREATE TABLE rendering, by change suffix
+_CONSTRAINT_BUILDERS = {
+    "unique": unique_constraint,
+    "check": check_constraint,
+    "foreign_key": foreign_key_constraint,
+}
+
+# Column attributes owned by each constraint kind (the name is part of every constraint's name)
+_CONSTRAINT_KINDS = {
+    "unique": lambda column: column.unique and not column.primary_key,
+    "check": lambda column: (
+        (column.allowed_values, column.min_value, column.max_value)
+        if column.allowed_values or column.min_value is not None or column.max_value is not None
+        else None
+    ),
+}
+
+
+class Change(NamedTuple):
+    """One schema change. `before`/`after` hold model objects (Column, ForeignKey or Table) or None."""
+
+    change: str
+    table: str
+    column: str | None
+    before: object = None
+    after: object = None
+
+    def summary(self):
+        """Dialect-neutral change-log record."""
+        return {
+            "change": self.change,
+            "table": self.table,
+            "column": self.column,
+            "before": _describe(self.change, self.before),
+            "after": _describe(self.change, self.after),
+        }
+
+
+# =============================================================================
+# 1. DIFF
+# =============================================================================
+def diff_dictionaries(old_variables, new_variables):
+    """Ordered list of Changes turning the `old_variables` schema into the `new_variables` one."""
+    old, new = _snapshot(old_variables), _snapshot(new_variables)
+    _match_by_name(old, new)
+    old_tables = {table for table, _, _ in old.values()}
+    new_tables = {table for table, _, _ in new.values()}
+    changes = []
+
+    for key, before in old.items():
+        after = new.get(key)
+        if after == before:
+            continue
+        table, column, foreign_key = before
+        if after is not None and after[0] == table:
+            _diff_column(changes, table, before, after)
+        elif table in new_tables:
+            # Dropped, or moved to another table: leaves this one
+            if foreign_key is not None:
+                changes.append(Change("drop_foreign_key", table, column.name, foreign_key, None))
+            changes.append(Change("drop_column", table, column.name, column, None))
+
+    for key, after in new.items():
+        before = old.get(key)
+        table, column, foreign_key = after
+        if table not in old_tables or (before is not None and before[0] == table):
+            continue
+        changes.append(Change("add_column", table, column.name, None, column))
+        _diff_constraints(changes, table, None, after)
+
+    created = (
+        [t for t in build_schema(new_variables).tables if t.name not in old_tables] if new_tables - old_tables else []
+    )
+    changes.extend(Change("create_table", t.name, None, None, t) for t in created)
+    changes.extend(Change("drop_table", name, None, name, None) for name in sorted(old_tables - new_tables))
+
+    creation_order = {t.name: i for i, t in enumerate(created)}
+    changes.sort(key=lambda c: (_PHASE_RANK[c.change], creation_order.get(c.table, 0), c.table, c.column or ""))
+    return changes
+
+
+def _snapshot(variables):
+    lowered = {}
+    for var in variables:
+        table, column, foreign_key = lower_variable(var)
+        key = var.get("variable_id") or ("name", table, column.name)
+        lowered[key] = (table, column, foreign_key)
+    return lowered
+
+
+def _match_by_name(old, new):
+    """
+    Pairs the entries left unmatched by ID (e.g. a baseline exported before variables carried IDs)
+    by (table, column name): the new entry is re-keyed onto the old key so it diffs in place
+    instead of becoming a DROP + ADD of the same column.
+    """
+    orphans = {}
+    for key, (table, column, _) in old.items():
+        if key not in new:
+            orphans.setdefault((table, column.name), key)
+    for key in [key for key in new if key not in old]:
+        table, column, _ = new[key]
+        old_key = orphans.pop((table, column.name), None)
+        if old_key is not None:
+            new[old_key] = new.pop(key)
+
+
+def _diff_column(changes, table, before, after):
+    old, new = before[1], after[1]
+    if old.name != new.name:
+        changes.append(Change("rename_column", table, new.name, old, new))
+    if (old.logical_type, old.length) != (new.logical_type, new.length):
+        changes.append(Change("alter_type", table, new.name, old, new))
+    if old.nullable != new.nullable:
+        changes.append(Change("alter_nullable", table, new.name, old, new))
+    if old.primary_key != new.primary_key:
+        changes.append(Change("alter_primary_key", table, new.name, old, new))
+    _diff_constraints(changes, table, before, after)
+
+
+def _diff_constraints(changes, table, before, after):
+    """Constraint names derive from the column name, so renames also drop and re-add them."""
+    old_column = before[1] if before else None
+    new_column = after[1]
+    renamed = old_column is not None and old_column.name != new_column.name
+
+    for kind, signature in _CONSTRAINT_KINDS.items():
+        old_sig = signature(old_column) if old_column is not None else None
+        new_sig = signature(new_column)
+        if old_sig == new_sig and not renamed:
+            continue
+        if old_sig:
+            changes.append(Change(f"drop_{kind}", table, old_column.name, old_column, None))
+        if new_sig:
+            changes.append(Change(f"add_{kind}", table, new_column.name, None, new_column))
+
+    old_fk = before[2] if before else None
+    new_fk = after[2]
+    if old_fk != new_fk:
+        if old_fk is not None:
+            changes.append(Change("drop_foreign_key", table, old_fk.column, old_fk, None))
+        if new_fk is not None:
+            changes.append(Change("add_foreign_key", table, new_fk.column, None, new_fk))
+
+
+# =============================================================================
+# 2. MIGRATION SQL
+# =============================================================================
+def generate_migration(old_variables, new_variables, dialect=DEFAULT_DIALECT, from_version=None, to_version=None):
+    """ALTER TABLE script for `dialect`; changes the engine cannot express in place become comments."""
+    backend = get_dialect(dialect)
+    changes = diff_dictionaries(old_variables, new_variables)
+
+    header = f"-- Auto-generated {backend.label} Migration by Dictionary Forge"
+    if from_version or to_version:
+        header += f" ({from_version or '?'} -> {to_version or '?'})"
+    out = [header, ""]
+    if not changes:
+        out.append("-- No schema changes.")
+
+    emitted = set()
+    for change in changes:
+        statement = _render_change(change, backend)
+        if statement is None:
+            summary = change.summary()
+            target = f"{change.table}.{change.column}" if change.column else change.table
+            statement = (
+                f"-- Not supported in place by {backend.label}: {change.change} on {target} "
+                f"({summary['before']} -> {summary['after']})"
+            )
+        if statement in emitted:
+            # e.g. MySQL's MODIFY COLUMN already covered both the type and the nullability change
+            continue
+        emitted.add(statement)
+        out.append(statement)
+    return "\n".join(out) + "\n"
+
+
+def _render_change(change, backend):
+    kind, table = change.change, change.table
+    if kind == "create_table":
+        return render_table(change.after, backend).rstrip("\n")
+    if kind == "drop_table":
+        return backend.drop_table(table)
+    if kind == "add_column":
+        return backend.add_column(table, change.after)
+    if kind == "drop_column":
+        return backend.drop_column(table, change.before.name)
+    if kind == "rename_column":
+        return backend.rename_column(table, change.before.name, change.after.name)
+    if kind == "alter_type":
+        return backend.alter_type(table, change.after)
+    if kind == "alter_nullable":
+        return backend.alter_nullable(table, change.after)
+    if kind == "alter_primary_key":
+        return None
+
+    # Constraint changes: render the named constraint exactly as CREATE TABLE would
+    action, constraint_kind = kind.split("_", 1)
+    constraint = _CONSTRAINT_BUILDERS[constraint_kind](table, change.before or change.after, backend)
+    if constraint is None:
+        # Not representable in this dialect's DDL either (e.g. CHECK on BigQuery): nothing to migrate
+        return f"-- Skipped {kind} on {table}.{change.column}: not supported by {backend.label} DDL"
+    if action == "drop":
+        return backend.drop_constraint(table, constraint)
+    return backend.add_constraint(table, constraint)
+
+
+# =============================================================================
+# 3. CHANGE LOG
+# =============================================================================
+def change_log(old_variables, new_variables):
+    """Structured, dialect-neutral change log (one dict per change)."""
+    return [change.summary() for change in diff_dictionaries(old_variables, new_variables)]
+
+
+def _describe(kind, obj):
+    if obj is None:
+        return None
+    if kind in ("create_table", "drop_table"):
+        return obj if isinstance(obj, str) else f"{len(obj.columns)} columns"
+    if kind.endswith("foreign_key"):
+        return f"{obj.ref_table}({obj.ref_column or ''})"
+    if kind == "rename_column":
+        return obj.name
+    if kind == "alter_nullable":
+        return "NULL" if obj.nullable else "NOT NULL"
+    if kind == "alter_primary_key":
+        return obj.primary_key
+    if kind.endswith("check"):
+        if obj.allowed_values:
+            return f"in {list(obj.allowed_values)}"
+        return f"[{obj.min_value}, {obj.max_value}]"
+    if kind.endswith("unique"):
+        return "UNIQUE"
+    return f"{obj.logical_type}({obj.length})" if obj.length else obj.logical_type
@@ -0,0 +1,430 @@
+"""
+Description: Column Profiling Engine for Dictionary Forge
+Computes vectorized per-column statistics over (a reservoir sample of) a real dataset
+and turns them into proposed dictionary metadata: analytical_type, data_type, role and constraints.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from constants import REGEX_LIBRARY, TOOLTIP_DEFINITIONS
+
+from .coherence import get_filtered_roles, guess_metadata_from_name, is_field_visible
+from .ingestion import DEFAULT_CHUNK_SIZE, iter_chunks
+from .validation import FREQUENCY_ALIASES
+
+# Rows kept by the reservoir; enough for type inference while keeping wide tables cheap to profile
+DEFAULT_SAMPLE_SIZE = 10_000
+
+# Share of non-null values that must agree before a string column is promoted to a richer kind
+MATCH_THRESHOLD = 0.95
+
+# Upper bound on distinct labels for a string column to be proposed as a category
+MAX_CATEGORIES = 50
+
+# Distinct labels probed by the per-pattern regex/date parsers on high-cardinality string columns
+PROBE_SIZE = 1_000
+
+QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+_BOOL_LABELS = frozenset({"true", "false", "yes", "no", "y", "n", "t", "f"})
+
+# Library patterns, compiled once (the empty 'Custom Pattern' slot has nothing to match)
+_PATTERNS = {family: re.compile(pattern) for family, pattern in REGEX_LIBRARY.items() if pattern}
+
+# Inferred pandas aliases -> the legacy aliases offered by the form (TOOLTIP_DEFINITIONS['frequency'])
+_FORM_FREQUENCIES = {new: old for old, new in FREQUENCY_ALIASES.items()} | {
+    "W-SUN": "W",
+    "QE-DEC": "Q",
+    "YE-DEC": "A",
+    "BYE-DEC": "BA",
+}
+
+
+# ==============================================================================
+# 1. RESERVOIR SAMPLING
+# ==============================================================================
+
+
+def reservoir_sample(chunks, size=DEFAULT_SAMPLE_SIZE, seed=None):
+    """
+    Draws a uniform sample of at most `size` rows from a stream of DataFrame chunks.
+    Every row gets a random key and the `size` smallest keys survive, so each chunk costs
+    one vectorized filter. Returns (sample, rows_seen); the sample's index holds the original
+    row positions, in order, which keeps order-dependent statistics meaningful.
+    """
+    rng = np.random.default_rng(seed)
+    sample, keys = None, np.empty(0)
+    rows_seen = 0
+
+    for chunk in chunks:
+        n = len(chunk)
+        if n == 0:
+            continue
+        chunk = chunk.set_axis(pd.RangeIndex(rows_seen, rows_seen + n))
+        chunk_keys = rng.random(n)
+        rows_seen += n
+
+        # Once the reservoir is full only rows beating the current k-th key can enter
+        if sample is not None and len(keys) == size:
+            candidates = chunk_keys < keys.max()
+            if not candidates.any():
+                continue
+            chunk, chunk_keys = chunk[candidates], chunk_keys[candidates]
+
+        sample = chunk if sample is None else pd.concat([sample, chunk])
+        keys = np.concatenate((keys, chunk_keys))
+        if len(keys) > size:
+            keep = np.argpartition(keys, size - 1)[:size]
+            sample, keys = sample.iloc[keep], keys[keep]
+
+    if sample is None:
+        return pd.DataFrame(), 0
+    return sample.sort_index(), rows_seen
+
+
+# ==============================================================================
+# 2. COLUMN STATISTICS
+# ==============================================================================
+
+
+def profile_column(series, positions=None):
+    """
+    Computes the statistics of one column in a single vectorized pass.
+    `positions` are the original row numbers of the values (defaults to 0..n-1); they let
+    frequency inference work on sampled rows that are no longer contiguous.
+    """
+    profile, probe = _profile_column(series, positions)
+    if probe is not None:
+        _match_patterns([profile], [probe])
+    return profile
+
+
+def _profile_column(series, positions):
+    """
+    profile_column without the regex pass: returns (profile, probe), where a string column's
+    probe holds its distinct labels and their row counts for _match_patterns.
+    """
+    positions = np.arange(len(series)) if positions is None else np.asarray(positions)
+    if series.dtype == object:
+        # Excel and mixed CSV chunks arrive as Python objects; let pandas narrow them first
+        series = series.infer_objects()
+
+    # One hash pass yields the null mask (code -1), the cardinality and the distinct values
+    # that every string predicate below is evaluated on
+    codes, uniques = pd.factorize(series)
+    notna = codes >= 0
+    present, codes = series[notna], codes[notna]
+
+    n = len(series)
+    profile = {
+        "name": str(series.name),
+        "dtype": str(series.dtype),
+        "count": n,
+        "null_count": int(n - len(present)),
+        "null_rate": (n - len(present)) / n if n else 0.0,
+        "cardinality": len(uniques),
+        "unique": bool(len(present)) and len(uniques) == len(present),
+        "kind": "empty",
+        "monotonicity": None,
+        "frequency": None,
+    }
+    if len(present) == 0:
+        return profile, None
+
+    kind, values = _infer_kind(present, codes, uniques)
+    profile["kind"] = kind
+    probe = None
+
+    if kind in ("integer", "float"):
+        _numeric_stats(profile, values)
+    elif kind == "datetime":
+        # Strings that failed to parse (within MATCH_THRESHOLD) are left out of the time axis
+        parsed = values.notna().to_numpy()
+        values = values[parsed]
+        profile["min"] = values.min().isoformat()
+        profile["max"] = values.max().isoformat()
+        profile["frequency"] = _infer_frequency(values, positions[notna][parsed])
+    elif kind == "bool":
+        profile["values"] = sorted(str(v) for v in uniques)
+    else:
+        probe = _string_stats(profile, codes, values)
+
+    if kind in ("integer", "float", "datetime"):
+        profile["monotonicity"] = _monotonicity(values.to_numpy())
+    return profile, probe
+
+
+def _infer_kind(present, codes, uniques):
+    """
+    Classifies non-null values as bool/integer/float/datetime/string and returns them coerced
+    (string columns return their stripped distinct labels instead).
+    """
+    if pd.api.types.is_bool_dtype(present):
+        return "bool", present
+    if pd.api.types.is_datetime64_any_dtype(present):
+        return "datetime", present
+    if pd.api.types.is_numeric_dtype(present):
+        return _numeric_kind(present), present
+
+    labels = pd.Series(uniques).astype(str).str.strip()
+
+    # Text rarely parses as numbers or dates, so a probe of distinct labels rules both out cheaply
+    if pd.to_numeric(labels.iloc[:PROBE_SIZE], errors="coerce").notna().all():
+        numbers = pd.to_numeric(labels, errors="coerce")
+        if numbers.notna().all():
+            coerced = pd.Series(numbers.to_numpy()[codes], index=present.index)
+            return _numeric_kind(coerced), coerced
+
+    if len(labels) <= 2 and labels.str.lower().isin(_BOOL_LABELS).all():
+        return "bool", present
+
+    probe = pd.to_datetime(labels.iloc[:PROBE_SIZE], errors="coerce", format="ISO8601")
+    if probe.notna().mean() >= MATCH_THRESHOLD:
+        stamps = pd.to_datetime(labels, errors="coerce", format="ISO8601")
+        if _agreement(stamps.notna(), codes) >= MATCH_THRESHOLD:
+            return "datetime", pd.Series(stamps.to_numpy()[codes], index=present.index)
+
+    return "string", labels
+
+
+def _agreement(flags_per_unique, codes):
+    """Share of rows whose distinct value satisfies a predicate (evaluated once per distinct value)."""
+    return float(np.asarray(flags_per_unique, dtype=bool)[codes].mean())
+
+
+def _numeric_kind(values):
+    if pd.api.types.is_integer_dtype(values):
+        return "integer"
+    return "integer" if bool((values.to_numpy() % 1 == 0).all()) else "float"
+
+
+def _numeric_stats(profile, values):
+    array = values.to_numpy(dtype="float64")
+    quantiles = np.quantile(array, QUANTILES)
+    profile.update(
+        {
+            "min": _to_python(array.min(), profile["kind"]),
+            "max": _to_python(array.max(), profile["kind"]),
+            "mean": float(array.mean()),
+            "std": float(array.std(ddof=1)) if len(array) > 1 else 0.0,
+            "quantiles": {f"p{int(q * 100):02d}": float(v) for q, v in zip(QUANTILES, quantiles)},
+        }
+    )
+    if profile["cardinality"] <= 2:
+        profile["values"] = sorted(_to_python(v, profile["kind"]) for v in np.unique(array))
+
+
+def _string_stats(profile, codes, labels):
+    # Stripping can merge labels (' a' and 'a'), so distinct values are re-keyed once
+    label_codes, labels = pd.factorize(labels)
+    codes, labels = label_codes[codes], pd.Series(labels)
+    profile["cardinality"] = len(labels)
+    profile["unique"] = len(labels) == len(codes)
+
+    counts = np.bincount(codes, minlength=len(labels))
+    values = labels.to_numpy(dtype=object)
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    profile["min_length"] = int(lengths.min())
+    profile["max_length"] = int(lengths.max())
+
+    if profile["cardinality"] <= MAX_CATEGORIES:
+        order = np.argsort(-counts, kind="stable")
+        profile["top_values"] = [labels.iloc[i] for i in order]
+
+    return values, counts
+
+
+def _match_patterns(profiles, probes):
+    """
+    Sets the row-weighted 'regex_matches' rates of string columns from their probes. All probes
+    are concatenated, so each library pattern runs once over the table instead of once per column.
+    """
+    # High-cardinality columns have their pattern rates estimated on their first PROBE_SIZE labels
+    probes = [(labels[:PROBE_SIZE], counts[:PROBE_SIZE]) for labels, counts in probes]
+    labels = np.concatenate([probe_labels for probe_labels, _ in probes])
+    counts = np.concatenate([probe_counts for _, probe_counts in probes])
+    starts = np.cumsum([0] + [len(probe_labels) for probe_labels, _ in probes[:-1]])
+    totals = np.add.reduceat(counts, starts)
+
+    for profile in profiles:
+        profile["regex_matches"] = {}
+    for family, pattern in _PATTERNS.items():
+        matched = np.fromiter(map(bool, map(pattern.search, labels)), dtype=bool, count=len(labels))
+        rates = np.add.reduceat(np.where(matched, counts, 0), starts) / totals
+        for profile, rate in zip(profiles, rates, strict=True):
+            if rate > 0:
+                profile["regex_matches"][family] = float(rate)
+
+
+def _monotonicity(values):
+    if len(values) < 3:
+        return None
+    steps = np.diff(values)
+    if pd.api.types.is_timedelta64_dtype(steps):
+        steps = steps.astype("int64")
+    if (steps > 0).all():
+        return "strictly_increasing"
+    if (steps >= 0).all():
+        return "increasing"
+    if (steps < 0).all():
+        return "strictly_decreasing"
+    if (steps <= 0).all():
+        return "decreasing"
+    return None
+
+
+def _infer_frequency(stamps, positions):
+    """
+    Infers the sampling cadence. Contiguous rows defer to pd.infer_freq (calendar-aware);
+    sampled rows are regular when the time step per skipped row is constant.
+    """
+    if len(stamps) < 3:
+        return None
+    gaps = np.diff(positions)
+    if (gaps == 1).all():
+        try:
+            return pd.infer_freq(pd.DatetimeIndex(stamps))
+        except (TypeError, ValueError):
+            return None
+
+    steps = np.diff(stamps.to_numpy().astype("int64"))
+    if (gaps <= 0).any() or (steps % gaps != 0).any():
+        return None
+    per_row = np.unique(steps // gaps)
+    if len(per_row) != 1 or per_row[0] <= 0:
+        return None
+    return pd.tseries.frequencies.to_offset(pd.Timedelta(int(per_row[0]))).freqstr
+
+
+def _to_python(value, kind):
+    return int(value) if kind == "integer" else float(value)
+
+
+# ==============================================================================
+# 3. TABLE DRIVERS
+# ==============================================================================
+
+
+def profile_dataframe(df):
+    """
+    Profiles every column of an in-memory DataFrame. The regex pass of the string columns is
+    batched over the whole table (see _match_patterns).
+    The index is taken as row positions when it is integer-valued.
+    """
+    if not pd.api.types.is_integer_dtype(df.index):
+        df = df.reset_index(drop=True)
+
+    positions = df.index.to_numpy()
+    profiles, pending, probes = {}, [], []
+    for col in df.columns:
+        profile, probe = _profile_column(df[col], positions)
+        profiles[str(col)] = profile
+        if probe is not None:
+            pending.append(profile)
+            probes.append(probe)
+    if probes:
+        _match_patterns(pending, probes)
+    return profiles
+
+
+def profile_source(
+    source,
+    file_name=None,
+    sample_size=DEFAULT_SAMPLE_SIZE,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    progress_callback=None,
+    seed=0,
+):
+    """
+    Streams a CSV/Excel/Parquet source through the reservoir and profiles the sample.
+    Returns {'rows': rows_seen, 'sampled': bool, 'profiles': {column: profile}}.
+    """
+    chunks = iter_chunks(source, file_name=file_name, chunk_size=chunk_size, progress_callback=progress_callback)
+    sample, rows_seen = reservoir_sample(chunks, sample_size, seed=seed)
+    return {
+        "rows": rows_seen,
+        "sampled": rows_seen > len(sample),
+        "profiles": profile_dataframe(sample),
+    }
+
+
+# ==============================================================================
+# 4. METADATA PROPOSALS
+# ==============================================================================
+
+
+def propose_metadata(profile):
+    """
+    Turns a column profile into a dictionary draft ({analytical_type, data_type, role, constraints}).
+    Name heuristics only break ties the data cannot settle (empty columns, ID roles).
+    """
+    guess = guess_metadata_from_name(profile["name"])
+    kind = profile["kind"]
+    constraints = {"nullable": profile["null_count"] > 0}
+
+    if kind == "empty":
+        return {**guess, "constraints": constraints}
+
+    if profile["unique"] and profile["count"] > 1:
+        constraints["unique"] = True
+
+    if kind == "bool":
+        at, dt, role = "binary", "bool", "feature"
+    elif kind == "datetime":
+        at, dt, role = "time_index", "datetime64", "time_index"
+        constraints["min_value"] = profile["min"][:10]
+        constraints["max_value"] = profile["max"][:10]
+        if profile["monotonicity"] == "strictly_increasing":
+            constraints["monotonicity"] = "strictly_increasing"
+        frequency = _FORM_FREQUENCIES.get(profile["frequency"], profile["frequency"])
+        if frequency in TOOLTIP_DEFINITIONS["frequency"]:
+            constraints["frequency"] = frequency
+    elif kind == "integer" and profile.get("values") == [0, 1]:
+        at, dt, role = "binary", "int64", "feature"
+    elif kind == "integer":
+        at, dt = "discrete", "int64"
+        is_key = profile["unique"] and profile["monotonicity"] in ("strictly_increasing", "strictly_decreasing")
+        role = "id" if guess["role"] == "id" or is_key else "feature"
+        constraints.update({"min_value": profile["min"], "max_value": profile["max"]})
+    elif kind == "float":
+        at, dt, role = "continuous", "float64", "feature"
+        constraints.update({"min_value": profile["min"], "max_value": profile["max"]})
+    else:
+        at, dt, role = _propose_string(profile, guess, constraints)
+
+    if role not in get_filtered_roles(at, dt):
+        role = get_filtered_roles(at, dt)[0]
+
+    # Drop anything the coherence matrix would hide for the proposed types
+    constraints = {k: v for k, v in constraints.items() if is_field_visible(k, at, dt)}
+    return {"analytical_type": at, "data_type": dt, "role": role, "constraints": constraints}
+
+
+def _propose_string(profile, guess, constraints):
+    present = profile["count"] - profile["null_count"]
+    top_values = profile.get("top_values")
+
+    if guess["role"] == "id" and profile["unique"]:
+        return "nominal", "string", "id"
+
+    if top_values and 2 <= profile["cardinality"] <= present / 2:
+        constraints["allowed_values"] = sorted(top_values)
+        return "nominal", "category", "feature"
+
+    # Library order lists the specific formats first, so ties favour them over generic ones
+    matches = profile.get("regex_matches", {})
+    best = max(matches, key=matches.get, default=None)
+    if best is not None and matches[best] >= MATCH_THRESHOLD:
+        constraints["regex_pattern"] = best
+
+    constraints.update({"min_value": profile["min_length"], "max_value": profile["max_length"]})
+    return "text", "string", "metadata"
+
+
+def propose_from_source(source, file_name=None, **kwargs):
+    """Profiles a source and returns {column: proposed metadata} ready for the pending queue."""
+    result = profile_source(source, file_name=file_name, **kwargs)
+    return {name: propose_metadata(profile) for name, profile in result["profiles"].items()}
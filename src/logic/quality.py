@@ -0,0 +1,475 @@
+"""
+Description: Definition Quality Engine for Dictionary Forge
+Grades the whole dictionary as one columnar batch against a declarative rule profile
+(config/quality_rules.yaml). A profile is compiled once into a RuleSet: the field paths its rules
+read are extracted into columns and every rule is a NumPy predicate over those columns. Results are
+cached per variable version, so an edit re-scores only the variables that changed. Shared by the
+sidebar tracker and the quality audit modal.
+"""
+
+import os
+import re
+import time
+from operator import methodcaller
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from constants import ROOT_DIR
+
+from .config_cache import load_config
+
+QUALITY_RULES_PATH = os.path.join(ROOT_DIR, "config", "quality_rules.yaml")
+
+# Grade labels by code, best first (thresholds come from the profile; Bronze catches the rest)
+GRADES = ("Gold", "Silver", "Bronze")
+DEFAULT_GRADES = {"gold": 90, "silver": 60}
+
+# Timings entry of the field extraction shared by all rules (rules are keyed by their id)
+EXTRACTION = "(field extraction)"
+
+# Rule keys that are not check parameters
+RULE_KEYS = ("id", "label", "dimension", "points", "check", "requires")
+
+
+class QualityRule(NamedTuple):
+    """One compiled rule. `fields` are the dotted paths it reads; `params` its check options."""
+
+    id: str
+    label: str
+    dimension: str
+    points: int
+    check: str
+    fields: tuple
+    params: dict
+    requires: str
+
+
+# =============================================================================
+# 1. CHECKS (vectorized predicates over extracted columns)
+# =============================================================================
+def _filled_mask(column):
+    """
+    Filled in: not missing (None, NaN, NaT or pd.NA) and not an empty string or collection (0 and
+    False count). Truthiness settles the present cells; falsy ones are filled only when they equal 0.
+    """
+    filled = pd.notna(column)
+    present = np.flatnonzero(filled)
+    # pd.NA has no truth value, so only present cells are tested
+    truthy = np.fromiter(map(bool, column[present]), dtype=bool, count=len(present))
+    gaps = present[~truthy]
+    if len(gaps):
+        filled[gaps] = np.equal(column[gaps], 0)
+    return filled
+
+
+def _without_na(column):
+    """Missing cells as None, so elementwise comparisons never meet pd.NA (which has no truth value)."""
+    return np.where(pd.isna(column), None, column)
+
+
+def _strings(column):
+    return pd.Series(column, dtype=object).astype("string")
+
+
+def _check_present(columns, rule):
+    return _filled_mask(columns[rule.fields[0]])
+
+
+def _check_not_null(columns, rule):
+    return pd.notna(columns[rule.fields[0]])
+
+
+def _check_distinct(columns, rule):
+    value, other = columns[rule.fields[0]], columns[rule.fields[1]]
+    return _filled_mask(value) & np.not_equal(_without_na(value), _without_na(other))
+
+
+def _check_min_length(columns, rule):
+    return _strings(columns[rule.fields[0]]).str.len().fillna(0).to_numpy() >= rule.params["min"]
+
+
+def _check_regex(columns, rule):
+    matches = _strings(columns[rule.fields[0]]).str.fullmatch(rule.params["pattern"])
+    return matches.fillna(False).to_numpy(dtype=bool)
+
+
+def _check_all_present(columns, rule):
+    passed = np.ones(len(columns[rule.fields[0]]), dtype=bool)
+    for path in rule.fields:
+        passed &= _filled_mask(columns[path])
+    return passed
+
+
+def _check_coverage(columns, rule):
+    types = _without_na(columns["analytical_type"])
+    passed = np.ones(len(types), dtype=bool)
+    for analytical_type, paths in rule.params["by_analytical_type"].items():
+        covered = np.ones(len(types), dtype=bool)
+        for path in paths:
+            covered &= _filled_mask(columns[path])
+        passed &= (types != analytical_type) | covered
+    return passed
+
+
+# check -> (predicate, required parameters)
+CHECKS = {
+    "present": (_check_present, ("field",)),
+    "not_null": (_check_not_null, ("field",)),
+    "distinct": (_check_distinct, ("field", "other")),
+    "min_length": (_check_min_length, ("field", "min")),
+    "regex": (_check_regex, ("field", "pattern")),
+    "all_present": (_check_all_present, ("fields",)),
+    "coverage": (_check_coverage, ("by_analytical_type",)),
+}
+
+
+# =============================================================================
+# 2. RULE COMPILER
+# =============================================================================
+def compile_rule(spec):
+    """Validates one rule mapping of the rules file into a QualityRule (ValueError if malformed)."""
+    if not isinstance(spec, dict) or "id" not in spec or "check" not in spec:
+        raise ValueError(f"Quality rules need an 'id' and a 'check': {spec!r}")
+    rule_id, check = str(spec["id"]), spec["check"]
+    if check not in CHECKS:
+        raise ValueError(f"Unknown quality check '{check}' in rule '{rule_id}'")
+    missing = [key for key in CHECKS[check][1] if key not in spec]
+    if missing:
+        raise ValueError(f"Quality rule '{rule_id}' ({check}) needs: {', '.join(missing)}")
+
+    params = {key: value for key, value in spec.items() if key not in RULE_KEYS}
+    if check == "regex":
+        try:
+            params["pattern"] = re.compile(spec["pattern"])
+        except re.error as e:
+            raise ValueError(f"Invalid pattern in quality rule '{rule_id}': {e}") from e
+    if check == "min_length":
+        params["min"] = int(spec["min"])
+    if check == "coverage":
+        params["by_analytical_type"] = {key: tuple(paths) for key, paths in spec["by_analytical_type"].items()}
+
+    if check == "coverage":
+        fields = ("analytical_type", *(p for paths in params["by_analytical_type"].values() for p in paths))
+    elif check == "all_present":
+        fields = tuple(spec["fields"])
+    else:
+        fields = (spec["field"], *([spec["other"]] if check == "distinct" else []))
+
+    return QualityRule(
+        id=rule_id,
+        label=str(spec.get("label") or rule_id),
+        dimension=str(spec.get("dimension") or ""),
+        points=int(spec.get("points", 0)),
+        check=check,
+        fields=tuple(dict.fromkeys(fields)),
+        params=params,
+        requires=spec.get("requires"),
+    )
+
+
+class RuleSet:
+    """
+    A compiled quality profile: its rules, weights and grade thresholds. Evaluation extracts each
+    referenced field once into an object column, then runs every rule as one predicate over them.
+    """
+
+    __slots__ = ("profile", "label", "rules", "labels", "points", "thresholds", "paths", "_requires")
+
+    def __init__(self, profile, rules, grades=None, label=None):
+        self.profile = profile
+        self.label = label or profile
+        self.rules = tuple(rules)
+        self.labels = tuple(rule.label for rule in self.rules)
+        self.points = np.array([rule.points for rule in self.rules], dtype=np.int64)
+        if self.points.sum() <= 0:
+            raise ValueError(f"Quality profile '{profile}' awards no points")
+        grades = {**DEFAULT_GRADES, **(grades or {})}
+        self.thresholds = (int(grades["gold"]), int(grades["silver"]))
+        self.paths = tuple(dict.fromkeys(path for rule in self.rules for path in rule.fields))
+
+        ids = [rule.id for rule in self.rules]
+        self._requires = []
+        for k, rule in enumerate(self.rules):
+            if rule.requires is None:
+                continue
+            if rule.requires not in ids:
+                raise ValueError(f"Quality rule '{rule.id}' requires unknown rule '{rule.requires}'")
+            self._requires.append((k, ids.index(rule.requires)))
+
+    def evaluate(self, variables, timings=None):
+        """
+        (passed, reported) boolean matrices of shape (variables x rules): `reported` marks the rules
+        listed as missing (failed, and whose required rule passed). Milliseconds spent on the
+        extraction and on each rule are added to `timings` when given.
+        """
+        timings = timings if timings is not None else {}
+        start = time.perf_counter()
+        columns = _extract(variables, self.paths)
+        timings[EXTRACTION] = timings.get(EXTRACTION, 0.0) + (time.perf_counter() - start) * 1000
+
+        passed = np.ones((len(variables), len(self.rules)), dtype=bool)
+        if variables:
+            for k, rule in enumerate(self.rules):
+                start = time.perf_counter()
+                passed[:, k] = CHECKS[rule.check][0](columns, rule)
+                timings[rule.id] = timings.get(rule.id, 0.0) + (time.perf_counter() - start) * 1000
+
+        reported = ~passed
+        for k, required in self._requires:
+            reported[:, k] &= passed[:, required]
+        return passed, reported
+
+    def scores(self, passed):
+        """Share (%) of the profile's points earned by each row of `passed`."""
+        earned = passed.astype(np.int64) @ self.points
+        return np.rint(earned * 100 / self.points.sum()).astype(np.int64)
+
+    def grade_codes(self, scores):
+        """Index into GRADES of each score."""
+        return np.searchsorted(-np.asarray(self.thresholds), -np.asarray(scores), side="left")
+
+
+def compile_profile(profiles, profile):
+    """The RuleSet of `profile`, with `extends` chains resolved (child rules replace parents' by id)."""
+    chain, name = [], profile
+    while name is not None:
+        if name in chain:
+            raise ValueError(f"Quality profile '{profile}' extends itself through '{name}'")
+        if name not in profiles:
+            raise ValueError(f"Unknown quality profile '{name}'")
+        chain.append(name)
+        name = (profiles[name] or {}).get("extends")
+
+    specs, grades = {}, {}
+    for name in reversed(chain):
+        definition = profiles[name] or {}
+        grades.update(definition.get("grades") or {})
+        for spec in definition.get("rules") or []:
+            rule = compile_rule(spec)
+            specs[rule.id] = rule
+    return RuleSet(profile, specs.values(), grades, (profiles[profile] or {}).get("label"))
+
+
+_compiled = {}
+
+
+def load_quality_rules(profile=None, path=QUALITY_RULES_PATH):
+    """
+    The compiled RuleSet of `profile` (the file's default_profile when None). Compiled once and
+    recompiled only after the rules file changes on disk.
+    """
+    document = load_config(path) or {}
+    profiles = document.get("profiles") or {}
+    profile = profile or document.get("default_profile") or next(iter(profiles), None)
+    cached = _compiled.get((path, profile))
+    if cached is not None and cached[0] is document:
+        return cached[1]
+    ruleset = compile_profile(profiles, profile)
+    _compiled[(path, profile)] = (document, ruleset)
+    return ruleset
+
+
+def quality_profiles(path=QUALITY_RULES_PATH):
+    """Profile ids of the rules file mapped to their display labels, default profile first."""
+    document = load_config(path) or {}
+    profiles = document.get("profiles") or {}
+    default = document.get("default_profile")
+    order = sorted(profiles, key=lambda name: name != default)
+    return {name: str((profiles[name] or {}).get("label") or name) for name in order}
+
+
+def _extract(variables, paths):
+    """
+    Object columns of the dotted `paths`. Each parent (e.g. 'governance') is extracted once and
+    shared by its children; lookups map dict.get over whole columns.
+    """
+    columns = {(): np.fromiter(variables, dtype=object, count=len(variables))}
+
+    def column(keys):
+        if keys not in columns:
+            parent = column(keys[:-1])
+            if len(keys) > 1:
+                # Missing or malformed sections read as empty
+                parent = [value if isinstance(value, dict) else _EMPTY for value in parent]
+            columns[keys] = np.fromiter(map(methodcaller("get", keys[-1]), parent), dtype=object, count=len(variables))
+        return columns[keys]
+
+    return {path: column(tuple(path.split("."))) for path in paths}
+
+
+_EMPTY = {}
+
+
+# =============================================================================
+# 3. REPORTS & INCREMENTAL ENGINE
+# =============================================================================
+class QualityReport(NamedTuple):
+    """Graded dictionary snapshot: row i of every array describes variable i (registry order)."""
+
+    names: list
+    scores: np.ndarray
+    grades: np.ndarray
+    labels: tuple
+    missing: np.ndarray
+
+    def counts(self):
+        """Number of variables per grade, e.g. {'Gold': 3, 'Silver': 1, 'Bronze': 0}."""
+        return dict(zip(GRADES, np.bincount(self.grades, minlength=len(GRADES)).tolist(), strict=True))
+
+    def grade_labels(self):
+        return np.asarray(GRADES, dtype=object)[self.grades]
+
+    def missing_for(self, position):
+        """Labels of the rules variable `position` misses (none once it is Gold)."""
+        if self.grades[position] == 0:
+            return []
+        return [label for label, miss in zip(self.labels, self.missing[position], strict=True) if miss]
+
+    def grade_frame(self, labels=GRADES):
+        """Variable, Grade (categorical, shown through `labels`) and numeric Score columns; no per-row Python."""
+        return pd.DataFrame(
+            {
+                "Variable": self.names,
+                "Grade": pd.Categorical.from_codes(self.grades, categories=list(labels)),
+                "Score": self.scores,
+            }
+        )
+
+    def frame(self):
+        """The audit table: one row per variable with its grade, score and what it lacks for Gold."""
+        gaps = np.full(len(self.names), "", dtype=object)
+        for k, label in enumerate(self.labels):
+            gaps = gaps + np.where(self.missing[:, k], f", {label}", "").astype(object)
+        gaps = np.where((self.grades == 0) | (gaps == ""), "✅ Perfect", gaps)
+        return pd.DataFrame(
+            {
+                "Variable": self.names,
+                "Grade": self.grade_labels(),
+                "Score": [f"{score}%" for score in self.scores.tolist()],
+                "Missing for Gold": [gap.removeprefix(", ") for gap in gaps.tolist()],
+            }
+        )
+
+
+class QualityEngine:
+    """
+    Quality grades of a VariableRegistry under a rule profile. Rule results are kept in slot arrays
+    keyed by variable_id: a rerun without edits returns the cached report, and an edit re-evaluates
+    only the variables changed since the last report before the dictionary is re-gathered in
+    registry order. Plain lists are graded in one batch without caching.
+
+    `timings` holds the milliseconds per rule (and for the field extraction) of the last evaluation,
+    `evaluated` the number of variables it covered.
+    """
+
+    __slots__ = (
+        "rules_path",
+        "timings",
+        "evaluated",
+        "_ruleset",
+        "_slots",
+        "_free",
+        "_names",
+        "_passed",
+        "_reported",
+        "_order",
+        "_revision",
+        "_report",
+    )
+
+    def __init__(self, rules_path=QUALITY_RULES_PATH):
+        self.rules_path = rules_path
+        self.timings = {}
+        self.evaluated = 0
+        self._ruleset = None
+        self._revision = None
+        self._report = None
+
+    def report(self, variables, profile=None):
+        """The QualityReport of `variables` (a VariableRegistry or a list of variable dicts)."""
+        ruleset = load_quality_rules(profile, self.rules_path)
+        revision = getattr(variables, "revision", None)
+        if revision is None:
+            variables = list(variables)
+            passed, reported = self._evaluate(ruleset, variables)
+            scores = ruleset.scores(passed)
+            names = [var.get("name") for var in variables]
+            return QualityReport(names, scores, ruleset.grade_codes(scores), ruleset.labels, reported)
+
+        if ruleset is not self._ruleset:
+            self._ruleset = ruleset
+            self._revision = None
+        elif revision == self._revision and self._report is not None:
+            return self._report
+        self._report = self._refresh(variables)
+        self._revision = revision
+        return self._report
+
+    def _evaluate(self, ruleset, variables):
+        self.timings = {}
+        self.evaluated = len(variables)
+        return ruleset.evaluate(variables, self.timings)
+
+    def _refresh(self, registry):
+        changed = registry.changed_since(self._revision) if self._revision is not None else None
+        # First report, new profile, or most of the dictionary changed (e.g. a project load): one batch
+        if changed is None or len(changed) > len(registry) // 4:
+            return self._rebuild(registry)
+
+        # 1. Free the slots of deleted variables
+        removed = self._slots.keys() - registry.variable_ids()
+        for variable_id in removed:
+            self._free.append(self._slots.pop(variable_id))
+
+        # 2. Re-evaluate only what was inserted, replaced or touched since the last report
+        added = [variable_id for variable_id in changed if variable_id not in self._slots]
+        for variable_id in added:
+            self._slots[variable_id] = self._free.pop() if self._free else self._allocate()
+        moved = False
+        if changed:
+            positions = [registry.index_of_id(variable_id) for variable_id in changed]
+            rows = np.fromiter((self._slots[variable_id] for variable_id in changed), dtype=np.intp, count=len(changed))
+            variables = [registry[position] for position in positions]
+            self._passed[rows], self._reported[rows] = self._evaluate(self._ruleset, variables)
+            self._names[rows] = [var.get("name") for var in variables]
+            # A re-inserted variable keeps its slot but may now sit elsewhere
+            moved = any(
+                position >= len(self._order) or self._order[position] != row
+                for position, row in zip(positions, rows.tolist(), strict=True)
+            )
+
+        # 3. Registry order, rebuilt only when the layout changed
+        if removed or added or moved or len(self._order) != len(registry):
+            self._order = np.fromiter(
+                (self._slots[var["variable_id"]] for var in registry), dtype=np.intp, count=len(registry)
+            )
+        return self._gather()
+
+    def _rebuild(self, registry):
+        variables = list(registry)
+        self._slots = {var["variable_id"]: slot for slot, var in enumerate(variables)}
+        self._free = []
+        self._passed, self._reported = self._evaluate(self._ruleset, variables)
+        self._names = np.empty(len(variables), dtype=object)
+        self._names[:] = [var.get("name") for var in variables]
+        self._order = np.arange(len(variables), dtype=np.intp)
+        return self._gather()
+
+    def _gather(self):
+        """The report in registry order, gathered from the slot arrays."""
+        order = self._order
+        scores = self._ruleset.scores(self._passed[order])
+        grades = self._ruleset.grade_codes(scores)
+        return QualityReport(self._names[order].tolist(), scores, grades, self._ruleset.labels, self._reported[order])
+
+    def _allocate(self):
+        """Next unused slot, doubling the slot arrays when full."""
+        slot = len(self._slots) + len(self._free)
+        if slot >= len(self._names):
+            capacity = max(64, 2 * len(self._names))
+            self._names = np.resize(self._names, capacity)
+            self._passed = np.resize(self._passed, (capacity, len(self._ruleset.rules)))
+            self._reported = np.resize(self._reported, (capacity, len(self._ruleset.rules)))
+        return slot
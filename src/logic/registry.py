@@ -0,0 +1,243 @@
+"""
+Description: Variable Registry for Dictionary Forge
+List-compatible containers for the dictionary and the pending ingestion queue that keep
+hash indexes (name -> position, variable_id -> position, queued-name set) in sync, so
+lookups and duplicate checks are O(1) instead of scans over st.session_state lists.
+The registry also versions each entry so derived views (e.g. the ledger) refresh incrementally.
+"""
+
+from collections.abc import MutableSequence
+
+from .store import new_variable_id
+
+
+class VariableRegistry(MutableSequence):
+    """
+    Ordered dictionary variables with name and stable-ID indexes.
+    Appends update the indexes in O(1); inserts/deletes in the middle shift positions, so the
+    indexes are rebuilt lazily (once) on the next lookup. Renames must go through rename().
+
+    Every mutation advances `revision`; each variable_id maps to the revision at which it last
+    changed, so caches can tell exactly which entries to recompute.
+    """
+
+    __slots__ = ("_items", "_by_name", "_by_id", "_stale", "_versions", "_revision")
+
+    def __init__(self, variables=()):
+        self._items = []
+        self._by_name = {}
+        self._by_id = {}
+        self._stale = False
+        self._versions = {}
+        self._revision = 0
+        self.extend(variables)
+
+    # --- Sequence protocol ---
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, variable):
+        if isinstance(index, slice):
+            self._forget(self._items[index])
+            self._items[index] = [self._identify(v) for v in variable]
+            self._stale = True
+            return
+        old = self._items[index]
+        self._items[index] = self._identify(variable)
+        if old.get("variable_id") != variable["variable_id"]:
+            self._forget([old])
+        if old.get("name") != variable.get("name") or old.get("variable_id") != variable.get("variable_id"):
+            self._stale = True
+
+    def __delitem__(self, index):
+        last = len(self._items) - 1
+        removed = self._items[index]
+        del self._items[index]
+        self._forget(removed if isinstance(index, slice) else [removed])
+        if index in (last, -1) and not self._stale:
+            # Popping the tail shifts nothing, so only its own entries leave the indexes
+            self._unindex(removed, last)
+        else:
+            self._stale = True
+
+    def insert(self, index, variable):
+        variable = self._identify(variable)
+        if index >= len(self._items) and not self._stale:
+            self._items.append(variable)
+            self._index(variable, len(self._items) - 1)
+        else:
+            self._items.insert(index, variable)
+            self._stale = True
+
+    def clear(self):
+        self._items.clear()
+        self._by_name.clear()
+        self._by_id.clear()
+        self._versions.clear()
+        self._revision += 1
+        self._stale = False
+
+    def __repr__(self):
+        return f"VariableRegistry({self._items!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, VariableRegistry):
+            return self._items == other._items
+        return self._items == other
+
+    __hash__ = None
+
+    # --- Indexed lookups ---
+    def index_of(self, name):
+        """Position of the first variable called `name`, or None."""
+        self._refresh()
+        return self._by_name.get(name)
+
+    def get(self, name, default=None):
+        i = self.index_of(name)
+        return self._items[i] if i is not None else default
+
+    def has_name(self, name):
+        return self.index_of(name) is not None
+
+    def index_of_id(self, variable_id):
+        self._refresh()
+        return self._by_id.get(variable_id)
+
+    def names(self):
+        return [v.get("name") for v in self._items]
+
+    def rename(self, index, new_name):
+        """Renames in place; the variable keeps its stable ID."""
+        self._items[index]["name"] = new_name
+        self.touch(index)
+        self._stale = True
+
+    # --- Versioning ---
+    @property
+    def revision(self):
+        """Advances on every mutation; equal revisions guarantee identical contents."""
+        return self._revision
+
+    def version_of(self, variable_id):
+        """Revision at which the variable was last inserted or replaced (None if unknown)."""
+        return self._versions.get(variable_id)
+
+    def changed_since(self, revision):
+        """variable_ids inserted, replaced or touched after `revision`."""
+        return [variable_id for variable_id, version in self._versions.items() if version > revision]
+
+    def variable_ids(self):
+        """The registered variable_ids, as a set-like view (unordered)."""
+        return self._versions.keys()
+
+    def touch(self, index):
+        """Marks an entry as changed after an in-place edit of its dict."""
+        self._revision += 1
+        self._versions[self._items[index]["variable_id"]] = self._revision
+
+    # --- Internals ---
+    def _identify(self, variable):
+        """
+        Every registered variable carries a stable ID (kept across edits, renames and reloads)
+        and is stamped with the revision that (re)introduced it.
+        """
+        if not variable.get("variable_id"):
+            variable["variable_id"] = new_variable_id()
+        self._revision += 1
+        self._versions[variable["variable_id"]] = self._revision
+        return variable
+
+    def _forget(self, removed):
+        self._revision += 1
+        for variable in removed:
+            self._versions.pop(variable.get("variable_id"), None)
+
+    def _index(self, variable, position):
+        self._by_name.setdefault(variable.get("name"), position)
+        self._by_id.setdefault(variable["variable_id"], position)
+
+    def _unindex(self, variable, position):
+        if self._by_name.get(variable.get("name")) == position:
+            del self._by_name[variable.get("name")]
+        if self._by_id.get(variable.get("variable_id")) == position:
+            del self._by_id[variable["variable_id"]]
+
+    def _refresh(self):
+        if not self._stale:
+            return
+        self._by_name.clear()
+        self._by_id.clear()
+        for position, variable in enumerate(self._items):
+            self._index(variable, position)
+        self._stale = False
+
+
+class PendingQueue(MutableSequence):
+    """
+    Ordered pending-ingestion names with a membership set for O(1) dedupe.
+    Names are unique: inserting a queued name is a no-op.
+    """
+
+    __slots__ = ("_names", "_members")
+
+    def __init__(self, names=()):
+        self._names = []
+        self._members = set()
+        self.extend(names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        return self._names[index]
+
+    def __setitem__(self, index, name):
+        self._names[index] = name
+        self._members = set(self._names)
+
+    def __delitem__(self, index):
+        removed = self._names[index]
+        del self._names[index]
+        self._members.difference_update(removed if isinstance(index, slice) else [removed])
+
+    def insert(self, index, name):
+        if name not in self._members:
+            self._names.insert(index, name)
+            self._members.add(name)
+
+    def __contains__(self, name):
+        return name in self._members
+
+    def clear(self):
+        self._names.clear()
+        self._members.clear()
+
+    def __repr__(self):
+        return f"PendingQueue({self._names!r})"
+
+    def discard(self, name):
+        """Drops a name once it has been defined (no-op when it is not queued)."""
+        if name in self._members:
+            self._members.discard(name)
+            self._names.remove(name)
+
+    def add_unique(self, names, exclude=None):
+        """
+        Appends each stripped, non-empty name that is neither queued nor defined in `exclude`
+        (a VariableRegistry). Linear in len(names). Returns the number added.
+        """
+        added = 0
+        for name in names:
+            clean_name = str(name).strip()
+            if not clean_name or clean_name in self._members:
+                continue
+            if exclude is not None and exclude.has_name(clean_name):
+                continue
+            self._names.append(clean_name)
+            self._members.add(clean_name)
+            added += 1
+        return added
@@ -0,0 +1,257 @@
+"""
+Description: Full-Text Search Engine for Dictionary Forge
+Incremental inverted index shared by the ledger filter, the cloning library and the template hub.
+Documents are tokenized per field; a trigram index over the token vocabulary resolves infix
+matches and a sorted vocabulary resolves short prefixes, so a query touches only matching tokens.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+
+# Relative importance of each searchable field when ranking
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "alias": 3.0,
+    "data_steward": 2.0,
+    "compliance_scope": 2.0,
+    "description": 1.0,
+}
+
+# Match quality multipliers: whole token > token prefix > token infix
+EXACT, PREFIX, INFIX = 1.0, 0.8, 0.5
+
+# Runs of Unicode letters and digits ('año', 'größe'); '_' counts as a separator
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    """Case-folded alphanumeric tokens; '_' and punctuation split names like 'customer_income'."""
+    return _TOKEN_PATTERN.findall(unicodedata.normalize("NFC", str(text)).casefold())
+
+
+def variable_document(var):
+    """Searchable fields of a dictionary variable or template payload."""
+    governance = var.get("governance") or {}
+    scope = governance.get("compliance_scope") or []
+    return {
+        "name": var.get("name") or "",
+        "alias": var.get("alias") or "",
+        "description": var.get("description") or "",
+        "data_steward": governance.get("data_steward") or "",
+        "compliance_scope": " ".join(map(str, scope)) if isinstance(scope, list) else str(scope),
+    }
+
+
+class SearchIndex:
+    """
+    Inverted index: token -> {key: best field weight}. Keys are caller-defined (variable_id,
+    template name). add/update/remove touch only the document's own tokens.
+    """
+
+    __slots__ = (
+        "_postings",
+        "_doc_tokens",
+        "_order",
+        "_next_order",
+        "_trigrams",
+        "_vocabulary",
+        "_sorted_vocabulary",
+        "_ranked",
+    )
+
+    def __init__(self):
+        self._postings = {}
+        self._doc_tokens = {}
+        self._order = {}
+        self._next_order = 0
+        self._trigrams = {}
+        self._vocabulary = set()
+        self._sorted_vocabulary = None
+        self._ranked = {}
+
+    def __len__(self):
+        return len(self._doc_tokens)
+
+    def __contains__(self, key):
+        return key in self._doc_tokens
+
+    def keys(self):
+        return self._doc_tokens.keys()
+
+    # --- Incremental maintenance ---
+    def update(self, key, document, order=None):
+        """Indexes (or re-indexes) one document given as {field: text}. Re-indexing keeps the tie order."""
+        if key in self._doc_tokens:
+            if order is None:
+                order = self._order[key]
+            self.remove(key)
+
+        weights = {}
+        for field, text in document.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for token in tokenize(text):
+                if weights.get(token, 0.0) < weight:
+                    weights[token] = weight
+
+        for token, weight in weights.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                self._add_vocabulary(token)
+            posting[key] = weight
+            self._ranked.pop(token, None)
+        self._doc_tokens[key] = tuple(weights)
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self._order[key] = order
+
+    def remove(self, key):
+        for token in self._doc_tokens.pop(key, ()):
+            posting = self._postings[token]
+            posting.pop(key, None)
+            self._ranked.pop(token, None)
+            if not posting:
+                del self._postings[token]
+                self._remove_vocabulary(token)
+        self._order.pop(key, None)
+
+    def _add_vocabulary(self, token):
+        self._vocabulary.add(token)
+        self._sorted_vocabulary = None
+        for gram in _trigrams(token):
+            self._trigrams.setdefault(gram, set()).add(token)
+
+    def _remove_vocabulary(self, token):
+        self._vocabulary.discard(token)
+        self._sorted_vocabulary = None
+        for gram in _trigrams(token):
+            tokens = self._trigrams.get(gram)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._trigrams[gram]
+
+    # --- Queries ---
+    def search(self, query, limit=None):
+        """
+        Returns keys matching every query term, best first (ties keep insertion order).
+        An empty query returns all keys in insertion order.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return sorted(self._doc_tokens, key=self._order.__getitem__)[:limit]
+
+        matches = [list(self._matching_tokens(term)) for term in dict.fromkeys(terms)]
+        if not all(matches):
+            return []
+        # The most selective term drives the query; the others only rescore its candidates
+        sizes = [sum(len(self._postings[token]) for token, _ in tokens) for tokens in matches]
+        matches = [tokens for _, tokens in sorted(zip(sizes, matches), key=lambda pair: pair[0])]
+        sizes.sort()
+
+        if len(matches) == 1 and limit is not None:
+            return self._top(matches[0], limit)
+
+        scores = self._score(matches[0])
+        for tokens, size in zip(matches[1:], sizes[1:]):
+            if len(scores) * len(tokens) < size:
+                scores = self._rescore(scores, tokens)
+            else:
+                term_scores = self._score(tokens)
+                scores = {key: s + term_scores[key] for key, s in scores.items() if key in term_scores}
+            if not scores:
+                return []
+
+        rank = lambda key: (-scores[key], self._order[key])  # noqa: E731
+        if limit is not None:
+            return heapq.nsmallest(limit, scores, key=rank)
+        return sorted(scores, key=rank)
+
+    def _score(self, tokens):
+        """Best score per key for one term's matching tokens."""
+        scores = {}
+        for token, quality in tokens:
+            for key, weight in self._postings[token].items():
+                score = weight * quality
+                if scores.get(key, 0.0) < score:
+                    scores[key] = score
+        return scores
+
+    def _rescore(self, scores, tokens):
+        """Adds one term's score to existing candidates, dropping those it does not match."""
+        rescored = {}
+        postings = [(self._postings[token], quality) for token, quality in tokens]
+        for key, score in scores.items():
+            best = 0.0
+            for posting, quality in postings:
+                weight = posting.get(key)
+                if weight is not None and weight * quality > best:
+                    best = weight * quality
+            if best:
+                rescored[key] = score + best
+        return rescored
+
+    def _top(self, tokens, limit):
+        """Top-k for a single term: lazily merges the pre-ranked postings of each matching token."""
+        streams = [_scaled(self._ranked_posting(token), quality) for token, quality in tokens]
+        result, seen = [], set()
+        for _, _, key in heapq.merge(*streams):
+            if key not in seen:
+                seen.add(key)
+                result.append(key)
+                if len(result) == limit:
+                    break
+        return result
+
+    def _ranked_posting(self, token):
+        """(negated weight, order, key) entries of one token, best first; cached until the token changes."""
+        ranked = self._ranked.get(token)
+        if ranked is None:
+            order = self._order
+            ranked = self._ranked[token] = sorted(
+                (-weight, order[key], key) for key, weight in self._postings[token].items()
+            )
+        return ranked
+
+    def _matching_tokens(self, term):
+        """Yields (vocabulary token, match quality) pairs for one query term."""
+        if len(term) < 3:
+            # Too short for trigrams: prefix range over the sorted vocabulary
+            vocabulary = self._sorted()
+            i = bisect_left(vocabulary, term)
+            while i < len(vocabulary) and vocabulary[i].startswith(term):
+                token = vocabulary[i]
+                yield token, EXACT if token == term else PREFIX
+                i += 1
+            return
+
+        candidates = None
+        for gram in _trigrams(term):
+            tokens = self._trigrams.get(gram)
+            if not tokens:
+                return
+            candidates = set(tokens) if candidates is None else candidates & tokens
+        for token in candidates:
+            if token == term:
+                yield token, EXACT
+            elif token.startswith(term):
+                yield token, PREFIX
+            elif term in token:
+                yield token, INFIX
+
+    def _sorted(self):
+        if self._sorted_vocabulary is None:
+            self._sorted_vocabulary = sorted(self._vocabulary)
+        return self._sorted_vocabulary
+
+
+def _scaled(ranked, quality):
+    for weight, order, key in ranked:
+        yield weight * quality, order, key
+
+
+def _trigrams(token):
+    return {token[i : i + 3] for i in range(len(token) - 2)}
@@ -0,0 +1,77 @@
+"""
+Description: Serialization Backends for Dictionary Forge
+Single entry point for YAML and JSON I/O. YAML goes through libyaml's CSafeLoader/CDumper and JSON
+parsing through orjson when they are installed; otherwise the pure-Python implementations are used
+transparently. Documents round-trip identically either way (only YAML line folding may differ).
+"""
+
+import json
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+# Errors raised by load_yaml/loads_json on malformed input (orjson's error subclasses JSONDecodeError)
+YAMLError = yaml.YAMLError
+JSONDecodeError = json.JSONDecodeError
+
+
+def backends():
+    """Names of the active YAML and JSON backends, e.g. for diagnostics and benchmarks."""
+    return {
+        "yaml": "libyaml" if YAML_LOADER is not yaml.SafeLoader else "pyyaml",
+        "json": "orjson" if orjson is not None else "json",
+    }
+
+
+# =============================================================================
+# 1. YAML
+# =============================================================================
+def load_yaml(stream):
+    """Parses a YAML document from a string, bytes or an open file (safe subset only)."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def dump_yaml(data, stream=None, sort_keys=False):
+    """Serializes `data` as block-style YAML; returns the text when `stream` is None."""
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER, sort_keys=sort_keys)
+
+
+# =============================================================================
+# 2. JSON
+# =============================================================================
+def loads_json(content):
+    """Parses a JSON document from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def load_json(f):
+    """Parses a JSON document from an open file."""
+    return loads_json(f.read())
+
+
+def dumps_json(value, indent=None, sort_keys=False, default=None):
+    """
+    Serializes `value` to a JSON string. Compact output uses orjson when available; indented output
+    always uses the stdlib C encoder so the layout (e.g. indent=4 exports) stays exact.
+    """
+    if orjson is not None and indent is None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: fall through to the stdlib encoder
+    return json.dumps(value, indent=indent, sort_keys=sort_keys, default=default)
+
+
+def dump_json(value, f, indent=4):
+    """Writes `value` as JSON to an open text file."""
+    f.write(dumps_json(value, indent=indent))
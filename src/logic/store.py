@@ -0,0 +1,290 @@
+"""
+Description: Durable Project Store for Dictionary Forge
+Persists the dictionary in SQLite (WAL mode). Every save appends one revision row holding the
+variable's JSON sections and repoints a small 'heads' index, so an edit costs O(1) regardless of
+project size. Projects are read back in keyset-paged batches.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from constants import ROOT_DIR
+
+from .serialization import dumps_json, loads_json
+
+# One SQLite file per project key, so separate projects (and sessions) never share a store
+STORE_DIR = os.path.join(ROOT_DIR, "projects")
+
+# Project keys come from the URL: restricted to a safe file name
+_PROJECT_KEY = re.compile(r"[0-9a-f]{32}")
+
+# Nested sections stored as individual JSON columns; everything else lives in 'core'
+SECTIONS = ("constraints", "cleaning", "visualization", "governance", "database_mapping")
+
+# Variables fetched per round-trip when reading a project back
+PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS revisions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    variable_id TEXT NOT NULL,
+    saved_at TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    name TEXT,
+    core TEXT,
+    constraints TEXT,
+    cleaning TEXT,
+    visualization TEXT,
+    governance TEXT,
+    database_mapping TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_revisions_variable ON revisions(variable_id, seq);
+
+CREATE TABLE IF NOT EXISTS heads (
+    variable_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_heads_position ON heads(position);
+
+CREATE TABLE IF NOT EXISTS project (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+# ==============================================================================
+# 1. CONNECTION
+# ==============================================================================
+
+
+def new_project_key():
+    """Random key naming a new project's store file."""
+    return uuid.uuid4().hex
+
+
+def is_project_key(key):
+    return isinstance(key, str) and _PROJECT_KEY.fullmatch(key) is not None
+
+
+def store_path(project_key, root=STORE_DIR):
+    """Store file of one project; rejects anything that is not a new_project_key() (e.g. a path)."""
+    if not is_project_key(project_key):
+        raise ValueError(f"Invalid project key: {project_key!r}")
+    return os.path.join(root, f"{project_key}.db")
+
+
+def open_store(path):
+    """
+    Opens (creating if needed) a project store. WAL lets readers proceed during a save and
+    makes each commit a sequential append to the log.
+    """
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    conn = _connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class StoreConnections:
+    """
+    Thread-confined connections to one store file. Streamlit runs every session's script on its own
+    thread; sharing one connection would let their `with conn:` transactions interleave, so each
+    thread gets its own and SQLite (WAL) serializes the writers.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Creates the schema once (and surfaces an unusable path right away)
+        open_store(path).close()
+        self._local = threading.local()
+
+    def get(self):
+        """The calling thread's connection (closed when the thread ends)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path)
+        return conn
+
+
+def _connect(path):
+    # The timeout lets a writer wait for another thread's commit instead of failing with "database is locked"
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def new_variable_id():
+    """Stable identity that survives renames (used to match revisions, diffs and migrations)."""
+    return uuid.uuid4().hex
+
+
+# ==============================================================================
+# 2. APPEND-ONLY WRITES
+# ==============================================================================
+
+
+def save_variables(conn, variables):
+    """
+    Appends one revision per variable inside a single transaction and returns their IDs.
+    Variables without a 'variable_id' are assigned one in place and appended to the project's order.
+    """
+    saved_at = datetime.now(UTC).isoformat(timespec="seconds")
+    ids = []
+
+    with _write_transaction(conn):
+        next_position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM heads").fetchone()[0]
+        for var in variables:
+            variable_id = var.setdefault("variable_id", new_variable_id())
+            seq = conn.execute(
+                f"INSERT INTO revisions (variable_id, saved_at, name, core, {', '.join(SECTIONS)}) "
+                f"VALUES (?, ?, ?, ?, {', '.join('?' * len(SECTIONS))})",
+                (variable_id, saved_at, *_encode(var)),
+            ).lastrowid
+
+            moved = conn.execute("UPDATE heads SET seq = ? WHERE variable_id = ?", (seq, variable_id)).rowcount
+            if not moved:
+                conn.execute("INSERT INTO heads VALUES (?, ?, ?)", (variable_id, next_position, seq))
+                next_position += 1
+            ids.append(variable_id)
+    return ids
+
+
+@contextmanager
+def _write_transaction(conn):
+    """
+    Transaction holding SQLite's write lock from the start (BEGIN IMMEDIATE), so what it reads
+    (e.g. the next free position) cannot be invalidated by another connection's commit.
+    """
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        yield
+
+
+def save_variable(conn, variable):
+    """Autosave entry point for a single committed variable."""
+    return save_variables(conn, [variable])[0]
+
+
+def delete_variables(conn, variable_ids):
+    """Records a tombstone revision per variable and drops it from the current project."""
+    saved_at = datetime.now(UTC).isoformat(timespec="seconds")
+    with conn:
+        for variable_id in variable_ids:
+            conn.execute(
+                "INSERT INTO revisions (variable_id, saved_at, deleted) VALUES (?, ?, 1)",
+                (variable_id, saved_at),
+            )
+            conn.execute("DELETE FROM heads WHERE variable_id = ?", (variable_id,))
+
+
+def clear_variables(conn):
+    """Tombstones every current variable (history is kept until compact())."""
+    saved_at = datetime.now(UTC).isoformat(timespec="seconds")
+    with conn:
+        conn.execute(
+            "INSERT INTO revisions (variable_id, saved_at, deleted) SELECT variable_id, ?, 1 FROM heads",
+            (saved_at,),
+        )
+        conn.execute("DELETE FROM heads")
+
+
+def compact(conn):
+    """Drops superseded revisions and tombstones, then folds the WAL back into the database."""
+    with conn:
+        conn.execute("DELETE FROM revisions WHERE seq NOT IN (SELECT seq FROM heads)")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def _encode(var):
+    core = {k: v for k, v in var.items() if k not in SECTIONS and k != "variable_id"}
+    sections = [dumps_json(var[s]) if s in var else None for s in SECTIONS]
+    return (var.get("name"), dumps_json(core), *sections)
+
+
+# ==============================================================================
+# 3. PAGED READS
+# ==============================================================================
+
+
+def count_variables(conn):
+    return conn.execute("SELECT COUNT(*) FROM heads").fetchone()[0]
+
+
+def load_page(conn, offset=0, limit=PAGE_SIZE, sections=SECTIONS):
+    """
+    Returns one page of current variables in project order.
+    Pass a subset of `sections` (e.g. ()) to skip decoding heavy JSON columns when listing.
+    """
+    query = _select(sections) + " ORDER BY h.position LIMIT ? OFFSET ?"
+    return [_decode(row, sections) for row in conn.execute(query, (limit, offset))]
+
+
+def iter_variables(conn, page_size=PAGE_SIZE, sections=SECTIONS):
+    """Yields every current variable, fetching keyset-paged batches (no OFFSET rescans)."""
+    query = _select(sections) + " WHERE h.position > ? ORDER BY h.position LIMIT ?"
+    last_position = -1
+    while True:
+        rows = conn.execute(query, (last_position, page_size)).fetchall()
+        for row in rows:
+            yield _decode(row, sections)
+        if len(rows) < page_size:
+            return
+        last_position = rows[-1][0]
+
+
+def load_variables(conn):
+    """Materialises the whole project (the in-session dictionary list)."""
+    return list(iter_variables(conn))
+
+
+def load_history(conn, variable_id):
+    """Returns every revision of one variable, oldest first (tombstones as None)."""
+    columns = "".join(f", {s}" for s in SECTIONS)
+    query = f"SELECT seq, variable_id, deleted, core{columns} FROM revisions WHERE variable_id = ? ORDER BY seq"
+    history = []
+    for seq, vid, deleted, *payload in conn.execute(query, (variable_id,)):
+        history.append(None if deleted else _decode((seq, vid, *payload), SECTIONS))
+    return history
+
+
+def _select(sections):
+    columns = "".join(f", r.{s}" for s in sections)
+    return f"SELECT h.position, h.variable_id, r.core{columns} FROM heads h JOIN revisions r ON r.seq = h.seq"
+
+
+def _decode(row, sections):
+    _, variable_id, core, *payloads = row
+    var = loads_json(core)
+    for section, payload in zip(sections, payloads):
+        if payload is not None:
+            var[section] = loads_json(payload)
+    var["variable_id"] = variable_id
+    return var
+
+
+# ==============================================================================
+# 4. PROJECT METADATA
+# ==============================================================================
+
+
+def save_project_info(conn, project_info):
+    with conn:
+        conn.execute(
+            "INSERT INTO project (key, value) VALUES ('project_info', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (dumps_json(project_info),),
+        )
+
+
+def load_project_info(conn):
+    row = conn.execute("SELECT value FROM project WHERE key = 'project_info'").fetchone()
+    return loads_json(row[0]) if row else None
@@ -0,0 +1,225 @@
+"""
+Description: Template Manifest Index for Dictionary Forge
+Keeps a persisted manifest (name, label, analytical/data type, tags, checksum and searchable text) of
+every template file, so the library can be listed, searched and filtered without opening each YAML.
+A refresh only stats the directory; files whose (mtime, size) changed are re-hashed, and re-parsed
+only when their checksum differs. Full payloads are loaded lazily, one template at a time.
+"""
+
+import hashlib
+import os
+import threading
+from typing import NamedTuple
+
+from .file_store import atomic_write
+from .search import SearchIndex, variable_document
+from .serialization import YAMLError, dumps_json, load_yaml, loads_json
+
+MANIFEST_FILE = ".manifest.json"
+TEMPLATE_SUFFIX = ".yaml"
+
+# Bump when the entry layout changes; older manifests are then rebuilt from the files
+MANIFEST_VERSION = 1
+
+
+class TemplateEntry(NamedTuple):
+    """Manifest record of one template file. `document` holds its searchable fields."""
+
+    name: str
+    label: str
+    analytical_type: str
+    data_type: str
+    tags: tuple
+    checksum: str
+    document: dict
+
+
+def template_entry(name, payload, checksum):
+    """Builds the manifest record of a parsed template payload."""
+    payload = payload if isinstance(payload, dict) else {}
+    scope = (payload.get("governance") or {}).get("compliance_scope") or []
+    tags = payload.get("tags") or []
+    # Explicit tags plus the role and compliance scopes, normalized for filtering
+    tags = [
+        *(tags if isinstance(tags, list) else [tags]),
+        payload.get("role"),
+        *(scope if isinstance(scope, list) else [scope]),
+    ]
+    document = variable_document(payload)
+    document["name"] = f"{name} {document['name']}"
+    return TemplateEntry(
+        name=name,
+        label=str(payload.get("label") or payload.get("name") or name),
+        analytical_type=str(payload.get("analytical_type") or ""),
+        data_type=str(payload.get("data_type") or ""),
+        tags=tuple(sorted({str(t).lower() for t in tags if t})),
+        checksum=checksum,
+        document=document,
+    )
+
+
+class TemplateManifest:
+    """
+    Incrementally maintained index of a template directory. Safe to share across sessions: refreshes
+    are serialized by a lock and readers receive TemplateEntry tuples, never the parsed payloads.
+    """
+
+    def __init__(self, directory, manifest_path=None):
+        self.directory = directory
+        self.manifest_path = manifest_path or os.path.join(directory, MANIFEST_FILE)
+        self._entries = {}
+        self._signatures = {}
+        self._index = SearchIndex()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+    def refresh(self):
+        """Brings the manifest in line with the directory. Returns True if anything changed."""
+        with self._lock:
+            if not self._loaded:
+                self._read_manifest()
+                self._loaded = True
+
+            current = self._scan()
+            changed = False
+            for name in self._entries.keys() - current.keys():
+                self._drop(name)
+                changed = True
+
+            for name, (path, signature) in current.items():
+                if self._signatures.get(name) == signature:
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                except OSError:
+                    continue
+                checksum = hashlib.sha256(content).hexdigest()
+                entry = self._entries.get(name)
+                if entry is None or entry.checksum != checksum:
+                    try:
+                        payload = load_yaml(content)
+                    except YAMLError:  # malformed file: listed, but without metadata
+                        payload = None
+                    entry = template_entry(name, payload, checksum)
+                    self._entries[name] = entry
+                    self._index.update(name, entry.document)
+                self._signatures[name] = signature
+                changed = True
+
+            if changed:
+                self._write_manifest()
+            return changed
+
+    def _scan(self):
+        found = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(TEMPLATE_SUFFIX) or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    name = entry.name[: -len(TEMPLATE_SUFFIX)]
+                    found[name] = (entry.path, (stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            pass
+        return found
+
+    def _drop(self, name):
+        self._entries.pop(name, None)
+        self._signatures.pop(name, None)
+        self._index.remove(name)
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "rb") as f:
+                data = loads_json(f.read())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return
+        for record in data.get("templates", []):
+            try:
+                entry = TemplateEntry(**{field: record[field] for field in TemplateEntry._fields})
+                signature = tuple(record["signature"])
+            except (KeyError, TypeError):
+                continue
+            entry = entry._replace(tags=tuple(entry.tags))
+            self._entries[entry.name] = entry
+            self._signatures[entry.name] = signature
+            self._index.update(entry.name, entry.document)
+
+    def _write_manifest(self):
+        records = [
+            {**entry._asdict(), "signature": list(self._signatures[name])}
+            for name, entry in sorted(self._entries.items())
+        ]
+        content = dumps_json({"version": MANIFEST_VERSION, "templates": records}).encode("utf-8")
+        try:
+            atomic_write(self.manifest_path, content)
+        except OSError:
+            # The manifest is only a cache: a read-only library still works from memory
+            pass
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def names(self):
+        """Template names, sorted."""
+        self.refresh()
+        return sorted(self._entries)
+
+    def entries(self):
+        """All manifest entries, sorted by name."""
+        self.refresh()
+        return [self._entries[name] for name in sorted(self._entries)]
+
+    def get(self, name):
+        """The manifest entry of `name`, or None."""
+        self.refresh()
+        return self._entries.get(name)
+
+    def path_of(self, name):
+        """Path of the full template payload (loaded lazily by the caller)."""
+        return os.path.join(self.directory, f"{name}{TEMPLATE_SUFFIX}")
+
+    def search(self, query="", analytical_type=None, data_type=None, tags=(), names=None):
+        """
+        Template names matching `query` (ranked) and the optional filters (case-insensitive equality;
+        every tag in `tags` must be present). An empty query lists matches by name.
+        """
+        self.refresh()
+        with self._lock:
+            candidates = self._index.search(query) if query and query.strip() else sorted(self._entries)
+            entries = self._entries
+        wanted_tags = {str(t).lower() for t in tags}
+        allowed = set(names) if names is not None else None
+        results = []
+        for name in candidates:
+            entry = entries.get(name)
+            if entry is None or (allowed is not None and name not in allowed):
+                continue
+            if analytical_type and entry.analytical_type.lower() != str(analytical_type).lower():
+                continue
+            if data_type and entry.data_type.lower() != str(data_type).lower():
+                continue
+            if wanted_tags and not wanted_tags.issubset(entry.tags):
+                continue
+            results.append(name)
+        return results
+
+    def facets(self):
+        """Distinct analytical types, data types and tags present in the library, for filter widgets."""
+        self.refresh()
+        entries = list(self._entries.values())
+        return {
+            "analytical_type": sorted({e.analytical_type for e in entries if e.analytical_type}),
+            "data_type": sorted({e.data_type for e in entries if e.data_type}),
+            "tags": sorted({tag for e in entries for tag in e.tags}),
+        }
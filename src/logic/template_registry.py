@@ -0,0 +1,233 @@
+"""
+Description: Unified Template Registry for Dictionary Forge
+Merges the three template sources (standard YAML blueprints, the templates/ library and user JSON
+blueprints) into one normalized index with ID and label hash lookups. Sources are re-validated on
+access through the config cache and the library manifest (at most once per REFRESH_INTERVAL), so
+edits on disk are picked up without a restart while unchanged sources cost a stat per file.
+"""
+
+import threading
+import time
+from typing import NamedTuple
+
+from .blueprints import STANDARD_TEMPLATES_PATH, USER_TEMPLATES_PATH, user_template_store
+from .config_cache import freeze, load_config
+from .serialization import YAMLError
+from .templates import get_template_library
+
+# Template sources, lowest precedence first: on an ID clash the later source wins
+SOURCE_STANDARD = "standard"
+SOURCE_LIBRARY = "library"
+SOURCE_USER = "user"
+PRECEDENCE = (SOURCE_STANDARD, SOURCE_LIBRARY, SOURCE_USER)
+
+# Minimum seconds between two source checks by the lookups: every lookup of one rerun (and of
+# concurrent sessions) shares a single stat pass; refresh() always checks
+REFRESH_INTERVAL = 1.0
+
+# Legacy vocabularies (mostly from templates/*.yaml) mapped onto the master schema's options
+ANALYTICAL_TYPE_ALIASES = {
+    "categorical": "nominal",
+    "boolean": "binary",
+    "numeric": "continuous",
+    "datetime": "time_index",
+}
+DATA_TYPE_ALIASES = {
+    "boolean": "bool",
+    "float": "float64",
+    "integer": "int64",
+    "datetime": "datetime64",
+}
+ROLE_ALIASES = {
+    "dimension": "feature",
+    "measure": "target",
+    "identifier": "id",
+}
+SECTION_KEY_ALIASES = {
+    "constraints": {"is_nullable": "nullable", "is_unique": "unique"},
+    "visualization": {"preferred_chart": "preferred_plot"},
+}
+
+
+class TemplateRecord(NamedTuple):
+    """Index entry of one template; the normalized payload is served by TemplateRegistry.payload."""
+
+    template_id: str
+    label: str
+    source: str
+
+
+def normalize_template(payload):
+    """
+    Returns a normalized (mutable) copy of a template payload: lower-cased types and roles mapped
+    onto the master schema vocabulary, and legacy section keys (is_unique, is_nullable,
+    preferred_chart) renamed to their canonical names.
+    """
+    template = dict(payload) if isinstance(payload, dict) else {}
+    for field, aliases in (
+        ("analytical_type", ANALYTICAL_TYPE_ALIASES),
+        ("data_type", DATA_TYPE_ALIASES),
+        ("role", ROLE_ALIASES),
+    ):
+        if template.get(field):
+            raw = str(template[field]).lower()
+            template[field] = aliases.get(raw, raw)
+
+    for section, renames in SECTION_KEY_ALIASES.items():
+        if isinstance(template.get(section), dict):
+            fields = dict(template[section])
+            for legacy, canonical in renames.items():
+                if legacy in fields:
+                    value = fields.pop(legacy)
+                    fields.setdefault(canonical, value)
+            template[section] = fields
+    return template
+
+
+class TemplateRegistry:
+    """
+    Single cached load path for every template. Lookups are O(1) by ID or label; the index is
+    rebuilt only when one of the sources changed on disk.
+    """
+
+    def __init__(
+        self,
+        standard_path=STANDARD_TEMPLATES_PATH,
+        user_path=USER_TEMPLATES_PATH,
+        library=None,
+        refresh_interval=REFRESH_INTERVAL,
+    ):
+        self.standard_path = standard_path
+        self.user_store = user_template_store(user_path)
+        self.library = library if library is not None else get_template_library()
+        self._sources = None
+        self._records = {}
+        self._by_label = {}
+        self._payloads = {}
+        self._library_payloads = {}
+        self._library_checksums = {}
+        self.refresh_interval = refresh_interval
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+    def refresh(self):
+        """Re-validates the sources and rebuilds the index if any changed. Returns True on rebuild."""
+        standard = _load_section(self.standard_path, "templates")
+        user = self.user_store.load()
+        library = tuple((e.name, e.label, e.checksum) for e in self.library.entries())
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            sources = (standard, user, library)
+            if self._sources is not None and all(a is b or a == b for a, b in zip(sources, self._sources, strict=True)):
+                return False
+
+            records, payloads = {}, {}
+            for template_id, template in standard.items():
+                records[template_id] = TemplateRecord(template_id, _label(template, template_id), SOURCE_STANDARD)
+                payloads[template_id] = template
+            for name, label, _ in library:
+                records[name] = TemplateRecord(name, label, SOURCE_LIBRARY)
+                payloads.pop(name, None)  # resolved lazily from the library
+            for template_id, template in user.items():
+                records[template_id] = TemplateRecord(template_id, _label(template, template_id), SOURCE_USER)
+                payloads[template_id] = template
+
+            # Labels resolve to the highest-precedence template carrying them
+            by_label = {}
+            for source in PRECEDENCE:
+                by_label.update((r.label, r.template_id) for r in records.values() if r.source == source)
+
+            self._records = records
+            self._by_label = by_label
+            self._payloads = {key: freeze(normalize_template(value)) for key, value in payloads.items()}
+            self._library_checksums = {name: checksum for name, _, checksum in library}
+            self._sources = sources
+            return True
+
+    def _fresh(self):
+        """Re-validates the sources unless they were checked within the last refresh_interval."""
+        checked_at = self._checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.refresh_interval:
+            self.refresh()
+
+    def _library_payload(self, name):
+        # Checksums come from the last refresh: a lookup never rescans the library directory
+        checksum = self._library_checksums.get(name)
+        if checksum is None:
+            return None
+        cached = self._library_payloads.get(name)
+        if cached is None or cached[0] != checksum:
+            try:
+                raw = load_config(self.library.path_of(name))
+            except (OSError, YAMLError):
+                return None
+            cached = (checksum, freeze(normalize_template(raw if isinstance(raw, dict) else {})))
+            self._library_payloads[name] = cached
+        return cached[1]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def records(self, source=None):
+        """Index entries in display order (standard, library, user; by label within each)."""
+        self._fresh()
+        rank = {name: i for i, name in enumerate(PRECEDENCE)}
+        records = [r for r in self._records.values() if source is None or r.source == source]
+        return sorted(records, key=lambda r: (rank[r.source], r.label.lower()))
+
+    def labels(self):
+        """Distinct template labels, in display order (each resolves through id_for_label)."""
+        return list(dict.fromkeys(r.label for r in self.records() if self._by_label.get(r.label) == r.template_id))
+
+    def get(self, template_id):
+        """The TemplateRecord of `template_id`, or None."""
+        self._fresh()
+        return self._records.get(template_id)
+
+    def id_for_label(self, label):
+        """Template ID behind a display label, or None."""
+        self._fresh()
+        return self._by_label.get(label)
+
+    def payload(self, template_id):
+        """Normalized, read-only payload of `template_id` (library files are parsed on first use)."""
+        record = self.get(template_id)
+        if record is None:
+            return None
+        if record.source == SOURCE_LIBRARY:
+            return self._library_payload(template_id)
+        return self._payloads.get(template_id)
+
+    def __contains__(self, template_id):
+        return self.get(template_id) is not None
+
+    def __len__(self):
+        self._fresh()
+        return len(self._records)
+
+
+def _load_section(path, section):
+    """The `section` mapping of a YAML template file through the config cache ({} if missing or invalid)."""
+    try:
+        data = load_config(path)
+    except (OSError, YAMLError):
+        return {}
+    templates = data.get(section) if isinstance(data, dict) else None
+    return templates if isinstance(templates, dict) else {}
+
+
+def _label(template, template_id):
+    return str(template.get("label") or template_id) if isinstance(template, dict) else template_id
+
+
+# Process-wide registry shared by every session
+_template_registry = TemplateRegistry()
+
+
+def get_template_registry():
+    """The shared TemplateRegistry over the default template sources."""
+    return _template_registry
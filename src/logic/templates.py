@@ -1,38 +1,56 @@
 """
 Description: Logic for managing variable metadata templates.
-Handles directory discovery, reading YAML templates, and persisting new library entries.
+Handles directory discovery (through the persisted manifest index), reading YAML templates, and
+persisting new library entries.
 """
 
 import os
 
-import yaml
-
 from constants import ROOT_DIR
 
+from .config_cache import load_config
+from .file_store import atomic_write
+from .serialization import dump_yaml
+from .template_manifest import TemplateManifest
+
 TEMPLATES_DIR = os.path.join(ROOT_DIR, "templates")
 
+# Process-wide manifest of the template library (listing, search and filters without parsing files)
+_manifest = TemplateManifest(TEMPLATES_DIR)
+
 
 def get_template_list():
-    """Returns a list of available .yaml template names."""
+    """Returns the sorted list of available .yaml template names."""
     if not os.path.exists(TEMPLATES_DIR):
         os.makedirs(TEMPLATES_DIR, exist_ok=True)
         return []
-    return [f.replace(".yaml", "") for f in os.listdir(TEMPLATES_DIR) if f.endswith(".yaml")]
+    return _manifest.names()
+
+
+def get_template_library():
+    """The shared TemplateManifest of the templates/ directory."""
+    return _manifest
+
+
+def get_template_manifest():
+    """Manifest entries (name, label, analytical/data type, tags, checksum) of the whole library."""
+    return _manifest.entries()
+
+
+def get_template_facets():
+    """Distinct analytical types, data types and tags, for library filter widgets."""
+    return _manifest.facets()
 
 
 def load_template_data(template_name):
-    """Reads a specific template file and returns the dictionary."""
-    path = os.path.join(TEMPLATES_DIR, f"{template_name}.yaml")
-    with open(path) as f:
-        return yaml.safe_load(f)
+    """Returns a specific template's (cached, read-only) dictionary."""
+    return load_config(os.path.join(TEMPLATES_DIR, f"{template_name}.yaml"))
 
 
 def save_template_data(name, data):
     """Persists current variable metadata to the template library."""
-    os.makedirs(TEMPLATES_DIR, exist_ok=True)
-    path = os.path.join(TEMPLATES_DIR, f"{name}.yaml")
-    with open(path, "w") as f:
-        yaml.dump(data, f, sort_keys=False)
+    # One file per template, replaced atomically: concurrent saves never interleave or truncate
+    atomic_write(os.path.join(TEMPLATES_DIR, f"{name}.yaml"), dump_yaml(data))
 
 
 def delete_template(template_name):
@@ -48,3 +66,11 @@ def delete_template(template_name):
         return False
     except Exception:
         return False
+
+
+def search_templates(query, templates=None, analytical_type=None, data_type=None, tags=()):
+    """
+    Ranks template names against `query` (file name, alias, description, steward, compliance scope)
+    and the optional type/tag filters, from the manifest alone. `templates` restricts the candidates.
+    """
+    return _manifest.search(query, analytical_type=analytical_type, data_type=data_type, tags=tags, names=templates)
@@ -2,50 +2,173 @@
 Description: Data Transformation and Hydration Engine for Dictionary Forge
 """
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+# Top-level fields and nested sections of a variable, in grid column order
+CORE_FIELDS = ("name", "alias", "description", "analytical_type", "data_type", "role")
+SECTIONS = ("constraints", "cleaning", "governance", "database_mapping", "visualization")
+
+# Column prefixes of older grids (legacy logic.py flattened database_mapping as 'database_')
+SECTION_PREFIX_ALIASES = {"database": "database_mapping"}
 
-def hydrate_row_from_flat(flat_row):
+
+class ColumnSchema:
+    """
+    Compiled routing of flat grid columns onto the nested variable layout. Built once per column
+    list: every section column maps to its (section, field) target, so hydrating a row is a single
+    pass over known columns with no prefix tests or string rewriting.
+    """
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        prefixes = [(f"{section}_", section, False) for section in SECTIONS]
+        prefixes += [(f"{alias}_", section, True) for alias, section in SECTION_PREFIX_ALIASES.items()]
+        # Longest prefix first, so 'database_mapping_x' never falls through to the 'database_' alias
+        prefixes.sort(key=lambda p: len(p[0]), reverse=True)
+
+        routes, aliased = [], []
+        for column in self.columns:
+            if not isinstance(column, str):
+                continue
+            for prefix, section, is_alias in prefixes:
+                if column.startswith(prefix) and len(column) > len(prefix):
+                    # Slice, not str.replace: the prefix may recur inside the field name
+                    (aliased if is_alias else routes).append((column, section, column[len(prefix) :]))
+                    break
+        # A legacy column only counts when its canonical twin is absent
+        canonical = {(section, field) for _, section, field in routes}
+        routes += [route for route in aliased if route[1:] not in canonical]
+
+        self.routes = tuple(routes)
+        self.sections = {
+            section: tuple((column, field) for column, target, field in self.routes if target == section)
+            for section in SECTIONS
+        }
+
+    def hydrate(self, flat_row):
+        """Rebuilds one nested variable from a flat row; empty cells (None/NaN) are left out."""
+        nested = {field: flat_row.get(field) for field in CORE_FIELDS}
+        for section in SECTIONS:
+            nested[section] = {}
+        for column, section, field in self.routes:
+            value = flat_row.get(column)
+            # Safely ignore pandas NaNs which represent empty cells in the grid
+            if value is None or (isinstance(value, float) and pd.isna(value)):
+                continue
+            nested[section][field] = value
+        return nested
+
+
+@lru_cache(maxsize=64)
+def column_schema(columns):
+    """The compiled ColumnSchema of a column tuple (cached: a grid keeps its layout across reruns)."""
+    return ColumnSchema(columns)
+
+
+def hydrate_row_from_flat(flat_row, schema=None):
     """
     Takes a flat dictionary (representing a single row from a dataframe)
     and reconstructs the nested metadata structure (constraints, cleaning, etc.).
+    Pass the grid's `schema` when hydrating many rows of the same layout.
     """
-    nested_var = {
-        "name": flat_row.get("name"),
-        "alias": flat_row.get("alias"),
-        "description": flat_row.get("description"),
-        "analytical_type": flat_row.get("analytical_type"),
-        "data_type": flat_row.get("data_type"),
-        "role": flat_row.get("role"),
-        "constraints": {},
-        "cleaning": {},
-        "governance": {},
-        "database_mapping": {},
-    }
+    if schema is None:
+        schema = column_schema(tuple(flat_row))
+    return schema.hydrate(flat_row)
+
 
-    for key, value in flat_row.items():
-        # Map flat keys like 'constraints_min_value' into their respective nested dicts
-        for section in ["constraints", "cleaning", "governance", "database_mapping"]:
-            prefix = f"{section}_"
-            if key.startswith(prefix) and value is not None:
-                # Safely ignore pandas NaNs which represent empty cells in the grid
-                if isinstance(value, float) and pd.isna(value):
-                    continue
+def hydrate_frame(df):
+    """
+    Vectorized hydrate_row_from_flat over a whole grid. Rows without a name are skipped. Columns are
+    routed to their section once through the compiled ColumnSchema, each block is turned into
+    records column-wise and empty cells are dropped in bulk from the NaN mask, so the cost is one
+    pass per column block, not per cell.
+    """
+    if "name" not in df.columns or df.empty:
+        return []
+    names = df["name"]
+    df = df[names.notna() & (names.astype(str).str.strip() != "")]
+    count = len(df)
+    if not count:
+        return []
+
+    core = [df[field].tolist() if field in df.columns else [None] * count for field in CORE_FIELDS]
+    variables = [dict(zip(CORE_FIELDS, values, strict=True)) for values in zip(*core, strict=True)]
+
+    schema = column_schema(tuple(df.columns))
+    for section in SECTIONS:
+        routes = schema.sections[section]
+        if not routes:
+            for var in variables:
+                var[section] = {}
+            continue
 
-                field_name = key.replace(prefix, "")
-                nested_var[section][field_name] = value
+        columns = [column for column, _ in routes]
+        fields = [field for _, field in routes]
+        block = df[columns]
+        # Records built from whole columns (tolist boxes to native Python types in C)
+        records = [
+            dict(zip(fields, row, strict=True)) for row in zip(*(block[c].tolist() for c in columns), strict=True)
+        ]
+        # Drop empty cells (NaN/None/NaT) only where the mask says so
+        missing = block.isna().to_numpy()
+        if missing.any():
+            for row, col in zip(*np.nonzero(missing), strict=True):
+                del records[row][fields[col]]
+        for var, record in zip(variables, records, strict=True):
+            var[section] = record
 
-    return nested_var
+    return variables
+
+
+def grid_categories(schema):
+    """
+    Allowed values of every enum column of the batch grid, read from the master schema: top-level
+    enums keep their name ('role'), section enums are flattened ('cleaning_outlier_strategy').
+    """
+    categories = {}
+    for field in (schema or {}).get("variable_schema", []):
+        if field.get("dtype") == "enum" and field.get("options"):
+            categories[field["name"]] = list(field["options"])
+        for sub in field.get("fields") or []:
+            if sub.get("dtype") == "enum" and sub.get("options"):
+                categories[f"{field['name']}_{sub['name']}"] = list(sub["options"])
+    return categories
 
 
-def generate_batch_dataframe(template_data, row_count):
+def broadcast_column(value, row_count, options=None):
+    """
+    A typed column repeating `value` over `row_count` rows without materializing per-row objects:
+    enums become categoricals (one code per row), booleans and integers nullable extension arrays,
+    floats float64, anything else (text, lists, None) an object array sharing the one value.
+    """
+    if options is not None and (value is None or isinstance(value, str)):
+        categories = list(dict.fromkeys([*options, *([value] if value is not None else [])]))
+        code = categories.index(value) if value is not None else -1
+        return pd.Categorical.from_codes(np.full(row_count, code, dtype=np.int16), categories=categories)
+    if isinstance(value, (bool, np.bool_)):
+        return pd.array(np.full(row_count, bool(value)), dtype="boolean")
+    if isinstance(value, (int, np.integer)):
+        return pd.array(np.full(row_count, value, dtype=np.int64), dtype="Int64")
+    if isinstance(value, (float, np.floating)):
+        return np.full(row_count, value, dtype=np.float64)
+    column = np.empty(row_count, dtype=object)
+    column.fill(value)
+    return column
+
+
+def generate_batch_dataframe(template_data, row_count, categories=None, first_row=1):
     """
     Creates a flat Pandas DataFrame based on a blueprint template to populate the UI grid.
-    Includes a purely visual 'Row #' counter for user reference.
+    Includes a purely visual 'Row #' counter for user reference. Built column by column: each
+    template value is broadcast into a typed column (see broadcast_column); `categories` maps enum
+    columns to their allowed values (grid_categories) so the grid offers them as choices.
     """
+    categories = categories or {}
     # Flatten the template to get initial default values for the grid
     flat_template = {
-        "Row #": 0,  # Placeholder for the visual counter
         "name": "",
         "alias": "",
         "description": "",
@@ -55,13 +178,24 @@ def generate_batch_dataframe(template_data, row_count):
     }
 
     # Extract nested sections into flattened key-value pairs
-    for section in ["constraints", "cleaning", "governance", "database_mapping"]:
+    for section in SECTIONS:
         if section in template_data:
             for field, val in template_data[section].items():
                 flat_template[f"{section}_{field}"] = val
 
-    # Create the dataframe and inject the sequential row counter
-    df = pd.DataFrame([flat_template] * row_count)
-    df["Row #"] = range(1, row_count + 1)
+    # Sequential row counter, then one broadcast column per template value
+    columns = {"Row #": np.arange(first_row, first_row + row_count, dtype=np.int64)}
+    for column, value in flat_template.items():
+        columns[column] = broadcast_column(value, row_count, categories.get(column))
+    return pd.DataFrame(columns, copy=False)
 
-    return df
+
+def resize_batch_dataframe(df, template_data, row_count, categories=None):
+    """
+    Grows or truncates a batch grid to `row_count` rows. New rows are allocated as one typed
+    block from the template and appended once, so existing rows and dtypes are kept as they are.
+    """
+    if row_count <= len(df):
+        return df.iloc[:row_count]
+    extra = generate_batch_dataframe(template_data, row_count - len(df), categories, first_row=len(df) + 1)
+    return pd.concat([df, extra], ignore_index=True)
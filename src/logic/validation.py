@@ -0,0 +1,369 @@
+"""
+Description: Dataset Validation Engine for Dictionary Forge
+Compiles each variable's constraints into vectorized column checks and applies them
+to real datasets (in-memory DataFrames or chunked CSV/Parquet files).
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from constants import REGEX_LIBRARY
+
+from .ingestion import iter_chunks
+
+# Rows per chunk when streaming files; bounds peak memory independently of file size
+DEFAULT_CHUNK_SIZE = 250_000
+
+# Legacy pandas aliases offered by the form (TOOLTIP_DEFINITIONS['frequency']) -> current aliases
+FREQUENCY_ALIASES = {
+    "N": "ns",
+    "U": "us",
+    "L": "ms",
+    "S": "s",
+    "H": "h",
+    "M": "ME",
+    "BM": "BME",
+    "Q": "QE",
+    "A": "YE",
+    "BA": "BYE",
+}
+
+# Direction of each supported monotonicity rule: (comparison that must hold between neighbours)
+MONOTONICITY_RULES = {
+    "strictly_increasing": np.greater,
+    "increasing": np.greater_equal,
+    "strictly_decreasing": np.less,
+    "decreasing": np.less_equal,
+}
+
+_LENGTH_BOUND_TYPES = ("text", "nominal", "ordinal")
+_BOOL_TOKENS = frozenset({"true", "false", "1", "0", "1.0", "0.0", "yes", "no"})
+
+
+# ==============================================================================
+# 1. CONSTRAINT COMPILATION
+# ==============================================================================
+
+
+def compile_column_checks(variable):
+    """
+    Translates a variable's constraints into a column plan: a coercion kind shared by
+    every check plus an ordered list of (check_name, check_fn) pairs.
+    Each check_fn(series, present, coerced, state) returns a violation count for one chunk.
+    """
+    constraints = variable.get("constraints") or {}
+    cleaning = variable.get("cleaning") or {}
+    at = variable.get("analytical_type")
+    dt = variable.get("data_type")
+
+    if dt == "datetime64" or at == "time_index":
+        kind = "datetime"
+    elif dt in ("int64", "float64"):
+        kind = "numeric"
+    elif dt == "bool":
+        kind = "bool"
+    else:
+        kind = "raw"
+
+    checks = []
+    errors = []
+
+    # 1. Technical type conformance
+    if kind != "raw":
+        checks.append(("data_type", _check_data_type(dt)))
+
+    # 2. Completeness
+    if constraints.get("nullable") is False:
+        checks.append(("nullable", _check_nullable))
+
+    # 3. Bounds (semantics follow get_dynamic_label: lengths, dates or numbers)
+    for bound, op in (("min_value", np.less), ("max_value", np.greater)):
+        limit = constraints.get(bound)
+        if limit is None or limit == "":
+            continue
+        try:
+            checks.append((bound, _check_bound(limit, op, at, kind)))
+        except (TypeError, ValueError) as e:
+            errors.append(f"{bound}: {e}")
+
+    # 4. Domain membership
+    allowed = _as_list(constraints.get("allowed_values"))
+    if allowed and kind != "bool":
+        checks.append(("allowed_values", _check_allowed(allowed, constraints.get("ordinal_mapping"))))
+
+    # 5. Pattern matching (constraints take precedence over the cleaning-stage pattern)
+    pattern = constraints.get("regex_pattern") or cleaning.get("regex_pattern")
+    if pattern:
+        pattern = REGEX_LIBRARY.get(pattern, pattern)
+        try:
+            re.compile(pattern)
+            checks.append(("regex_pattern", _check_regex(pattern)))
+        except re.error as e:
+            errors.append(f"regex_pattern: {e}")
+
+    # 6. Cardinality
+    if constraints.get("unique"):
+        checks.append(("unique", _check_unique))
+
+    # 7. Ordering & cadence (stateful across chunks)
+    monotonicity = constraints.get("monotonicity")
+    if monotonicity in MONOTONICITY_RULES and kind in ("datetime", "numeric"):
+        checks.append(("monotonicity", _check_monotonicity(MONOTONICITY_RULES[monotonicity])))
+
+    frequency = constraints.get("frequency")
+    if frequency and kind == "datetime":
+        try:
+            offset = to_offset(FREQUENCY_ALIASES.get(frequency, frequency))
+            checks.append(("frequency", _check_frequency(offset)))
+        except ValueError as e:
+            errors.append(f"frequency: {e}")
+
+    return {"kind": kind, "checks": checks, "errors": errors}
+
+
+def _as_list(value):
+    """Accepts native lists as well as the comma-joined strings produced by flat exports."""
+    if isinstance(value, (list, tuple, set)):
+        return [v for v in value if v is not None and str(v).strip()]
+    if isinstance(value, str) and value.strip():
+        return [v.strip() for v in value.split(",") if v.strip()]
+    return []
+
+
+def _coerce(present, kind):
+    """Converts non-null values once per chunk into the representation the checks compare against."""
+    if kind == "numeric":
+        return pd.to_numeric(present, errors="coerce")
+    if kind == "datetime":
+        return pd.to_datetime(present, errors="coerce")
+    return present
+
+
+# ==============================================================================
+# 2. VECTORIZED CHECKS
+# ==============================================================================
+
+
+def _count_per_unique(present, predicate):
+    """
+    Evaluates a string predicate once per distinct value and broadcasts the result
+    through the factorized codes, so low-cardinality columns cost a single hash pass.
+    """
+    codes, uniques = pd.factorize(present)
+    if len(uniques) == 0:
+        return 0
+    flagged = np.asarray(predicate(pd.Series(uniques).astype(str)), dtype=bool)
+    return int(flagged[codes].sum())
+
+
+def _check_nullable(series, present, coerced, state):
+    return len(series) - len(present)
+
+
+def _check_data_type(data_type):
+    def check(series, present, coerced, state):
+        if data_type == "bool":
+            if pd.api.types.is_bool_dtype(present):
+                return 0
+            return _count_per_unique(present, lambda values: ~values.str.strip().str.lower().isin(_BOOL_TOKENS))
+
+        unparseable = int(coerced.isna().sum())
+        if data_type == "int64":
+            valid = coerced.dropna()
+            unparseable += int((valid % 1 != 0).sum())
+        return unparseable
+
+    return check
+
+
+def _check_bound(limit, op, analytical_type, kind):
+    if analytical_type in _LENGTH_BOUND_TYPES and kind == "raw":
+        limit = int(limit)
+
+        def check(series, present, coerced, state):
+            return _count_per_unique(present, lambda values: op(values.str.len(), limit))
+
+        return check
+
+    limit = pd.Timestamp(limit) if kind == "datetime" else float(limit)
+
+    def check(series, present, coerced, state):
+        if kind not in ("datetime", "numeric"):
+            coerced = pd.to_numeric(present, errors="coerce")
+        # Unparseable values are reported by the data_type check, never twice
+        return int(op(coerced.dropna(), limit).sum())
+
+    return check
+
+
+def _check_allowed(allowed, ordinal_mapping):
+    domain = {str(v).strip() for v in allowed}
+    if isinstance(ordinal_mapping, dict):
+        # Ordinal columns are frequently stored as their numeric ranks
+        domain |= {str(rank) for rank in ordinal_mapping.values()}
+    domain = list(domain)
+
+    def check(series, present, coerced, state):
+        return _count_per_unique(present, lambda values: ~values.str.strip().isin(domain))
+
+    return check
+
+
+def _check_regex(pattern):
+    def check(series, present, coerced, state):
+        return _count_per_unique(present, lambda values: ~values.str.contains(pattern, regex=True))
+
+    return check
+
+
+def _check_unique(series, present, coerced, state):
+    """
+    Counts repeated values within and across chunks.
+    Keeps a sorted array of 64-bit value hashes, so memory grows with the column's
+    cardinality rather than with the number of rows.
+    """
+    # Normalise representation so '5' parsed as int in one chunk and float in the next collide
+    if pd.api.types.is_numeric_dtype(coerced) and not pd.api.types.is_bool_dtype(coerced):
+        keys = coerced.dropna().astype("float64")
+    elif pd.api.types.is_datetime64_any_dtype(coerced):
+        keys = coerced.dropna()
+    else:
+        keys = present.astype(str)
+
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    chunk_unique, counts = np.unique(hashes, return_counts=True)
+    violations = int((counts - 1).sum())
+
+    seen = state.get("seen")
+    if seen is None:
+        state["seen"] = chunk_unique
+        return violations
+
+    pos = np.searchsorted(seen, chunk_unique)
+    pos[pos == len(seen)] = 0
+    repeated = seen[pos] == chunk_unique
+    violations += int(counts[repeated].sum())
+    # Both runs are already sorted, so a stable sort degenerates into a linear merge
+    state["seen"] = np.sort(np.concatenate((seen, chunk_unique[~repeated])), kind="stable")
+    return violations
+
+
+def _check_monotonicity(comparison):
+    def check(series, present, coerced, state):
+        values = coerced.dropna().to_numpy()
+        if len(values) == 0:
+            return 0
+        if "last" in state:
+            values = np.concatenate(([state["last"]], values))
+        state["last"] = values[-1]
+        return int((~comparison(values[1:], values[:-1])).sum())
+
+    return check
+
+
+def _check_frequency(offset):
+    def check(series, present, coerced, state):
+        stamps = pd.DatetimeIndex(coerced.dropna())
+        if len(stamps) == 0:
+            return 0
+        if "last" in state:
+            stamps = pd.DatetimeIndex([state["last"]]).append(stamps)
+        state["last"] = stamps[-1]
+        if len(stamps) < 2:
+            return 0
+        expected = stamps[:-1] + offset
+        return int((stamps[1:] != expected).sum())
+
+    return check
+
+
+# ==============================================================================
+# 3. VALIDATION DRIVERS
+# ==============================================================================
+
+
+def _new_report(variables):
+    """Builds the compiled plans and an empty per-column violation report."""
+    plans, report = {}, {"rows": 0, "columns": {}}
+    for var in variables:
+        name = var.get("name")
+        if not name:
+            continue
+        plan = compile_column_checks(var)
+        plans[name] = plan
+        report["columns"][name] = {
+            "present": True,
+            "violations": {check_name: 0 for check_name, _ in plan["checks"]},
+            "errors": list(plan["errors"]),
+        }
+    return plans, report
+
+
+def _apply_chunk(chunk, plans, states, report):
+    """Runs every compiled check against one chunk and accumulates violation counts."""
+    report["rows"] += len(chunk)
+    for name, plan in plans.items():
+        if name not in chunk.columns:
+            report["columns"][name]["present"] = False
+            continue
+        series = chunk[name]
+        present = series[series.notna()]
+        coerced = _coerce(present, plan["kind"])
+        violations = report["columns"][name]["violations"]
+        for check_name, check_fn in plan["checks"]:
+            violations[check_name] += check_fn(series, present, coerced, states[name].setdefault(check_name, {}))
+
+
+def validate_dataframe(df, variables):
+    """
+    Validates an in-memory DataFrame against the dictionary.
+    Returns {'rows': int, 'columns': {name: {'present', 'violations', 'errors'}}}.
+    """
+    plans, report = _new_report(variables)
+    states = {name: {} for name in plans}
+    _apply_chunk(df, plans, states, report)
+    return report
+
+
+def validate_file(path, variables, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    """
+    Streams a CSV or Parquet file through the compiled checks chunk by chunk.
+    Only dictionary columns are read; progress_callback(rows_processed) is invoked after each chunk.
+    """
+    plans, report = _new_report(variables)
+    states = {name: {} for name in plans}
+
+    wanted = set(plans)
+    for chunk in iter_chunks(path, usecols=lambda c: c in wanted, chunk_size=chunk_size):
+        _apply_chunk(chunk, plans, states, report)
+        if progress_callback:
+            progress_callback(report["rows"])
+
+    # Columns never seen in any chunk (including empty files) are reported as missing
+    if report["rows"] == 0:
+        for name in plans:
+            report["columns"][name]["present"] = False
+    return report
+
+
+def report_to_dataframe(report):
+    """Flattens a validation report into one row per (column, check) for display or export."""
+    rows = []
+    total = report["rows"]
+    for name, col in report["columns"].items():
+        if not col["present"]:
+            rows.append({"column": name, "check": "present", "violations": total, "violation_rate": 1.0})
+            continue
+        for check_name, count in col["violations"].items():
+            rows.append(
+                {
+                    "column": name,
+                    "check": check_name,
+                    "violations": count,
+                    "violation_rate": count / total if total else 0.0,
+                }
+            )
+    return pd.DataFrame(rows, columns=["column", "check", "violations", "violation_rate"])
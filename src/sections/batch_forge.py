@@ -2,11 +2,16 @@
 Description: Unified UI component for the Batch Forge.
 """
 
-import pandas as pd
 import streamlit as st
 
-from logic import generate_batch_dataframe, hydrate_row_from_flat
-from logic.templates import get_template_list, load_template_data
+from components.ingestion_ui import render_ingestion_panel
+from components.project_store import autosave
+from constants import MASTER_CONFIG_PATH
+from logic import generate_batch_dataframe, grid_categories, hydrate_frame, load_master_schema, resize_batch_dataframe
+from logic.template_registry import get_template_registry
+
+# Upper bound of the grid size; the grid is built column-wise and commits are vectorized (hydrate_frame)
+MAX_BATCH_ROWS = 100_000
 
 
 @st.dialog("🚀 Batch Forge", width="large")
@@ -23,7 +28,8 @@ def render_batch_forge():
             "and commit the batch to your dictionary."
         )
 
-        templates = get_template_list()
+        registry = get_template_registry()
+        templates = [record.template_id for record in registry.records()]
 
         if not templates:
             st.warning("No templates found in the library. Please create a template in the Variable Form first.")
@@ -32,29 +38,30 @@ def render_batch_forge():
 
             with col1:
                 t_options = ["--- Select Template ---"] + templates
-                selected_t = st.selectbox("Select Template", options=t_options)
+                selected_t = st.selectbox(
+                    "Select Template",
+                    options=t_options,
+                    format_func=lambda t: registry.get(t).label if t in registry else t,
+                )
 
             with col2:
-                num_vars = st.number_input("How many variables?", min_value=1, max_value=100, value=5)
+                num_vars = st.number_input("How many variables?", min_value=1, max_value=MAX_BATCH_ROWS, value=5)
 
             if selected_t != "--- Select Template ---":
-                template_data = load_template_data(selected_t)
+                template_data = registry.payload(selected_t)
 
                 template_desc = template_data.get("description", "No description available for this template.")
                 st.info(f"**Template Description:** {template_desc}")
 
-                # State Management for the Grid
+                # State Management for the Grid (enum columns are offered as choices from the schema)
+                categories = grid_categories(load_master_schema(MASTER_CONFIG_PATH))
                 state_key = f"batch_df_{selected_t}"
                 if state_key not in st.session_state:
-                    st.session_state[state_key] = generate_batch_dataframe(template_data, num_vars)
+                    st.session_state[state_key] = generate_batch_dataframe(template_data, num_vars, categories)
                 elif len(st.session_state[state_key]) != num_vars:
-                    current_df = st.session_state[state_key]
-                    if num_vars > len(current_df):
-                        new_rows = generate_batch_dataframe(template_data, num_vars - len(current_df))
-                        new_rows["Row #"] = range(len(current_df) + 1, num_vars + 1)
-                        st.session_state[state_key] = pd.concat([current_df, new_rows], ignore_index=True)
-                    else:
-                        st.session_state[state_key] = current_df.head(num_vars)
+                    st.session_state[state_key] = resize_batch_dataframe(
+                        st.session_state[state_key], template_data, num_vars, categories
+                    )
 
                 # Focus Mode
                 focus = st.multiselect(
@@ -108,14 +115,11 @@ def render_batch_forge():
                         type="primary",
                         use_container_width=True,
                     ):
-                        new_vars = []
-
-                        for _, row in edited_df.iterrows():
-                            if pd.notna(row["name"]) and str(row["name"]).strip() != "":
-                                new_vars.append(hydrate_row_from_flat(row.to_dict()))
+                        new_vars = hydrate_frame(edited_df)
 
                         if new_vars:
                             st.session_state["variables"].extend(new_vars)
+                            autosave(*new_vars)
                             del st.session_state[state_key]
                             st.success(f"Successfully added {len(new_vars)} variables to the dictionary.")
                             st.rerun()
@@ -124,82 +128,4 @@ def render_batch_forge():
 
     # --- TAB 2: FROM DATASET/LIST ---
     with tab_dataset:
-        st.markdown("Upload an existing dataset or a variable list to quickly populate your dictionary queue.")
-
-        if "pending_variables" not in st.session_state:
-            st.session_state["pending_variables"] = []
-
-        uploaded_file = st.file_uploader("Upload Data (.csv, .xlsx)", type=["csv", "xlsx"])
-
-        if uploaded_file:
-            try:
-                # Parse file based on extension
-                if uploaded_file.name.endswith(".csv"):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    df = pd.read_excel(uploaded_file)
-
-                st.success(f"Loaded: {df.shape[1]} columns, {df.shape[0]} rows.")
-
-                # Extraction Strategy Selection
-                ext_strategy = st.radio(
-                    "Extraction Method:",
-                    options=[
-                        "Extract Column Headers (Raw Dataset)",
-                        "Extract from a Specific Column (Data Dictionary)",
-                    ],
-                    horizontal=True,
-                )
-
-                extracted_names = []
-
-                if ext_strategy == "Extract Column Headers (Raw Dataset)":
-                    extracted_names = df.columns.tolist()
-                else:
-                    target_col = st.selectbox(
-                        "Select the column containing Variable Names:",
-                        options=df.columns,
-                    )
-                    if target_col:
-                        extracted_names = df[target_col].dropna().astype(str).tolist()
-
-                # Submission and Deduplication Logic
-                st.write("")
-                if st.button("➕ Queue Extracted Variables", type="primary"):
-                    existing_defined = [v["name"] for v in st.session_state.get("variables", [])]
-
-                    added_count = 0
-                    for name in extracted_names:
-                        clean_name = str(name).strip()
-                        if (
-                            clean_name
-                            and clean_name not in st.session_state["pending_variables"]
-                            and clean_name not in existing_defined
-                        ):
-                            st.session_state["pending_variables"].append(clean_name)
-                            added_count += 1
-
-                    if added_count > 0:
-                        st.success(f"Added {added_count} variables to the queue.")
-                        st.rerun()
-                    else:
-                        st.warning("No new variables added. All extracted names are already in the queue or defined.")
-
-            except Exception as e:
-                st.error(f"Error parsing file: {e}")
-
-        # --- QUEUE MANAGEMENT UI ---
-        if st.session_state["pending_variables"]:
-            st.write("")
-            with st.container(border=True):
-                st.markdown(f"### ⏳ Pending Queue ({len(st.session_state['pending_variables'])})")
-
-                # Display queue in an easy-to-read format
-                cols = st.columns(4)
-                for i, var_name in enumerate(st.session_state["pending_variables"]):
-                    cols[i % 4].code(var_name)
-
-                st.write("")
-                if st.button("🗑️ Clear Queue", use_container_width=True):
-                    st.session_state["pending_variables"] = []
-                    st.rerun()
+        render_ingestion_panel()
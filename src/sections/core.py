@@ -44,13 +44,15 @@ def render_technical_config_section(field_defs, v_inputs, edit_data=None):
 
         # 1. Analytical Type Selection
         at_def = field_defs.get("analytical_type")
-        if "time_index" not in at_def["options"]:
-            at_def["options"].append("time_index")
+        # (on a local copy: the master schema is shared, read-only configuration)
+        at_options = list(at_def["options"])
+        if "time_index" not in at_options:
+            at_options.append("time_index")
 
         at_index = 0
         if edit_data:
             try:
-                at_index = at_def["options"].index(edit_data.get("analytical_type"))
+                at_index = at_options.index(edit_data.get("analytical_type"))
             except ValueError:
                 pass
 
@@ -58,7 +60,7 @@ def render_technical_config_section(field_defs, v_inputs, edit_data=None):
             at_help = TOOLTIP_DEFINITIONS.get("analytical_type", {}).get("help", "Defines the mathematical nature.")
             current_at = st.selectbox(
                 "Analytical Type *",
-                options=at_def["options"],
+                options=at_options,
                 index=at_index,
                 key=f"v_at_{fid}",
                 help=at_help,
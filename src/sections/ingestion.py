@@ -47,7 +47,7 @@ def render_queue_integration_section():
             with q_col1:
                 selected_queued_var = st.selectbox(
                     "Select variable to define:",
-                    ["--- Select ---"] + st.session_state["pending_variables"],
+                    ["--- Select ---", *st.session_state["pending_variables"]],
                     key="queue_selector",
                     label_visibility="collapsed",
                 )
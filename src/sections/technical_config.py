@@ -22,15 +22,17 @@ def render_technical_config_section(field_defs, v_inputs, edit_data=None):
         # 1. Analytical Type Selection
         at_def = field_defs.get("analytical_type", {"options": []})
         # Ensure time_index is available for temporal variables
-        if "time_index" not in at_def["options"]:
-            at_def["options"].append("time_index")
+        # (on a local copy: the master schema is shared, read-only configuration)
+        at_options = list(at_def["options"])
+        if "time_index" not in at_options:
+            at_options.append("time_index")
 
         # GROUND TRUTH RESOLUTION:
         # Prioritize edit_data (from template/ledger) to drive dependent widgets.
         default_at = edit_data.get("analytical_type", "continuous") if edit_data else "continuous"
 
         try:
-            at_index = at_def["options"].index(default_at)
+            at_index = at_options.index(default_at)
         except (ValueError, AttributeError):
             at_index = 0
 
@@ -38,7 +40,7 @@ def render_technical_config_section(field_defs, v_inputs, edit_data=None):
             at_help = TOOLTIP_DEFINITIONS.get("analytical_type", {}).get("help", "Defines the mathematical nature.")
             current_at = st.selectbox(
                 "Analytical Type *",
-                options=at_def["options"],
+                options=at_options,
                 index=at_index,
                 key=f"v_at_{fid}",
                 help=at_help,
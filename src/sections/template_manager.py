@@ -7,7 +7,7 @@ import copy
 
 import streamlit as st
 
-from logic import apply_template_to_state, load_all_templates, save_user_template
+from logic import apply_template_to_state, get_template_registry, save_user_template
 
 
 def render_template_manager_sidebar():
@@ -24,10 +24,11 @@ def render_template_manager_sidebar():
     # ==========================================================================
     # 1. APPLY TEMPLATE (The Selection Hub)
     # ==========================================================================
-    all_templates = load_all_templates()
+    registry = get_template_registry()
+    labels = registry.labels()
 
-    if all_templates:
-        template_labels = ["--- Select a Template ---"] + [all_templates[t].get("label", t) for t in all_templates]
+    if labels:
+        template_labels = ["--- Select a Template ---"] + labels
 
         selected_label = st.sidebar.selectbox(
             "Load Blueprint",
@@ -38,7 +39,7 @@ def render_template_manager_sidebar():
 
         if selected_label != "--- Select a Template ---":
             # Map label back to key
-            t_key = next(k for k, v in all_templates.items() if v.get("label") == selected_label)
+            t_key = registry.id_for_label(selected_label)
 
             # The Destructive Overwrite Safety
             with st.sidebar.popover("⚠️ Confirm Overwrite", use_container_width=True):
@@ -51,7 +52,7 @@ def render_template_manager_sidebar():
                     use_container_width=True,
                     key=f"apply_t_{fid}",
                 ):
-                    apply_template_to_state(all_templates[t_key], fid)
+                    apply_template_to_state(registry.payload(t_key), fid)
                     st.toast(f"Applied: {selected_label}")
                     st.rerun()
 
@@ -0,0 +1,146 @@
+# Description: Unit tests for the batch patch engine.
+# Verifies patch overlays, the coherence cascade, preview caching and transactional commits.
+
+import copy
+
+import pytest
+
+from logic.batch import BatchPatchEngine, PatchOverlay, apply_patch, patch_key, patch_size
+from logic.coherence import prune
+from logic.registry import VariableRegistry
+
+
+def _variables():
+    return [
+        {
+            "name": "age",
+            "analytical_type": "continuous",
+            "data_type": "float64",
+            "constraints": {"min_value": 0, "max_value": 120},
+            "cleaning": {"outlier_strategy": "clip", "missing_strategy": "median"},
+            "governance": {"sensitivity": "Internal"},
+        },
+        {
+            "name": "segment",
+            "analytical_type": "nominal",
+            "data_type": "category",
+            "constraints": {"allowed_values": ["a", "b"]},
+            "governance": {"sensitivity": "Public", "pii_flag": False},
+        },
+        {"name": "comment", "analytical_type": "text", "data_type": "string"},
+    ]
+
+
+def test_apply_patch_matches_deepcopy_and_prune():
+    """
+    Tests that the patch overlays yield exactly what the former deep-copy + prune cascade
+    produced, without mutating the originals.
+    """
+    # Arrange
+    variables = _variables()
+    snapshot = copy.deepcopy(variables)
+    patch = {
+        "root": {"analytical_type": "binary", "data_type": "bool"},
+        "nested": {"governance": {"sensitivity": "PII"}, "cleaning": {}},
+    }
+
+    # Act
+    root, nested = patch_key(patch)
+    results = [apply_patch(v, root, nested) for v in variables]
+    expected = copy.deepcopy(variables)
+    for var in expected:
+        var.update(patch["root"])
+        var.setdefault("governance", {}).update(patch["nested"]["governance"])
+    expected_pruned = prune(expected)
+
+    # Assert
+    assert variables == snapshot
+    assert [patched for patched, _ in results] == expected
+    assert [patched.materialize() for patched, _ in results] == expected
+    assert [pruned for _, pruned in results] == expected_pruned
+    assert patch_size(patch) == 3
+
+
+def test_apply_patch_overlays_only_changed_keys():
+    """
+    Tests that a patched variable is an overlay holding only the changed keys: pruned keys are
+    hidden, untouched sections are the original objects and materializing shares them.
+    """
+    # Arrange
+    variable = _variables()[0]
+    patch = {"root": {"analytical_type": "nominal"}, "nested": {"governance": {"pii_flag": True}}}
+
+    # Act
+    patched, pruned = apply_patch(variable, *patch_key(patch))
+    record = patched.materialize()
+
+    # Assert
+    assert isinstance(patched, PatchOverlay)
+    assert set(patched.changes) == {"analytical_type", "governance", "cleaning"}
+    assert pruned == ["outlier_strategy"]
+    assert "outlier_strategy" not in patched["cleaning"]
+    assert list(patched["governance"]) == ["sensitivity", "pii_flag"]
+    assert len(patched["cleaning"]) == 1 and patched["cleaning"].base is variable["cleaning"]
+    assert patched["constraints"] is variable["constraints"]
+    assert type(record["governance"]) is dict and record["governance"] == {"sensitivity": "Internal", "pii_flag": True}
+    assert record["constraints"] is variable["constraints"]
+    assert variable["cleaning"] == {"outlier_strategy": "clip", "missing_strategy": "median"}
+
+
+def test_preview_is_cached_until_inputs_change():
+    """
+    Tests that an identical (revision, selection, patch) reuses the preview, while a new patch
+    or a registry edit recomputes it.
+    """
+    # Arrange
+    registry = VariableRegistry(_variables())
+    ids = [registry[0]["variable_id"], registry[2]["variable_id"], "unknown"]
+    engine = BatchPatchEngine()
+    patch = {"root": {"data_type": "string"}, "nested": {}}
+
+    # Act
+    first = engine.preview(registry, ids, patch)
+    again = engine.preview(registry, list(ids), {"root": {"data_type": "string"}, "nested": {"cleaning": {}}})
+    other = engine.preview(registry, ids, {"root": {"data_type": "int64"}, "nested": {}})
+    registry.touch(1)
+    refreshed = engine.preview(registry, ids, {"root": {"data_type": "int64"}, "nested": {}})
+
+    # Assert
+    assert again is first
+    assert first.variable_ids == tuple(ids[:2])
+    assert other is not first
+    assert refreshed is not other
+    assert refreshed.revision == registry.revision
+
+
+def test_commit_saves_once_then_swaps_records():
+    """
+    Tests that a commit persists the whole batch in one call before updating the registry, and
+    that a failing save or a stale preview leaves the registry untouched.
+    """
+    # Arrange
+    registry = VariableRegistry(_variables())
+    ids = [v["variable_id"] for v in registry]
+    engine = BatchPatchEngine()
+    preview = engine.preview(registry, ids, {"root": {"analytical_type": "binary"}, "nested": {}})
+    saved = []
+
+    def failing_save(*variables):
+        raise OSError("disk full")
+
+    # Act
+    with pytest.raises(OSError):
+        engine.commit(registry, preview, save=failing_save)
+    untouched = [v["analytical_type"] for v in registry]
+    count = engine.commit(registry, preview, save=lambda *variables: saved.append(variables))
+
+    # Assert
+    assert untouched == ["continuous", "nominal", "text"]
+    assert count == 3
+    assert len(saved) == 1 and len(saved[0]) == 3
+    assert [v["analytical_type"] for v in registry] == ["binary"] * 3
+    assert registry[1]["constraints"] == {}
+    assert type(registry[1]) is dict and registry[0]["governance"] is preview.variables[0].base["governance"]
+    assert registry.index_of("segment") == 1
+    with pytest.raises(ValueError):
+        engine.commit(registry, preview)
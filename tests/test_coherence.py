@@ -28,3 +28,227 @@ def test_get_filtered_data_types_fallback():
 
     # Assert
     assert actual_output == expected_output
+
+
+# ------------------------------------------------------------------------------
+# Visibility matrix equivalence
+# ------------------------------------------------------------------------------
+
+
+def _legacy_is_field_visible(field_name, analytical_type, data_type=None):
+    """Reference oracle: the original if-chain the compiled matrix replaced."""
+    if field_name in ["plot_color", "formatting"]:
+        return False
+
+    if analytical_type in ["continuous", "discrete"]:
+        if field_name in [
+            "allowed_values",
+            "regex_pattern",
+            "ordinal_mapping",
+            "text_normalization",
+            "encoding_strategy",
+        ]:
+            return False
+
+    if analytical_type == "binary":
+        forbidden = [
+            "min_value",
+            "max_value",
+            "regex_pattern",
+            "allowed_values",
+            "ordinal_mapping",
+            "unique",
+            "outlier_strategy",
+            "outlier_threshold",
+            "standardization_strategy",
+            "infinite_value_handling",
+            "text_normalization",
+        ]
+        if field_name in forbidden:
+            return False
+
+    if analytical_type == "nominal":
+        if field_name in [
+            "outlier_strategy",
+            "outlier_threshold",
+            "ordinal_mapping",
+            "standardization_strategy",
+            "infinite_value_handling",
+            "text_normalization",
+        ]:
+            return False
+
+    if analytical_type == "text":
+        if field_name in [
+            "outlier_strategy",
+            "outlier_threshold",
+            "ordinal_mapping",
+            "standardization_strategy",
+            "infinite_value_handling",
+            "encoding_strategy",
+        ]:
+            return False
+
+    if analytical_type == "time_index":
+        forbidden = [
+            "allowed_values",
+            "regex_pattern",
+            "outlier_strategy",
+            "outlier_threshold",
+            "ordinal_mapping",
+            "standardization_strategy",
+            "infinite_value_handling",
+            "text_normalization",
+            "encoding_strategy",
+        ]
+        if field_name in forbidden:
+            return False
+
+    if analytical_type == "ordinal":
+        if field_name in [
+            "regex_pattern",
+            "outlier_strategy",
+            "outlier_threshold",
+            "standardization_strategy",
+            "infinite_value_handling",
+            "text_normalization",
+        ]:
+            return False
+    elif field_name == "ordinal_mapping":
+        return False
+
+    if field_name in ["standardization_strategy", "infinite_value_handling"] and analytical_type != "continuous":
+        return False
+
+    if field_name == "text_normalization" and analytical_type != "text":
+        return False
+
+    if field_name == "encoding_strategy" and analytical_type not in [
+        "nominal",
+        "ordinal",
+        "binary",
+    ]:
+        return False
+
+    if data_type:
+        if data_type == "string" and field_name in [
+            "outlier_strategy",
+            "outlier_threshold",
+            "ordinal_mapping",
+            "standardization_strategy",
+        ]:
+            return False
+        if data_type == "category" and field_name in [
+            "min_value",
+            "max_value",
+            "regex_pattern",
+            "outlier_strategy",
+            "outlier_threshold",
+            "standardization_strategy",
+        ]:
+            return False
+        if data_type == "bool" and field_name in [
+            "min_value",
+            "max_value",
+            "regex_pattern",
+            "allowed_values",
+            "unique",
+            "outlier_strategy",
+            "outlier_threshold",
+            "ordinal_mapping",
+            "standardization_strategy",
+        ]:
+            return False
+
+    return True
+
+
+ALL_FIELDS = [
+    "plot_color",
+    "formatting",
+    "min_value",
+    "max_value",
+    "allowed_values",
+    "regex_pattern",
+    "unique",
+    "nullable",
+    "ordinal_mapping",
+    "text_normalization",
+    "encoding_strategy",
+    "outlier_strategy",
+    "outlier_threshold",
+    "standardization_strategy",
+    "infinite_value_handling",
+    "missing_strategy",
+    "sensitivity",
+    "target_table",
+    "name",
+    "not_a_real_field",
+]
+ALL_ANALYTICAL_TYPES = [
+    "continuous",
+    "discrete",
+    "nominal",
+    "ordinal",
+    "binary",
+    "text",
+    "time_index",
+    "spatial",
+    "random_garbage_string",
+    None,
+]
+ALL_DATA_TYPES = ["int64", "float64", "string", "bool", "datetime64", "category", "object", "", None]
+
+
+def test_is_field_visible_matches_legacy_rules_exhaustively():
+    """Every (field, analytical_type, data_type) combination must answer exactly as the legacy if-chain."""
+    from logic.coherence import is_field_visible
+
+    for field in ALL_FIELDS:
+        for at in ALL_ANALYTICAL_TYPES:
+            for dt in ALL_DATA_TYPES:
+                assert is_field_visible(field, at, dt) == _legacy_is_field_visible(field, at, dt), (field, at, dt)
+
+
+def test_visible_fields_agrees_with_is_field_visible():
+    """The frozenset API must list exactly the governed fields that are visible."""
+    from logic.coherence import visible_fields
+
+    for at in ALL_ANALYTICAL_TYPES:
+        for dt in ALL_DATA_TYPES:
+            visible = visible_fields(at, dt)
+            assert isinstance(visible, frozenset)
+            for field in ALL_FIELDS:
+                if field in visible:
+                    assert _legacy_is_field_visible(field, at, dt), (field, at, dt)
+
+
+def test_prune_removes_incoherent_keys_in_place():
+    """Tests that the bulk cascade strips hidden keys and reports them per variable."""
+    # Arrange
+    from logic.coherence import prune
+
+    variables = [
+        {
+            "name": "is_active",
+            "analytical_type": "binary",
+            "data_type": "bool",
+            "constraints": {"min_value": 0, "nullable": False, "unique": True},
+            "cleaning": {"outlier_strategy": "clip", "missing_strategy": "mode"},
+        },
+        {
+            "name": "price",
+            "analytical_type": "continuous",
+            "data_type": "float64",
+            "constraints": {"min_value": 0.0},
+        },
+    ]
+
+    # Act
+    report = prune(variables)
+
+    # Assert
+    assert report == [["min_value", "unique", "outlier_strategy"], []]
+    assert variables[0]["constraints"] == {"nullable": False}
+    assert variables[0]["cleaning"] == {"missing_strategy": "mode"}
+    assert variables[1]["constraints"] == {"min_value": 0.0}
@@ -0,0 +1,60 @@
+# Description: Unit tests for the stat-validated configuration cache.
+# Verifies parse-once behaviour, invalidation on file changes and read-only shared values.
+
+import copy
+import json
+import os
+
+import pytest
+import yaml
+
+from logic.config_cache import ConfigCache, FrozenDict, read_yaml
+
+
+def test_file_is_parsed_once_until_it_changes(tmp_path):
+    """Tests that unchanged files are served from memory and edited files are re-parsed."""
+    # Arrange
+    path = tmp_path / "schema.yaml"
+    path.write_text("variable_schema:\n  - name: age\n")
+    calls = []
+
+    def parser(p):
+        calls.append(p)
+        return read_yaml(p)
+
+    cache = ConfigCache()
+
+    # Act
+    first = cache.load(str(path), parser)
+    second = cache.load(str(path), parser)
+    path.write_text("variable_schema:\n  - name: age\n  - name: income\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    third = cache.load(str(path), parser)
+
+    # Assert
+    assert first is second and len(calls) == 2
+    assert [f["name"] for f in third["variable_schema"]] == ["age", "income"]
+
+
+def test_cached_values_are_read_only_but_copies_are_not(tmp_path):
+    """Tests that shared values reject mutation while copies and serializers behave like plain data."""
+    # Arrange
+    path = tmp_path / "template.yaml"
+    path.write_text("constraints:\n  allowed_values: [a, b]\n")
+    data = ConfigCache().load(str(path))
+
+    # Act & Assert
+    assert isinstance(data, FrozenDict)
+    with pytest.raises(TypeError):
+        data["constraints"]["allowed_values"].append("c")
+    with pytest.raises(TypeError):
+        data.pop("constraints")
+
+    editable = copy.deepcopy(data)
+    editable["constraints"]["allowed_values"].append("c")
+    assert type(editable) is dict and data["constraints"]["allowed_values"] == ["a", "b"]
+    assert (
+        yaml.safe_load(yaml.dump(data))
+        == json.loads(json.dumps(data))
+        == {"constraints": {"allowed_values": ["a", "b"]}}
+    )
@@ -0,0 +1,135 @@
+# Description: Unit tests for the multi-dialect DDL compiler.
+# Verifies the intermediate schema model, deterministic output and that local-engine DDL executes.
+
+import sqlite3
+
+import pytest
+
+from logic.ddl import DIALECTS, build_schema, compile_ddl
+
+
+def _variables():
+    return [
+        {
+            "name": "Order Status",
+            "data_type": "category",
+            "constraints": {"allowed_values": ["open", "it's closed"], "nullable": False},
+            "database_mapping": {"target_table": "sales.orders"},
+        },
+        {
+            "name": "order_id",
+            "data_type": "int64",
+            "database_mapping": {"target_table": "sales.orders", "is_primary_key": True},
+        },
+        {
+            "name": "customer_id",
+            "data_type": "int64",
+            "database_mapping": {"target_table": "sales.orders", "foreign_key_reference": "crm.customers(id)"},
+        },
+        {
+            "name": "amount",
+            "data_type": "float64",
+            "constraints": {"min_value": 0, "max_value": 1000},
+            "database_mapping": {"target_table": "sales.orders"},
+        },
+        {
+            "name": "id",
+            "data_type": "int64",
+            "database_mapping": {"target_table": "crm.customers", "is_primary_key": True},
+        },
+        {"name": "signup", "data_type": "datetime64", "database_mapping": {"target_table": "crm.customers"}},
+    ]
+
+
+def test_build_schema_orders_tables_by_dependency_and_name():
+    """Tests the intermediate model: referenced tables first, columns in dictionary order."""
+    # Arrange & Act
+    schema = build_schema(_variables())
+
+    # Assert
+    assert [t.name for t in schema.tables] == ["crm.customers", "sales.orders"]
+    orders = schema.tables[1]
+    assert [c.name for c in orders.columns] == ["order_status", "order_id", "customer_id", "amount"]
+    assert orders.primary_key == ("order_id",)
+    assert orders.foreign_keys[0].ref_table == "crm.customers" and orders.foreign_keys[0].ref_column == "id"
+    assert orders.columns[3].min_value == 0 and orders.columns[3].max_value == 1000
+    assert schema.schemas == ["crm", "sales"]
+
+
+@pytest.mark.parametrize("dialect", sorted(DIALECTS))
+def test_output_is_deterministic(dialect):
+    """Tests that every dialect renders identical DDL regardless of table order in the dictionary."""
+    # Arrange
+    variables = _variables()
+    shuffled = variables[4:] + variables[:4]
+
+    # Act & Assert
+    assert compile_ddl(variables, dialect) == compile_ddl(shuffled, dialect)
+
+
+def test_sqlite_ddl_executes_and_enforces_constraints():
+    """Tests that SQLite DDL runs in-process and its CHECK/NOT NULL/PK constraints hold."""
+    # Arrange
+    conn = sqlite3.connect(":memory:")
+
+    # Act
+    conn.executescript(compile_ddl(_variables(), "sqlite"))
+    conn.execute("""INSERT INTO "sales.orders" VALUES ('open', 1, NULL, 10.5)""")
+
+    # Assert
+    for bad_row in ("('pending', 2, NULL, 1)", "('open', 3, NULL, -1)", "(NULL, 4, NULL, 1)"):
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(f'INSERT INTO "sales.orders" VALUES {bad_row}')
+    conn.execute("""INSERT INTO "sales.orders" VALUES ('it''s closed', 5, NULL, 1000)""")
+    assert conn.execute('SELECT COUNT(*) FROM "sales.orders"').fetchone()[0] == 2
+
+
+def test_duckdb_ddl_executes_and_enforces_constraints():
+    """Tests that DuckDB DDL (schemas, keys, same-schema FKs) runs in-process and holds its constraints."""
+    # Arrange
+    duckdb = pytest.importorskip("duckdb")
+    conn = duckdb.connect()
+    variables = _variables()
+    for var in variables:
+        db_mapping = var["database_mapping"]
+        db_mapping["target_table"] = db_mapping["target_table"].replace("crm.", "sales.")
+        if "foreign_key_reference" in db_mapping:
+            db_mapping["foreign_key_reference"] = "sales.customers(id)"
+
+    # Act
+    conn.execute(compile_ddl(variables, "duckdb"))
+    conn.execute("INSERT INTO sales.customers VALUES (7, TIMESTAMP '2024-01-01 00:00:00')")
+    conn.execute("INSERT INTO sales.orders VALUES ('open', 1, 7, 10.5)")
+
+    # Assert
+    for bad_row in ("('pending', 2, 7, 1)", "('open', 3, 99, 1)", "('open', 1, 7, 1)"):
+        with pytest.raises(duckdb.ConstraintException):
+            conn.execute(f"INSERT INTO sales.orders VALUES {bad_row}")
+    assert conn.execute("SELECT COUNT(*) FROM sales.orders").fetchone()[0] == 1
+
+    # Act & Assert: cross-schema keys are unsupported by DuckDB and are reported instead of emitted
+    conn = duckdb.connect()
+    script = compile_ddl(_variables(), "duckdb")
+    conn.execute(script)
+    assert "-- Foreign key not supported by DuckDB: customer_id -> crm.customers(id)" in script
+
+
+def test_dialect_capabilities():
+    """Tests type mapping, named constraints, and that unenforced dialects drop CHECKs and keys become NOT ENFORCED."""
+    # Arrange
+    variables = _variables()
+
+    # Act
+    bigquery = compile_ddl(variables, "bigquery")
+    snowflake = compile_ddl(variables, "snowflake")
+    mysql = compile_ddl(variables, "mysql")
+
+    # Assert
+    assert "CHECK" not in bigquery and "PRIMARY KEY (order_id) NOT ENFORCED" in bigquery
+    assert "FOREIGN KEY (customer_id) REFERENCES crm.customers (id) NOT ENFORCED" in bigquery
+    assert "CHECK" not in snowflake and "id NUMBER(38,0) PRIMARY KEY" in snowflake
+    assert "order_status VARCHAR(255) NOT NULL," in mysql
+    assert "CONSTRAINT ck_orders_order_status CHECK (order_status IN ('open', 'it''s closed'))" in mysql
+    assert "CONSTRAINT ck_orders_amount CHECK (amount >= 0 AND amount <= 1000)" in mysql
+    with pytest.raises(ValueError):
+        compile_ddl(variables, "oracle")
@@ -0,0 +1,70 @@
+# Description: Unit tests for the content-addressed export cache.
+# Verifies content hashing, LRU eviction on disk and download-time timestamp stamping.
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+from components.export_utils import GENERATED_AT_PLACEHOLDER, generate_json, generate_yaml, stamp_generated_at
+from logic import export_cache
+from logic.export_cache import ContentHasher, ExportCache
+from logic.registry import VariableRegistry
+
+
+def _registry(count):
+    return VariableRegistry({"name": f"var_{i}", "data_type": "int64"} for i in range(count))
+
+
+def test_hash_tracks_content_and_reuses_unchanged_digests():
+    """Tests that the digest changes only with content and unchanged variables are not re-serialized."""
+    # Arrange
+    registry = _registry(20)
+    hasher = ContentHasher()
+    first = hasher.digest(registry, {"version": "1"})
+
+    # Act
+    with patch.object(export_cache, "_canonical", wraps=export_cache._canonical) as spy:
+        same = hasher.digest(registry, {"version": "1"})
+        registry[5] = dict(registry[5], data_type="float64")
+        edited = hasher.digest(registry, {"version": "1"})
+
+    # Assert: one re-serialized variable plus the project info per call
+    assert same == first and edited != first
+    assert spy.call_count == 3
+    assert ContentHasher().digest(list(registry), {"version": "1"}) == edited
+    assert hasher.digest(registry, {"version": "2"}) != edited
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Tests that entries beyond the budget are evicted oldest-access first."""
+    # Arrange
+    cache = ExportCache(str(tmp_path), max_entries=2)
+    cache.put("a.json", b"a")
+    cache.put("b.json", b"b")
+    past = time.time() - 60
+    os.utime(tmp_path / "a.json", (past, past))
+    os.utime(tmp_path / "b.json", (past - 1, past - 1))
+
+    # Act: touching 'b' makes 'a' the least recently used
+    assert cache.get("b.json") == b"b"
+    calls = []
+    cache.get_or_create("c.json", lambda: calls.append(1) or b"c")
+    cache.get_or_create("c.json", lambda: calls.append(1) or b"c")
+
+    # Assert
+    assert sorted(cache.keys()) == ["b.json", "c.json"]
+    assert cache.get("a.json") is None and len(calls) == 1
+
+
+def test_timestamp_is_stamped_into_cached_documents():
+    """Tests that a cached placeholder document matches a freshly stamped one byte for byte."""
+    # Arrange
+    variables = [{"name": "age", "generated_at": "nested values are untouched"}]
+    cached = {"project_metadata": {}, "generated_at": GENERATED_AT_PLACEHOLDER, "variables": variables}
+    fresh = dict(cached, generated_at="2024-05-01T10:00:00")
+
+    # Act & Assert
+    assert stamp_generated_at("json", generate_json(cached), "2024-05-01T10:00:00") == generate_json(fresh)
+    assert stamp_generated_at("yaml", generate_yaml(cached), "2024-05-01T10:00:00") == generate_yaml(fresh)
+    assert json.loads(generate_json(fresh))["generated_at"] == "2024-05-01T10:00:00"
@@ -0,0 +1,101 @@
+# Description: Unit tests for the streaming export writers.
+# Verifies parity with whole-document serialization and a bounded working set while streaming.
+
+import io
+import json
+import tracemalloc
+
+import pandas as pd
+import yaml
+
+from components.export_utils import generate_csv, generate_excel, generate_json, generate_yaml, iter_json, iter_yaml
+from logic.exporters import flatten_json
+
+
+def _export_obj(count):
+    variables = [
+        {
+            "name": f"var_{i}",
+            "alias": f"Variable {i}",
+            "data_type": "float64" if i % 2 else "category",
+            "constraints": {"allowed_values": ["a", "b"]} if i % 2 == 0 else {"min_value": 0, "max_value": i},
+            "governance": {"compliance_scope": ["GDPR", "CCPA"]},
+        }
+        for i in range(count)
+    ]
+    return {
+        "project_metadata": {"project_name": "Demo", "version": "1.0"},
+        "generated_at": "now",
+        "variables": variables,
+    }
+
+
+def test_streamed_documents_match_whole_serialization():
+    """Tests that chunked YAML/JSON equal yaml.dump/json.dumps of the full export object."""
+    # Arrange
+    export_obj = _export_obj(500)
+
+    # Act
+    yaml_text = "".join(iter_yaml(export_obj))
+    json_bytes = generate_json(export_obj)
+
+    # Assert
+    assert yaml_text == yaml.dump(export_obj, sort_keys=False)
+    assert json_bytes.decode() == json.dumps(export_obj, indent=4)
+    assert "".join(iter_yaml({"variables": []})) == yaml.dump({"variables": []})
+
+
+def test_tabular_exports_match_dataframe_layout():
+    """Tests that CSV and Excel carry the same columns/rows as a DataFrame of flattened variables."""
+    # Arrange
+    export_obj = _export_obj(300)
+    variables = export_obj["variables"]
+    expected = pd.DataFrame([flatten_json(v) for v in variables])
+
+    # Act
+    csv_frame = pd.read_csv(io.BytesIO(generate_csv(variables)))
+    sheets = pd.read_excel(io.BytesIO(generate_excel(variables, export_obj["project_metadata"])), sheet_name=None)
+
+    # Assert
+    assert list(csv_frame.columns) == list(expected.columns)
+    assert csv_frame["constraints_allowed_values"].iloc[0] == "a, b"
+    assert sheets["Variables"].shape == expected.shape
+    assert sheets["Project Info"].to_dict("records") == [{"project_name": "Demo", "version": 1}]
+
+
+def test_exports_drop_the_internal_variable_id():
+    """Tests that the registry's variable_id never reaches any export format, and the session dicts keep it."""
+    # Arrange
+    export_obj = _export_obj(3)
+    variables = export_obj["variables"]
+    for i, var in enumerate(variables):
+        var["variable_id"] = f"id-{i}"
+
+    # Act
+    json_doc = json.loads(generate_json(export_obj))
+    yaml_doc = yaml.safe_load(generate_yaml(export_obj))
+    csv_frame = pd.read_csv(io.BytesIO(generate_csv(variables)))
+    sheet = pd.read_excel(io.BytesIO(generate_excel(variables, export_obj["project_metadata"])), sheet_name="Variables")
+
+    # Assert
+    assert all("variable_id" not in var for var in json_doc["variables"] + yaml_doc["variables"])
+    assert "variable_id" not in csv_frame.columns and "variable_id" not in sheet.columns
+    assert json_doc["variables"][0]["name"] == "var_0" and len(csv_frame) == 3
+    assert variables[0]["variable_id"] == "id-0"
+
+
+def test_streaming_keeps_a_bounded_working_set():
+    """Tests that consuming the JSON stream never holds more than a small fraction of the document."""
+    # Arrange
+    export_obj = _export_obj(5000)
+    document_size = len(json.dumps(export_obj, indent=4))
+
+    # Act
+    tracemalloc.start()
+    for _chunk in iter_json(export_obj):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Assert
+    assert peak < document_size / 5
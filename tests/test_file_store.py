@@ -0,0 +1,94 @@
+# Description: Unit tests for the concurrent-safe file store.
+# Verifies that concurrent journaled saves are never lost, torn appends are ignored and compaction is lossless.
+
+import json
+import multiprocessing
+import os
+import stat
+import threading
+
+from logic.file_store import _UMASK, JournaledStore, atomic_write
+
+
+def _save_many(path, worker, count):
+    store = JournaledStore(path, section="user_templates", compact_bytes=2048)
+    for i in range(count):
+        store.put(f"w{worker}_t{i}", {"label": f"Template {i}", "worker": worker})
+
+
+def test_concurrent_writers_lose_no_saves(tmp_path):
+    """Tests that threads and processes saving at once (with compactions in between) keep every record."""
+    # Arrange
+    path = str(tmp_path / "templates_user.json")
+    atomic_write(path, json.dumps({"user_templates": {"seed": {"label": "Seed"}}}))
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_save_many, args=(path, w, 25)) for w in range(2)]
+    workers += [threading.Thread(target=_save_many, args=(path, w, 25)) for w in range(2, 4)]
+
+    # Act
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # Assert
+    saved = JournaledStore(path, section="user_templates").load()
+    assert len(saved) == 1 + 4 * 25
+    assert saved["w3_t24"] == {"label": "Template 24", "worker": 3}
+
+
+def test_journal_replay_skips_torn_lines_and_compacts(tmp_path):
+    """Tests delete/rename replay, tolerance to a crash mid-append and folding the journal into the base."""
+    # Arrange
+    path = str(tmp_path / "regulations.json")
+    store = JournaledStore(path)
+    store.replace({"GDPR": {"jurisdiction": "EU"}, "IDD": {"jurisdiction": "EU"}})
+    store.rename("GDPR", "GDPR (EU)", {"jurisdiction": "EU"})
+    store.delete("IDD")
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"op": "put", "key": "LOPD')  # torn record
+
+    # Act
+    before = dict(store.load())
+    store.compact()
+
+    # Assert
+    assert before == {"GDPR (EU)": {"jurisdiction": "EU"}}
+    assert not os.path.exists(store.journal_path)
+    with open(path) as f:
+        assert json.load(f) == before
+    assert store.load() == before
+
+
+def test_append_after_torn_line_keeps_new_records(tmp_path):
+    """Tests that a save following a crash mid-append drops the partial line instead of being glued onto it."""
+    # Arrange
+    path = str(tmp_path / "regulations.json")
+    store = JournaledStore(path)
+    store.put("a", 1)
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"op": "put", "key": "b", "val')  # torn record
+
+    # Act
+    store.put("c", 3)
+    seeded = store.seed({"x": 0})
+
+    # Assert
+    assert dict(store.load()) == {"a": 1, "c": 3}
+    assert not seeded
+
+
+def test_atomic_write_keeps_file_mode(tmp_path):
+    """Tests that replacing a file keeps its permissions and a new file gets the umask default, not 0600."""
+    # Arrange
+    existing = tmp_path / "regulations.json"
+    existing.write_text("{}")
+    os.chmod(existing, 0o640)
+
+    # Act
+    atomic_write(str(existing), "{}")
+    atomic_write(str(tmp_path / "new.json"), "{}")
+
+    # Assert
+    assert stat.S_IMODE(os.stat(existing).st_mode) == 0o640
+    assert stat.S_IMODE(os.stat(tmp_path / "new.json").st_mode) == 0o666 & ~_UMASK
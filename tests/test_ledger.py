@@ -0,0 +1,95 @@
+# Description: Unit tests for the incremental ledger engine.
+# Verifies that only changed variables are re-flattened and that filtering matches the legacy scan.
+
+from unittest.mock import patch
+
+from logic import ledger
+from logic.exporters import flatten_json
+from logic.ledger import LedgerCache
+from logic.registry import VariableRegistry
+
+
+def _registry(count):
+    return VariableRegistry(
+        {
+            "name": f"var_{i}",
+            "alias": f"Alias {i}",
+            "description": "Customer income" if i % 2 else "Signup date",
+            "constraints": {"nullable": False, "allowed_values": ["a", "b"]},
+        }
+        for i in range(count)
+    )
+
+
+def test_ledger_matches_full_flatten():
+    """Tests that the cached frame equals flattening every variable, minus internal columns."""
+    # Arrange
+    registry = _registry(5)
+    cache = LedgerCache()
+
+    # Act
+    frame = cache.frame(registry)
+
+    # Assert
+    expected = [{k: v for k, v in flatten_json(var).items() if k != "variable_id"} for var in registry]
+    assert frame.to_dict("records") == expected
+
+
+def test_only_changed_variables_are_reflattened():
+    """Tests that reruns without changes reuse the frame and edits re-flatten a single row."""
+    # Arrange
+    registry = _registry(50)
+    cache = LedgerCache()
+    first = cache.frame(registry)
+
+    with patch.object(ledger, "flatten_json", wraps=flatten_json) as spy:
+        # Act: an unchanged rerun
+        unchanged = cache.frame(registry)
+
+        # Act: one edit and one deletion
+        edited = dict(registry[3], description="Edited")
+        registry[3] = edited
+        del registry[10]
+        refreshed = cache.frame(registry)
+
+    # Assert
+    assert unchanged is first
+    assert spy.call_count == 1
+    assert len(refreshed) == 49
+    assert refreshed.iloc[3]["description"] == "Edited"
+
+
+def test_filter_matches_legacy_substring_scan():
+    """Tests that the indexed filter returns the same rows as the original per-row scan."""
+    # Arrange
+    registry = _registry(20)
+    cache = LedgerCache()
+
+    # Act
+    result = cache.filter(registry, "INCOME")
+
+    # Assert
+    legacy = [
+        v["name"]
+        for v in registry
+        if "income" in f"{v.get('name', '')} {v.get('description', '')} {v.get('alias', '')}".lower()
+    ]
+    assert result["name"].tolist() == legacy
+    assert len(cache.filter(registry, "")) == 20
+
+
+def test_filter_follows_edits_and_ranks_names_first():
+    """Tests that the search index tracks edits/deletions and that name hits lead description hits."""
+    # Arrange
+    registry = _registry(6)
+    cache = LedgerCache()
+    cache.frame(registry)
+
+    # Act
+    registry[4] = dict(registry[4], name="income_band")
+    del registry[1]
+    result = cache.filter(registry, "income")
+
+    # Assert
+    assert result["name"].tolist() == ["income_band", "var_3", "var_5"]
+    assert cache.search(registry, "income", limit=1) == [registry[3]["variable_id"]]
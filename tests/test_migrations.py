@@ -0,0 +1,141 @@
+# Description: Unit tests for the schema diff and ALTER migration generator.
+# Verifies ID-based matching, the change log, and that migrations bring a live database to the new schema.
+
+import copy
+import sqlite3
+
+import pytest
+
+from logic.ddl import compile_ddl
+from logic.migrations import change_log, diff_dictionaries, generate_migration
+from logic.registry import VariableRegistry
+
+
+def _snapshot():
+    return list(
+        VariableRegistry(
+            [
+                {
+                    "name": "order_id",
+                    "data_type": "int64",
+                    "database_mapping": {"target_table": "orders", "is_primary_key": True},
+                },
+                {"name": "amount", "data_type": "float64", "database_mapping": {"target_table": "orders"}},
+                {
+                    "name": "status",
+                    "data_type": "category",
+                    "constraints": {"allowed_values": ["open", "closed"]},
+                    "database_mapping": {"target_table": "orders"},
+                },
+                {"name": "notes", "data_type": "object", "database_mapping": {"target_table": "orders"}},
+            ]
+        )
+    )
+
+
+def _columns_sqlite(conn, table):
+    return [(row[1], row[2], row[3]) for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def test_unchanged_dictionaries_produce_no_changes():
+    """Tests that identical snapshots (and reordered ones) yield an empty diff."""
+    # Arrange
+    old = _snapshot()
+    new = list(reversed(copy.deepcopy(old)))
+
+    # Act & Assert
+    assert diff_dictionaries(old, new) == []
+    assert "-- No schema changes." in generate_migration(old, new)
+
+
+def test_variables_are_matched_by_stable_id():
+    """Tests that a renamed variable becomes RENAME COLUMN (not drop + add) and the change log is structured."""
+    # Arrange
+    old = _snapshot()
+    new = copy.deepcopy(old)
+    new[1]["name"] = "total_amount"
+    new[2]["constraints"]["allowed_values"].append("void")
+    del new[3]
+    new.append({"name": "region", "data_type": "string", "database_mapping": {"target_table": "orders"}})
+
+    # Act
+    log = change_log(old, new)
+    script = generate_migration(old, new, "postgresql")
+
+    # Assert
+    assert [(c["change"], c["column"]) for c in log] == [
+        ("drop_check", "status"),
+        ("drop_column", "notes"),
+        ("rename_column", "total_amount"),
+        ("add_column", "region"),
+        ("add_check", "status"),
+    ]
+    assert log[2]["before"] == "amount" and log[2]["after"] == "total_amount"
+    assert "ALTER TABLE orders RENAME COLUMN amount TO total_amount;" in script
+    assert "ALTER TABLE orders DROP CONSTRAINT ck_orders_status;" in script
+    assert "ADD CONSTRAINT ck_orders_status CHECK (status IN ('open', 'closed', 'void'));" in script
+
+
+def test_baseline_without_ids_matches_by_column_name():
+    """
+    Tests that a baseline exported before variables carried IDs pairs with the current (ID-bearing)
+    dictionary by table and column name, so unchanged columns are never dropped and re-added.
+    """
+    # Arrange
+    new = _snapshot()
+    old = copy.deepcopy(new)
+    for var in old[:3]:
+        del var["variable_id"]
+    new[1]["data_type"] = "int64"
+    new.append({"name": "region", "data_type": "string", "database_mapping": {"target_table": "orders"}})
+
+    # Act
+    log = change_log(old, new)
+    script = generate_migration(old, new, "postgresql")
+
+    # Assert
+    assert [(c["change"], c["column"]) for c in log] == [("alter_type", "amount"), ("add_column", "region")]
+    assert "DROP COLUMN" not in script
+
+
+def test_sqlite_migration_reaches_new_schema():
+    """Tests that applying the migration to the old SQLite schema matches creating the new one from scratch."""
+    # Arrange
+    old = _snapshot()
+    new = copy.deepcopy(old)
+    new[1]["name"] = "total_amount"
+    del new[3]
+    new.append({"name": "region", "data_type": "string", "database_mapping": {"target_table": "orders"}})
+    new.append({"name": "ts", "data_type": "datetime64", "database_mapping": {"target_table": "audit"}})
+
+    migrated, fresh = sqlite3.connect(":memory:"), sqlite3.connect(":memory:")
+    migrated.executescript(compile_ddl(old, "sqlite"))
+
+    # Act
+    migrated.executescript(generate_migration(old, new, "sqlite"))
+    fresh.executescript(compile_ddl(new, "sqlite"))
+
+    # Assert
+    for table in ("orders", "audit"):
+        assert _columns_sqlite(migrated, table) == _columns_sqlite(fresh, table)
+
+
+def test_duckdb_migration_alters_types_and_nullability():
+    """Tests type and NOT NULL changes applied in place on DuckDB."""
+    # Arrange
+    duckdb = pytest.importorskip("duckdb")
+    old = _snapshot()
+    new = copy.deepcopy(old)
+    new[1]["data_type"] = "int64"
+    new[1]["constraints"] = {"nullable": False}
+    conn = duckdb.connect()
+    conn.execute(compile_ddl(old, "duckdb"))
+
+    # Act
+    conn.execute(generate_migration(old, new, "duckdb"))
+
+    # Assert
+    row = conn.execute(
+        "SELECT data_type, is_nullable FROM information_schema.columns WHERE column_name = 'amount'"
+    ).fetchone()
+    assert row == ("BIGINT", "NO")
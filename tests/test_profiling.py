@@ -0,0 +1,127 @@
+# Description: Unit tests for the column profiling engine.
+# Verifies reservoir sampling, per-column statistics and the metadata proposed from them.
+
+import numpy as np
+import pandas as pd
+
+from logic.profiling import profile_column, profile_dataframe, profile_source, propose_metadata, reservoir_sample
+
+
+def _sample_frame(rows=200):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "customer_id": np.arange(1, rows + 1),
+            "amount": rng.uniform(-5, 100, rows).round(2),
+            "status": rng.choice(["active", "churned", "paused"], rows),
+            "contact": [f"user{i}@example.com" for i in range(rows)],
+            "event_at": pd.date_range("2024-01-01", periods=rows, freq="D").astype(str),
+            "is_vip": rng.choice([0, 1], rows),
+            "comment": [None] * rows,
+        }
+    )
+
+
+def test_reservoir_sample_is_bounded_and_ordered():
+    """Tests that the reservoir keeps at most `size` rows, tagged with their original positions in order."""
+    # Arrange
+    df = _sample_frame(1_000)
+    chunks = (df.iloc[i : i + 128] for i in range(0, len(df), 128))
+
+    # Act
+    sample, rows_seen = reservoir_sample(chunks, size=100, seed=3)
+
+    # Assert
+    assert rows_seen == 1_000
+    assert len(sample) == 100
+    assert sample.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(sample, df.loc[sample.index])
+
+
+def test_profile_column_statistics():
+    """Tests null rate, cardinality, bounds and order statistics on a single column."""
+    # Arrange
+    series = pd.Series([1.5, None, 3.0, 4.5, 6.0], name="reading")
+
+    # Act
+    profile = profile_column(series)
+
+    # Assert
+    assert profile["kind"] == "float"
+    assert profile["null_rate"] == 0.2
+    assert profile["cardinality"] == 4 and profile["unique"] is True
+    assert (profile["min"], profile["max"]) == (1.5, 6.0)
+    assert profile["quantiles"]["p50"] == 3.75
+    assert profile["monotonicity"] == "strictly_increasing"
+
+
+def test_frequency_is_inferred_from_sampled_rows():
+    """Tests that a regular time axis is still recognised after sampling removes rows."""
+    # Arrange
+    stamps = pd.Series(pd.date_range("2024-01-01", periods=10, freq="15min"), name="ts")
+    kept = [0, 3, 4, 8]
+
+    # Act
+    profile = profile_column(stamps.iloc[kept], positions=kept)
+
+    # Assert
+    assert profile["frequency"] == "15min"
+
+
+def test_propose_metadata_from_profiles():
+    """Tests the analytical/technical types, roles and constraints proposed for typical columns."""
+    # Act
+    proposals = {name: propose_metadata(p) for name, p in profile_dataframe(_sample_frame()).items()}
+
+    # Assert
+    assert proposals["customer_id"]["analytical_type"] == "discrete"
+    assert proposals["customer_id"]["role"] == "id"
+    assert proposals["customer_id"]["constraints"]["unique"] is True
+
+    assert proposals["amount"]["data_type"] == "float64"
+    assert proposals["amount"]["constraints"]["min_value"] < 0
+
+    assert proposals["status"]["data_type"] == "category"
+    assert proposals["status"]["constraints"]["allowed_values"] == ["active", "churned", "paused"]
+
+    assert proposals["contact"]["analytical_type"] == "text"
+    assert proposals["contact"]["constraints"]["regex_pattern"] == "Email Address"
+
+    assert proposals["event_at"]["analytical_type"] == "time_index"
+    assert proposals["event_at"]["constraints"]["frequency"] == "D"
+    assert proposals["event_at"]["constraints"]["monotonicity"] == "strictly_increasing"
+
+    assert proposals["is_vip"]["analytical_type"] == "binary"
+    assert proposals["comment"]["constraints"] == {"nullable": True}
+
+
+def test_profile_source_samples_large_files(tmp_path):
+    """Tests that files larger than the reservoir are sampled and still profiled coherently."""
+    # Arrange
+    path = tmp_path / "dataset.csv"
+    _sample_frame(500).to_csv(path, index=False)
+
+    # Act
+    result = profile_source(path, sample_size=120, chunk_size=64)
+
+    # Assert
+    assert result["rows"] == 500 and result["sampled"] is True
+    assert result["profiles"]["customer_id"]["count"] == 120
+    assert result["profiles"]["event_at"]["frequency"] == "D"
+
+
+def test_wide_frames_batch_the_pattern_pass():
+    """Tests that profiling a wide table in one batched regex pass matches profiling each column on its own."""
+    # Arrange
+    base = _sample_frame(50)
+    wide = pd.concat({f"t{i}": base for i in range(10)}, axis=1)
+    wide.columns = [f"{table}_{column}" for table, column in wide.columns]
+
+    # Act
+    batched = profile_dataframe(wide)
+    per_column = {column: profile_column(wide[column]) for column in wide.columns}
+
+    # Assert
+    assert list(batched) == list(wide.columns)
+    assert batched == per_column
+    assert batched["t3_contact"]["regex_matches"] == {"Email Address": 1.0}
@@ -0,0 +1,203 @@
+# Description: Unit tests for the definition quality engine and its rule profiles.
+# Verifies the batch grades and deficiency report, rule compilation, and that only changed variables are re-read.
+
+import pandas as pd
+import pytest
+
+from logic.quality import QualityEngine, compile_profile
+from logic.registry import VariableRegistry
+
+GOLD = {
+    "name": "income",
+    "alias": "Income",
+    "description": "Gross yearly household income in euros",
+    "analytical_type": "continuous",
+    "data_type": "float64",
+    "role": "feature",
+    "governance": {"data_steward": "finance", "pii_flag": False, "sensitivity": "Internal"},
+}
+
+
+def test_grades_scores_and_missing_fields():
+    """Tests the scoring tiers (short descriptions, aliases equal to the name) and the audit table."""
+    # Arrange
+    silver = {**GOLD, "name": "age", "alias": "age", "description": "Age", "governance": {"data_steward": "hr"}}
+    bronze = {"name": "raw_col", "description": None, "governance": None}
+    engine = QualityEngine()
+
+    # Act
+    report = engine.report([GOLD, silver, bronze])
+    audit = report.frame()
+
+    # Assert
+    assert report.scores.tolist() == [100, 60, 10]
+    assert report.counts() == {"Gold": 1, "Silver": 1, "Bronze": 1}
+    assert report.missing_for(0) == []
+    assert report.missing_for(1) == [
+        "Unique Alias",
+        "Detailed Description (>20 chars)",
+        "PII Flag",
+        "Sensitivity Level",
+    ]
+    assert "Description" in report.missing_for(2)
+    assert "Detailed Description (>20 chars)" not in report.missing_for(2)
+    assert audit["Missing for Gold"].tolist()[:2] == ["✅ Perfect", ", ".join(report.missing_for(1))]
+    assert audit["Score"].tolist() == ["100%", "60%", "10%"]
+    graded = report.grade_frame(["G", "S", "B"])
+    assert graded["Grade"].tolist() == ["G", "S", "B"] and graded["Score"].tolist() == [100, 60, 10]
+
+
+def test_na_cells_count_as_missing():
+    """Tests that pd.NA values (e.g. hydrated from Batch Forge grids) grade as missing instead of raising."""
+    # Arrange
+    hydrated = {
+        **GOLD,
+        "name": "region",
+        "alias": pd.NA,
+        "analytical_type": pd.NA,
+        "governance": {"data_steward": pd.NA, "pii_flag": pd.NA, "sensitivity": "Internal"},
+    }
+
+    # Act
+    report = QualityEngine().report([GOLD, hydrated])
+
+    # Assert
+    assert report.scores.tolist()[0] == 100
+    assert {"Unique Alias", "Data Steward", "PII Flag"} <= set(report.missing_for(1))
+    assert "Sensitivity Level" not in report.missing_for(1)
+
+
+def test_only_changed_variables_are_regraded():
+    """Tests that unchanged reruns reuse the report and an edit re-reads a single variable."""
+    # Arrange
+    registry = VariableRegistry({**GOLD, "name": f"var_{i}"} for i in range(40))
+    engine = QualityEngine()
+    first = engine.report(registry)
+
+    # Act: an unchanged rerun, then one edit and one deletion
+    unchanged = engine.report(registry)
+    registry[5] = {**registry[5], "description": ""}
+    del registry[0]
+    refreshed = engine.report(registry)
+
+    # Assert
+    assert unchanged is first
+    assert engine.evaluated == 1
+    assert set(engine.timings) >= {"(field extraction)", "name", "detailed_description"}
+    assert len(refreshed.names) == 39
+    assert refreshed.scores[4] == 80
+    assert refreshed.counts() == {"Gold": 38, "Silver": 1, "Bronze": 0}
+
+
+def test_incremental_report_matches_fresh_grading_after_structural_edits():
+    """Tests inserts, deletes, moves and renames against grading the same variables from scratch."""
+    # Arrange
+    registry = VariableRegistry(
+        {**GOLD, "name": f"var_{i}", "description": "short" if i % 2 else GOLD["description"]} for i in range(20)
+    )
+    engine = QualityEngine()
+    engine.report(registry)
+
+    # Act
+    registry.append({"name": "fresh", "role": "id"})
+    moved = registry[2]
+    del registry[2]
+    registry.insert(9, moved)
+    del registry[0]
+    registry.rename(4, "renamed")
+    registry.insert(0, {**GOLD, "name": "head"})
+    incremental = engine.report(registry)
+    fresh = QualityEngine().report(list(registry))
+
+    # Assert
+    assert incremental.names == fresh.names == registry.names()
+    assert incremental.scores.tolist() == fresh.scores.tolist()
+    assert (incremental.missing == fresh.missing).all()
+
+
+def test_custom_profile_compiles_to_vectorized_checks():
+    """Tests extends/override, regex, coverage, all_present, requires and score normalization."""
+    # Arrange
+    profiles = {
+        "base": {
+            "grades": {"gold": 100, "silver": 50},
+            "rules": [
+                {"id": "name", "label": "Name", "points": 1, "check": "present", "field": "name"},
+                {
+                    "id": "steward",
+                    "label": "Steward",
+                    "points": 5,
+                    "check": "present",
+                    "field": "governance.data_steward",
+                },
+            ],
+        },
+        "team": {
+            "extends": "base",
+            "rules": [
+                {
+                    "id": "steward",
+                    "label": "Steward",
+                    "points": 1,
+                    "check": "present",
+                    "field": "governance.data_steward",
+                },
+                {
+                    "id": "snake",
+                    "label": "snake_case",
+                    "points": 1,
+                    "check": "regex",
+                    "field": "name",
+                    "pattern": "[a-z]+(_[a-z]+)*",
+                    "requires": "name",
+                },
+                {
+                    "id": "bounds",
+                    "label": "Bounds",
+                    "points": 1,
+                    "check": "coverage",
+                    "by_analytical_type": {"continuous": ["constraints.min_value", "constraints.max_value"]},
+                },
+            ],
+        },
+    }
+    variables = [
+        {
+            "name": "unit_price",
+            "analytical_type": "continuous",
+            "constraints": {"min_value": 0, "max_value": 9},
+            "governance": {"data_steward": "sales"},
+        },
+        {"name": "UnitPrice", "analytical_type": "continuous", "constraints": {"min_value": 0}},
+        {"name": None, "analytical_type": "nominal"},
+    ]
+
+    # Act
+    ruleset = compile_profile(profiles, "team")
+    passed, reported = ruleset.evaluate(variables)
+
+    # Assert
+    assert [rule.id for rule in ruleset.rules] == ["name", "steward", "snake", "bounds"]
+    assert passed.tolist() == [[True, True, True, True], [True, False, False, False], [False, False, False, True]]
+    # An unnamed variable is not also blamed for its naming convention
+    assert reported[2].tolist() == [True, True, False, False]
+    assert ruleset.scores(passed).tolist() == [100, 25, 25]
+    assert ruleset.grade_codes(ruleset.scores(passed)).tolist() == [0, 2, 2]
+
+
+def test_malformed_rules_are_rejected():
+    """Tests that unknown checks, missing parameters and dangling requirements fail at compile time."""
+
+    # Arrange
+    def profile(*rules):
+        return {"p": {"rules": [{"id": "r", "points": 1, **rule} for rule in rules]}}
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unknown quality check"):
+        compile_profile(profile({"check": "spelling", "field": "name"}), "p")
+    with pytest.raises(ValueError, match="needs: min"):
+        compile_profile(profile({"check": "min_length", "field": "description"}), "p")
+    with pytest.raises(ValueError, match="requires unknown rule"):
+        compile_profile(profile({"check": "present", "field": "name", "requires": "ghost"}), "p")
+    with pytest.raises(ValueError, match="Unknown quality profile"):
+        compile_profile(profile({"check": "present", "field": "name"}), "missing")
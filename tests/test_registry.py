@@ -0,0 +1,66 @@
+# Description: Unit tests for the variable registry and pending queue.
+# Verifies that name/ID indexes stay in sync through appends, edits, deletes and renames.
+
+from logic.registry import PendingQueue, VariableRegistry
+
+
+def _registry(*names):
+    return VariableRegistry({"name": name, "data_type": "float64"} for name in names)
+
+
+def test_registry_assigns_ids_and_indexes_names():
+    """Tests that registered variables receive stable IDs and are found by name and ID."""
+    # Arrange
+    registry = _registry("age", "income", "region")
+
+    # Act
+    income_id = registry[1]["variable_id"]
+
+    # Assert
+    assert len({v["variable_id"] for v in registry}) == 3
+    assert registry.index_of("income") == 1
+    assert registry.index_of_id(income_id) == 1
+    assert registry.get("region")["name"] == "region"
+    assert registry.index_of("missing") is None
+
+
+def test_registry_stays_in_sync_after_mutations():
+    """Tests lookups after deletes in the middle, tail pops, replacements, renames and clears."""
+    # Arrange
+    registry = _registry("a", "b", "c", "d")
+    b_id = registry[1]["variable_id"]
+
+    # Act & Assert: delete in the middle shifts later positions
+    del registry[0]
+    assert registry.index_of("c") == 1 and registry.index_of_id(b_id) == 0
+
+    # Act & Assert: popping the tail
+    registry.pop()
+    assert not registry.has_name("d") and registry.names() == ["b", "c"]
+
+    # Act & Assert: replacing an entry keeps an explicit ID and re-indexes the new name
+    registry[0] = {"name": "b_renamed", "variable_id": b_id}
+    assert registry.index_of("b_renamed") == 0 and not registry.has_name("b")
+
+    # Act & Assert: renames through the registry
+    registry.rename(1, "c2")
+    assert registry.index_of("c2") == 1 and not registry.has_name("c")
+
+    registry.clear()
+    assert len(registry) == 0 and registry.index_of("c2") is None
+
+
+def test_pending_queue_dedupes_against_queue_and_dictionary():
+    """Tests that queueing skips blanks, duplicates and names that are already defined."""
+    # Arrange
+    queue = PendingQueue(["zip_code"])
+    registry = _registry("age")
+
+    # Act
+    added = queue.add_unique([" income ", "income", "age", "", "zip_code", "region"], exclude=registry)
+    queue.discard("income")
+
+    # Assert
+    assert added == 2
+    assert list(queue) == ["zip_code", "region"]
+    assert "income" not in queue and "region" in queue
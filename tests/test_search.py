@@ -0,0 +1,94 @@
+# Description: Unit tests for the full-text search index.
+# Verifies field-weighted ranking, prefix/infix matching and incremental updates.
+
+from logic.search import SearchIndex, tokenize, variable_document
+
+
+def _index():
+    index = SearchIndex()
+    index.update("a", {"name": "signup_date", "description": "Date the customer registered"})
+    index.update("b", {"name": "customer_income", "alias": "Income"})
+    index.update(
+        "c",
+        variable_document(
+            {
+                "name": "zip_code",
+                "description": "Postal code of the customer",
+                "governance": {"data_steward": "Jane Roe", "compliance_scope": ["GDPR", "CCPA"]},
+            }
+        ),
+    )
+    return index
+
+
+def test_search_ranks_name_matches_above_descriptions():
+    """Tests that every term must match and that name hits outrank description hits."""
+    # Arrange
+    index = _index()
+
+    # Act & Assert: name/alias beats description; ties keep insertion order
+    assert index.search("customer") == ["b", "a", "c"]
+    assert index.search("customer code") == ["c"]
+    assert index.search("customer", limit=1) == ["b"]
+
+    # Act & Assert: governance fields are searchable
+    assert index.search("gdpr") == ["c"]
+    assert index.search("roe") == ["c"]
+
+
+def test_search_matches_prefixes_and_infixes():
+    """Tests short prefixes, infix substrings inside tokens and case-insensitivity."""
+    # Arrange
+    index = _index()
+
+    # Act & Assert
+    assert index.search("zi") == ["c"]
+    assert index.search("COME") == ["b"]
+    assert index.search("xyz") == []
+    assert index.search("") == ["a", "b", "c"]
+
+
+def test_incremental_update_and_remove():
+    """Tests that re-indexing replaces old tokens and removal drops the key everywhere."""
+    # Arrange
+    index = _index()
+
+    # Act
+    index.update("b", {"name": "household_salary"})
+    index.remove("c")
+
+    # Assert
+    assert index.search("income") == []
+    assert index.search("salary") == ["b"]
+    assert index.search("zip") == []
+    assert len(index) == 2 and "c" not in index
+    assert index.search("") == ["a", "b"]
+
+
+def test_limited_search_merges_prefix_and_exact_tokens():
+    """Tests that top-k results weight exact token hits above prefix hits across tokens."""
+    # Arrange
+    index = SearchIndex()
+    index.update("prefix", {"name": "incomes"})
+    index.update("exact", {"name": "income"})
+    index.update("infix", {"name": "netincome"})
+
+    # Act & Assert: the limited merge agrees with the full ranking
+    assert index.search("income", limit=2) == ["exact", "prefix"]
+    assert index.search("income") == ["exact", "prefix", "infix"]
+
+
+def test_accented_names_are_tokenized_and_matched():
+    """Tests that non-ASCII letters stay inside tokens, fold case and match as prefixes and infixes."""
+    # Arrange
+    index = _index()
+    index.update("d", {"name": "año_de_nacimiento", "description": "Größe des Kunden"})
+
+    # Act & Assert
+    assert tokenize("Año de nacimiento Größe") == ["año", "de", "nacimiento", "grösse"]
+    assert index.search("AÑO") == ["d"]
+    assert index.search("añ") == ["d"]
+    assert index.search("ñ") == []  # no token starts with it (formerly an empty query: every document)
+    assert index.search("größe") == ["d"]
+    assert index.search("rös") == ["d"]
+    assert index.search("ano") == []
@@ -0,0 +1,51 @@
+# Description: Unit tests for the central serialization backends.
+# Verifies that the accelerated and pure-Python YAML/JSON paths round-trip documents identically.
+
+import io
+import json
+
+import yaml
+
+from logic import serialization
+from logic.serialization import dump_json, dump_yaml, dumps_json, load_json, load_yaml, loads_json
+
+DOCUMENT = {
+    "name": "loss_ratio",
+    "description": "Ratio of incurred losses to earned premiums, ünïcode and a long sentence " * 3,
+    "notes": "first line\nsecond line\n",
+    "constraints": {"required": True, "min_value": 0, "max_value": 1.5, "allowed_values": ["a", "yes", None]},
+    "tags": [],
+}
+
+
+def test_yaml_backends_round_trip_identically(monkeypatch):
+    """Tests that libyaml and pure-Python dumps load back to the same document with either loader."""
+    # Arrange
+    fast = dump_yaml([DOCUMENT])
+
+    # Act
+    monkeypatch.setattr(serialization, "YAML_LOADER", yaml.SafeLoader)
+    monkeypatch.setattr(serialization, "YAML_DUMPER", yaml.Dumper)
+    slow = dump_yaml([DOCUMENT])
+
+    # Assert
+    assert load_yaml(fast) == load_yaml(slow) == yaml.safe_load(fast) == [DOCUMENT]
+    assert slow == yaml.dump([DOCUMENT], sort_keys=False)
+
+
+def test_json_helpers_match_stdlib_with_and_without_orjson(monkeypatch):
+    """Tests that JSON parsing and writing agree with the stdlib, including the pure-Python fallback."""
+    for backend in (serialization.orjson, None):
+        # Arrange
+        monkeypatch.setattr(serialization, "orjson", backend)
+        buffer = io.StringIO()
+
+        # Act
+        dump_json(DOCUMENT, buffer)
+        compact = dumps_json({"b": 1, "a": [DOCUMENT]}, sort_keys=True)
+
+        # Assert: indented output keeps the exact stdlib layout
+        assert buffer.getvalue() == json.dumps(DOCUMENT, indent=4)
+        assert load_json(io.StringIO(buffer.getvalue())) == DOCUMENT
+        assert loads_json(compact) == {"a": [DOCUMENT], "b": 1}
+        assert compact.index('"a"') < compact.index('"b"')
@@ -0,0 +1,171 @@
+# Description: Unit tests for the durable project store.
+# Verifies append-only revisions, stable ordering, paging, tombstones and project metadata.
+
+import os
+import threading
+
+import pytest
+
+from logic.store import (
+    StoreConnections,
+    clear_variables,
+    compact,
+    count_variables,
+    delete_variables,
+    iter_variables,
+    load_history,
+    load_page,
+    load_project_info,
+    load_variables,
+    new_project_key,
+    open_store,
+    save_project_info,
+    save_variable,
+    save_variables,
+    store_path,
+)
+
+
+def _variable(name, **extra):
+    return {
+        "name": name,
+        "analytical_type": "continuous",
+        "data_type": "float64",
+        "role": "feature",
+        "constraints": {"nullable": False, "min_value": 0.0},
+        "governance": {"pii_flag": False},
+        **extra,
+    }
+
+
+def test_store_round_trip_and_wal(tmp_path):
+    """Tests that saved variables reload identically, in order, from a WAL-mode database."""
+    # Arrange
+    path = tmp_path / "project.db"
+    variables = [_variable(f"var_{i}") for i in range(3)]
+
+    # Act
+    conn = open_store(str(path))
+    ids = save_variables(conn, variables)
+    conn.close()
+    reopened = open_store(str(path))
+
+    # Assert
+    assert reopened.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert [v["variable_id"] for v in variables] == ids
+    assert load_variables(reopened) == variables
+
+
+def test_edits_append_revisions_without_moving_variables(tmp_path):
+    """Tests that re-saving a variable appends a revision and keeps its position in the project."""
+    # Arrange
+    conn = open_store(str(tmp_path / "project.db"))
+    first, second = _variable("age"), _variable("income")
+    save_variables(conn, [first, second])
+
+    # Act
+    first["constraints"]["max_value"] = 120.0
+    save_variable(conn, first)
+
+    # Assert
+    assert [v["name"] for v in load_variables(conn)] == ["age", "income"]
+    history = load_history(conn, first["variable_id"])
+    assert len(history) == 2
+    assert "max_value" not in history[0]["constraints"]
+    assert history[1]["constraints"]["max_value"] == 120.0
+
+
+def test_paging_and_section_projection(tmp_path):
+    """Tests offset pages, keyset iteration and skipping JSON sections when listing."""
+    # Arrange
+    conn = open_store(str(tmp_path / "project.db"))
+    save_variables(conn, [_variable(f"var_{i:03d}") for i in range(25)])
+
+    # Act
+    page = load_page(conn, offset=10, limit=5, sections=())
+    streamed = list(iter_variables(conn, page_size=7))
+
+    # Assert
+    assert count_variables(conn) == 25
+    assert [v["name"] for v in page] == [f"var_{i:03d}" for i in range(10, 15)]
+    assert "constraints" not in page[0]
+    assert [v["name"] for v in streamed] == [f"var_{i:03d}" for i in range(25)]
+
+
+def test_deletes_tombstone_and_compact(tmp_path):
+    """Tests that deletes and clears keep history until compaction removes it."""
+    # Arrange
+    conn = open_store(str(tmp_path / "project.db"))
+    a, b, c = _variable("a"), _variable("b"), _variable("c")
+    save_variables(conn, [a, b, c])
+
+    # Act
+    delete_variables(conn, [b["variable_id"]])
+    remaining = [v["name"] for v in load_variables(conn)]
+    clear_variables(conn)
+    history_before = load_history(conn, a["variable_id"])
+    compact(conn)
+
+    # Assert
+    assert remaining == ["a", "c"]
+    assert count_variables(conn) == 0
+    assert history_before[-1] is None
+    assert load_history(conn, a["variable_id"]) == []
+
+
+def test_project_info_upsert(tmp_path):
+    """Tests that project metadata is stored as a single upserted document."""
+    # Arrange
+    conn = open_store(str(tmp_path / "project.db"))
+
+    # Act
+    save_project_info(conn, {"project_name": "Draft"})
+    save_project_info(conn, {"project_name": "Churn", "stakeholders": []})
+
+    # Assert
+    assert load_project_info(conn) == {"project_name": "Churn", "stakeholders": []}
+
+
+def test_threads_get_their_own_connections(tmp_path):
+    """Tests that concurrent sessions (threads) save through separate connections without losing a revision."""
+    # Arrange
+    store = StoreConnections(str(tmp_path / "project.db"))
+    connections = []
+
+    def session(worker):
+        conn = store.get()
+        connections.append(conn)
+        for i in range(20):
+            save_variables(conn, [_variable(f"w{worker}_{i}")])
+            assert store.get() is conn
+
+    threads = [threading.Thread(target=session, args=(w,)) for w in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len({id(conn) for conn in connections}) == 4
+    assert count_variables(store.get()) == 80
+
+
+def test_projects_get_separate_store_files(tmp_path):
+    """Tests that each project key maps to its own store file and that keys cannot name other paths."""
+    # Arrange
+    first, second = new_project_key(), new_project_key()
+
+    # Act
+    first_conn = open_store(store_path(first, root=str(tmp_path)))
+    save_variables(first_conn, [_variable("age")])
+    second_conn = open_store(store_path(second, root=str(tmp_path)))
+
+    # Assert
+    assert first != second
+    assert os.path.dirname(store_path(first, root=str(tmp_path))) == str(tmp_path)
+    assert count_variables(first_conn) == 1 and count_variables(second_conn) == 0
+    for key in ("../dictionary_forge", "", None, first.upper()):
+        with pytest.raises(ValueError):
+            store_path(key)
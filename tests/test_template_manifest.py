@@ -0,0 +1,67 @@
+# Description: Unit tests for the template manifest index.
+# Verifies incremental rebuilds, manifest persistence and search/filtering without parsing payloads.
+
+import os
+from unittest.mock import patch
+
+from logic import template_manifest
+from logic.template_manifest import TemplateManifest
+
+FINANCIAL = "name: amount\ndescription: Monetary value\nanalytical_type: continuous\ndata_type: float64\nrole: feature\ntags: [Finance]\n"
+FLAG = "name: flag\ndescription: Binary status\nanalytical_type: categorical\ndata_type: boolean\nrole: target\n"
+
+
+def _touch(path):
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+
+def test_manifest_reparses_only_changed_templates(tmp_path):
+    """Tests that refreshes parse new or edited files only, and touched-but-identical files not at all."""
+    # Arrange
+    (tmp_path / "financial_value.yaml").write_text(FINANCIAL)
+    (tmp_path / "boolean_flag.yaml").write_text(FLAG)
+    manifest = TemplateManifest(str(tmp_path))
+
+    with patch.object(template_manifest, "load_yaml", wraps=template_manifest.load_yaml) as spy:
+        # Act
+        assert manifest.names() == ["boolean_flag", "financial_value"]
+        _touch(tmp_path / "boolean_flag.yaml")
+        manifest.refresh()
+        assert spy.call_count == 2  # touched but identical: re-hashed, not re-parsed
+        (tmp_path / "financial_value.yaml").write_text(FINANCIAL.replace("float64", "decimal"))
+        _touch(tmp_path / "financial_value.yaml")
+        (tmp_path / "boolean_flag.yaml").rename(tmp_path / "status_flag.yaml")
+        entries = manifest.entries()
+
+        # Assert: 2 initial parses, then the edited file and the renamed one (a new name)
+        assert spy.call_count == 4
+    assert [(e.name, e.data_type) for e in entries] == [("financial_value", "decimal"), ("status_flag", "boolean")]
+
+
+def test_manifest_is_reused_across_processes_without_parsing(tmp_path):
+    """Tests that a fresh manifest instance trusts the persisted index for unchanged files."""
+    # Arrange
+    (tmp_path / "financial_value.yaml").write_text(FINANCIAL)
+    TemplateManifest(str(tmp_path)).refresh()
+
+    # Act
+    with patch.object(template_manifest, "load_yaml") as spy:
+        names = TemplateManifest(str(tmp_path)).search("monetary")
+
+    # Assert
+    assert names == ["financial_value"] and spy.call_count == 0
+
+
+def test_search_and_filters_use_manifest_metadata(tmp_path):
+    """Tests ranked search combined with type and tag filters."""
+    # Arrange
+    (tmp_path / "financial_value.yaml").write_text(FINANCIAL)
+    (tmp_path / "boolean_flag.yaml").write_text(FLAG)
+    manifest = TemplateManifest(str(tmp_path))
+
+    # Act & Assert
+    assert manifest.search("", data_type="BOOLEAN") == ["boolean_flag"]
+    assert manifest.search("value", tags=["finance"]) == ["financial_value"]
+    assert manifest.search("status", analytical_type="continuous") == []
+    assert manifest.search("", names=["financial_value"]) == ["financial_value"]
+    assert manifest.facets()["tags"] == ["feature", "finance", "target"]
@@ -0,0 +1,104 @@
+# Description: Unit tests for the unified template registry.
+# Verifies source normalization, precedence, label/ID lookups and hot reload of edited sources.
+
+import json
+import os
+
+from logic.template_manifest import TemplateManifest
+from logic.template_registry import SOURCE_LIBRARY, SOURCE_USER, TemplateRegistry, normalize_template
+
+
+def _sources(tmp_path):
+    standard = tmp_path / "templates_standard.yaml"
+    standard.write_text(
+        "templates:\n"
+        "  primary_key_id:\n    label: Primary Key\n    data_type: int64\n    constraints: {unique: true}\n"
+        "  shared_id:\n    label: Standard Version\n    data_type: string\n"
+    )
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "entity_id.yaml").write_text(
+        "name: entity_id_template\nanalytical_type: Categorical\ndata_type: String\nrole: ID\n"
+        "constraints:\n  is_unique: true\n  is_nullable: false\n"
+    )
+    (library / "shared_id.yaml").write_text("label: Library Version\ndata_type: Float\n")
+    user = tmp_path / "templates_user.json"
+    user.write_text(json.dumps({"user_templates": {"shared_id": {"label": "User Version", "data_type": "bool"}}}))
+    return TemplateRegistry(str(standard), str(user), TemplateManifest(str(library))), user
+
+
+def test_sources_are_merged_with_precedence_and_normalized(tmp_path):
+    """Tests that the user source wins ID clashes and library payloads use the canonical schema."""
+    # Arrange
+    registry, _ = _sources(tmp_path)
+
+    # Act
+    entity = registry.payload("entity_id")
+    shared = registry.get("shared_id")
+
+    # Assert
+    assert len(registry) == 3
+    assert (shared.source, shared.label, registry.payload("shared_id")["data_type"]) == (
+        SOURCE_USER,
+        "User Version",
+        "bool",
+    )
+    assert registry.get("entity_id").source == SOURCE_LIBRARY
+    assert (entity["analytical_type"], entity["data_type"], entity["role"]) == ("nominal", "string", "id")
+    assert dict(entity["constraints"]) == {"unique": True, "nullable": False}
+    assert registry.id_for_label("Primary Key") == "primary_key_id"
+    assert "Standard Version" not in registry.labels() and registry.id_for_label("User Version") == "shared_id"
+
+
+def test_registry_hot_reloads_only_changed_sources(tmp_path):
+    """Tests that unchanged sources skip the rebuild and edited files are picked up on the next lookup."""
+    # Arrange
+    registry, user = _sources(tmp_path)
+    registry.refresh_interval = 0  # every lookup re-validates the sources
+    registry.refresh()
+
+    # Act
+    unchanged = registry.refresh()
+    user.write_text(json.dumps({"user_templates": {"likert": {"label": "Likert Item"}}}))
+    os.utime(user, ns=(0, os.stat(user).st_mtime_ns + 1_000_000))
+
+    # Assert
+    assert unchanged is False
+    assert registry.id_for_label("Likert Item") == "likert"
+    assert registry.get("shared_id").source == SOURCE_LIBRARY
+
+
+def test_lookups_share_one_source_check_per_interval(tmp_path):
+    """Tests that a burst of lookups (one rerun) scans the library once, and refresh() always rescans."""
+    # Arrange
+    registry, _ = _sources(tmp_path)
+    scans = []
+    entries = registry.library.entries
+    registry.library.entries = lambda: scans.append(1) or entries()
+
+    # Act
+    for _ in range(3):
+        registry.labels()
+        registry.get("entity_id")
+        registry.payload("entity_id")
+        registry.id_for_label("Primary Key")
+    burst = len(scans)
+    registry.refresh()
+
+    # Assert
+    assert burst == 1
+    assert len(scans) == 2
+    assert registry.payload("entity_id")["role"] == "id"
+
+
+def test_normalize_template_keeps_canonical_values():
+    """Tests that canonical keys win over legacy aliases and the input is not modified."""
+    # Arrange
+    payload = {"data_type": "float64", "constraints": {"nullable": True, "is_nullable": False}}
+
+    # Act
+    normalized = normalize_template(payload)
+
+    # Assert
+    assert normalized["constraints"] == {"nullable": True}
+    assert payload["constraints"] == {"nullable": True, "is_nullable": False}
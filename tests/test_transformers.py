@@ -3,7 +3,14 @@
 
 import pandas as pd
 
-from logic.transformers import generate_batch_dataframe, hydrate_row_from_flat
+from logic.transformers import (
+    ColumnSchema,
+    column_schema,
+    generate_batch_dataframe,
+    hydrate_frame,
+    hydrate_row_from_flat,
+    resize_batch_dataframe,
+)
 
 
 def test_hydrate_row_from_flat_basic():
@@ -79,4 +86,130 @@ def test_generate_batch_dataframe():
     assert len(df) == 5
     assert "Row #" in df.columns
     assert "constraints_nullable" in df.columns
-    assert df.iloc[0]["constraints_nullable"] is False
+    assert df["constraints_nullable"].dtype == "boolean"
+    assert df["constraints_nullable"].tolist()[0] is False
+
+
+def test_hydrate_frame_matches_row_hydration():
+    """
+    Tests that the vectorized grid converter yields exactly what per-row hydration does,
+    skipping unnamed rows and dropping empty cells.
+    """
+    # Arrange
+    import numpy as np
+
+    grid = pd.DataFrame(
+        {
+            "Row #": [1, 2, 3, 4],
+            "name": ["age", None, "  ", "income"],
+            "alias": ["Age", "", "", np.nan],
+            "data_type": ["int64", "float64", "float64", "float64"],
+            "constraints_min_value": [0.0, 1.0, 2.0, np.nan],
+            "constraints_nullable": [False, True, True, True],
+            "governance_data_steward": [None, "x", "y", "finance"],
+        }
+    )
+
+    # Act
+    variables = hydrate_frame(grid)
+
+    # Assert
+    expected = [hydrate_row_from_flat(row.to_dict()) for _, row in grid.iloc[[0, 3]].iterrows()]
+    assert [v["name"] for v in variables] == ["age", "income"]
+    assert variables[0] == expected[0]
+    assert variables[1]["constraints"] == expected[1]["constraints"] == {"nullable": True}
+    assert variables[1]["governance"] == {"data_steward": "finance"}
+    assert type(variables[0]["constraints"]["min_value"]) is float
+
+
+def test_column_schema_routes_by_prefix_slice():
+    """
+    Tests that the compiled schema slices the section prefix (a recurring prefix inside the field
+    survives) and routes legacy 'database_' columns to database_mapping unless the canonical one exists.
+    """
+    # Arrange
+    schema = ColumnSchema(
+        ["name", "cleaning_cleaning_notes", "database_table_name", "database_mapping_column_name", "Row #"]
+    )
+    row = {
+        "name": "x",
+        "cleaning_cleaning_notes": "trim",
+        "database_table_name": "facts",
+        "database_mapping_column_name": "x_col",
+        "Row #": 1,
+    }
+
+    # Act
+    nested = hydrate_row_from_flat(row, schema)
+    shadowed = ColumnSchema(["database_table_name", "database_mapping_table_name"])
+
+    # Assert
+    assert nested["cleaning"] == {"cleaning_notes": "trim"}
+    assert nested["database_mapping"] == {"table_name": "facts", "column_name": "x_col"}
+    assert "Row #" not in nested
+    assert shadowed.sections["database_mapping"] == (("database_mapping_table_name", "table_name"),)
+
+
+def test_batch_dataframe_round_trip():
+    """
+    Tests that a template flattened by generate_batch_dataframe hydrates back to the same nested
+    sections, both row by row and through hydrate_frame.
+    """
+    # Arrange
+    template = {
+        "analytical_type": "nominal",
+        "data_type": "category",
+        "role": "feature",
+        "constraints": {"nullable": False, "allowed_values": ["a", "b"]},
+        "cleaning": {"cleaning_strategy": "mode", "case_normalization": "lower"},
+        "governance": {"sensitivity_level": "internal"},
+        "database_mapping": {"database_mapping_alias": "seg", "sql_type": "TEXT"},
+        "visualization": {"preferred_plot": "bar"},
+    }
+    df = generate_batch_dataframe(template, 3)
+    df["name"] = ["seg_a", "seg_b", "seg_c"]
+
+    # Act
+    schema = column_schema(tuple(df.columns))
+    by_row = [hydrate_row_from_flat(row, schema) for row in df.to_dict("records")]
+    by_frame = hydrate_frame(df)
+
+    # Assert
+    for i, variable in enumerate(by_frame):
+        assert variable == by_row[i]
+        assert variable["name"] == f"seg_{'abc'[i]}"
+        assert {key: variable[key] for key in template} == template
+
+
+def test_batch_dataframe_typed_columns_and_resize():
+    """
+    Tests that template values are broadcast into typed columns (enums as categoricals offering every
+    option, nullable booleans and integers) and that resizing appends template rows without retyping.
+    """
+    # Arrange
+    template = {
+        "analytical_type": "ordinal",
+        "data_type": "int64",
+        "role": "feature",
+        "constraints": {"unique": True, "min_value": 1, "max_value": 5.5},
+        "cleaning": {"outlier_strategy": "legacy_clip"},
+    }
+    categories = {"analytical_type": ["nominal", "ordinal"], "cleaning_outlier_strategy": ["keep", "clip"]}
+
+    # Act
+    df = generate_batch_dataframe(template, 3, categories)
+    df.loc[0, "name"] = "kept"
+    grown = resize_batch_dataframe(df, template, 5, categories)
+    shrunk = resize_batch_dataframe(grown, template, 2, categories)
+
+    # Assert
+    assert list(df["analytical_type"].cat.categories) == ["nominal", "ordinal"]
+    # A template value outside the schema options stays selectable rather than becoming NaN
+    assert list(df["cleaning_outlier_strategy"].cat.categories) == ["keep", "clip", "legacy_clip"]
+    assert df["cleaning_outlier_strategy"].tolist() == ["legacy_clip"] * 3
+    assert str(df["constraints_min_value"].dtype) == "Int64"
+    assert df["constraints_max_value"].dtype == "float64"
+    assert (grown.dtypes == df.dtypes).all()
+    assert grown["Row #"].tolist() == [1, 2, 3, 4, 5]
+    assert grown["name"].tolist() == ["kept", "", "", "", ""]
+    assert len(shrunk) == 2
@@ -0,0 +1,96 @@
+# Description: Unit tests for the dataset validation engine.
+# Verifies that compiled constraint checks count violations and stay consistent across chunks.
+
+import pandas as pd
+
+from logic.validation import report_to_dataframe, validate_dataframe, validate_file
+
+VARIABLES = [
+    {
+        "name": "customer_id",
+        "analytical_type": "discrete",
+        "data_type": "int64",
+        "constraints": {"unique": True, "nullable": False, "min_value": 1},
+    },
+    {
+        "name": "status",
+        "analytical_type": "nominal",
+        "data_type": "category",
+        "constraints": {"allowed_values": ["active", "churned"]},
+    },
+    {
+        "name": "email",
+        "analytical_type": "text",
+        "data_type": "string",
+        "constraints": {"regex_pattern": "Email Address", "max_value": 20},
+    },
+    {
+        "name": "event_date",
+        "analytical_type": "time_index",
+        "data_type": "datetime64",
+        "constraints": {"monotonicity": "strictly_increasing", "frequency": "D"},
+    },
+]
+
+
+def _sample_frame():
+    return pd.DataFrame(
+        {
+            "customer_id": [1, 2, 2, 0, None, 6],
+            "status": ["active", "churned", "lost", "active", None, "active"],
+            "email": ["a@b.com", "bad", "c@d.es", "very.long.address@example.com", None, "e@f.io"],
+            "event_date": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-05", "2024-01-04", "2024-01-05"],
+        }
+    )
+
+
+def test_validate_dataframe_counts_violations():
+    """Tests that each compiled constraint reports the exact number of offending rows."""
+    # Act
+    report = validate_dataframe(_sample_frame(), VARIABLES)
+
+    # Assert
+    assert report["rows"] == 6
+    assert report["columns"]["customer_id"]["violations"] == {
+        "data_type": 0,
+        "nullable": 1,
+        "min_value": 1,
+        "unique": 1,
+    }
+    assert report["columns"]["status"]["violations"] == {"allowed_values": 1}
+    assert report["columns"]["email"]["violations"] == {"max_value": 1, "regex_pattern": 1}
+    assert report["columns"]["event_date"]["violations"]["monotonicity"] == 1
+    assert report["columns"]["event_date"]["violations"]["frequency"] == 2
+
+
+def test_validate_file_chunks_match_in_memory_result(tmp_path):
+    """
+    Tests that streaming a CSV in tiny chunks yields the same report as validating
+    the whole frame at once (stateful checks must carry across chunk boundaries).
+    """
+    # Arrange
+    path = tmp_path / "dataset.csv"
+    _sample_frame().to_csv(path, index=False)
+    progress = []
+
+    # Act
+    streamed = validate_file(path, VARIABLES, chunk_size=2, progress_callback=progress.append)
+    in_memory = validate_dataframe(pd.read_csv(path), VARIABLES)
+
+    # Assert
+    assert streamed == in_memory
+    assert progress == [2, 4, 6]
+
+
+def test_missing_columns_are_reported():
+    """Tests that dictionary variables absent from the dataset are flagged rather than skipped."""
+    # Arrange
+    df = pd.DataFrame({"customer_id": [1, 2]})
+
+    # Act
+    report = validate_dataframe(df, VARIABLES)
+    table = report_to_dataframe(report)
+
+    # Assert
+    assert report["columns"]["status"]["present"] is False
+    assert set(table[table["check"] == "present"]["column"]) == {"status", "email", "event_date"}